@@ -43,7 +43,7 @@ from dbt.contracts.graph.parsed import ParsedSeedNode
 from dbt.exceptions import warn_or_error
 from dbt.events.functions import fire_event
 from dbt.events.types import CacheMiss, ListRelations
-from dbt.utils import filter_null_values, executor
+from dbt.utils import filter_null_values, executor, lowercase
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -64,7 +64,7 @@ GET_CATALOG_MACRO_NAME = "get_catalog"
 FRESHNESS_MACRO_NAME = "collect_freshness"
 
 
-def _expect_row_value(key: str, row: agate.Row):
+def _expect_row_value(key: str, row: Mapping[str, Any]):
     if key not in row.keys():
         raise InternalException(
             'Got a row without "{}" column, columns: {}'.format(key, row.keys())
@@ -72,13 +72,13 @@ def _expect_row_value(key: str, row: agate.Row):
     return row[key]
 
 
-def _catalog_filter_schemas(manifest: Manifest) -> Callable[[agate.Row], bool]:
+def _catalog_filter_schemas(manifest: Manifest) -> Callable[[Mapping[str, Any]], bool]:
     """Return a function that takes a row and decides if the row should be
     included in the catalog output.
     """
     schemas = frozenset((d.lower(), s.lower()) for d, s in manifest.get_used_schemas())
 
-    def test(row: agate.Row) -> bool:
+    def test(row: Mapping[str, Any]) -> bool:
         table_database = _expect_row_value("table_database", row)
         table_schema = _expect_row_value("table_schema", row)
         # the schema may be present but None, which is not an error and should
@@ -762,6 +762,24 @@ class BaseAdapter(metaclass=AdapterMeta):
         else:
             return column
 
+    @available
+    def load_seed_bulk(
+        self, relation: BaseRelation, agate_table: agate.Table, column_names_csv: str
+    ) -> Optional[str]:
+        """Load the rows of a seed into relation with the database's bulk
+        loading mechanism, instead of batched `insert` statements. Adapters
+        that support it should override this method.
+
+        :param relation: The seed's relation, which already exists and is
+            empty.
+        :param agate_table: The seed's rows.
+        :param column_names_csv: The quoted, comma-separated column names of
+            the relation, in the order of the agate table's columns.
+        :return: The SQL used to load the seed, or None if this adapter has no
+            bulk loader and the rows should be inserted in batches instead.
+        """
+        return None
+
     ###
     # Conversions: These must be implemented by concrete implementations, for
     # converting agate types into their sql equivalents.
@@ -938,15 +956,46 @@ class BaseAdapter(metaclass=AdapterMeta):
         )
         return table.where(_catalog_filter_schemas(manifest))
 
-    def _get_one_catalog(
+    @classmethod
+    def _catalog_filter_rows(
+        cls, table: agate.Table, manifest: Manifest
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the rows of the table that belong in the catalog as dicts,
+        filtered and coerced like _catalog_filter_table, but without building
+        a new agate.Table.
+        """
+        filter_table = cls._catalog_filter_table.__func__  # type: ignore
+        if filter_table is not BaseAdapter._catalog_filter_table.__func__:  # type: ignore
+            # respect adapters with their own filtering rules
+            table = cls._catalog_filter_table(table, manifest)
+            for row in table:
+                yield dict(zip(table.column_names, row))
+            return
+
+        keep = _catalog_filter_schemas(manifest)
+        column_names = table.column_names
+        text_columns = [
+            name
+            for name in ("table_database", "table_schema", "table_name")
+            if name in column_names
+        ]
+        for row in table:
+            data = dict(zip(column_names, row))
+            # force database + schema + name to be strings
+            for name in text_columns:
+                if data[name] is not None:
+                    data[name] = str(data[name])
+            if keep(data):
+                yield data
+
+    def _execute_catalog_macro(
         self,
         information_schema: InformationSchema,
         schemas: Set[str],
         manifest: Manifest,
     ) -> agate.Table:
-
         kwargs = {"information_schema": information_schema, "schemas": schemas}
-        table = self.execute_macro(
+        return self.execute_macro(
             GET_CATALOG_MACRO_NAME,
             kwargs=kwargs,
             # pass in the full manifest so we get any local project
@@ -954,17 +1003,61 @@ class BaseAdapter(metaclass=AdapterMeta):
             manifest=manifest,
         )
 
+    def _get_one_catalog(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+    ) -> agate.Table:
+        table = self._execute_catalog_macro(information_schema, schemas, manifest)
         results = self._catalog_filter_table(table, manifest)
         return results
 
-    def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
+    def _get_one_catalog_rows(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+    ) -> List[Dict[str, Any]]:
+        table = self._execute_catalog_macro(information_schema, schemas, manifest)
+        return list(self._catalog_filter_rows(table, manifest))
+
+    def _get_catalog_chunks(
+        self,
+        manifest: Manifest,
+        schemas_filter: Optional[Set[Tuple[Optional[str], str]]] = None,
+    ) -> Iterator[Tuple[InformationSchema, Set[str]]]:
+        """Split the schemas of each information_schema into chunks of at most
+        `--catalog-chunk-size` schemas, so large catalogs are queried in
+        parallel. Without a chunk size, each information_schema is queried
+        once for all of its schemas.
+
+        If schemas_filter is given, only the (database, schema) pairs in it
+        are queried. Both names must be lowercased.
+        """
+        chunk_size = getattr(self.config.args, "catalog_chunk_size", None)
+        if chunk_size is not None and chunk_size < 1:
+            raise RuntimeException(
+                f"The catalog chunk size must be a positive integer, got {chunk_size}"
+            )
         schema_map = self._get_catalog_schemas(manifest)
+        for info, schemas in schema_map.items():
+            if schemas_filter is not None:
+                database = lowercase(info.database)
+                schemas = {s for s in schemas if (database, s) in schemas_filter}
+            if len(schemas) == 0:
+                continue
+            if not chunk_size or len(schemas) <= chunk_size:
+                yield info, schemas
+                continue
+            ordered = sorted(schemas, key=str)
+            for idx in range(0, len(ordered), chunk_size):
+                yield info, set(ordered[idx : idx + chunk_size])
 
+    def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
         with executor(self.config) as tpe:
             futures: List[Future[agate.Table]] = []
-            for info, schemas in schema_map.items():
-                if len(schemas) == 0:
-                    continue
+            for info, schemas in self._get_catalog_chunks(manifest):
                 name = ".".join([str(info.database), "information_schema"])
 
                 fut = tpe.submit_connected(
@@ -976,6 +1069,65 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return catalogs, exceptions
 
+    def get_catalog_rows(
+        self,
+        manifest: Manifest,
+        schemas_filter: Optional[Set[Tuple[Optional[str], str]]] = None,
+    ) -> Tuple[Iterator[Dict[str, Any]], List[Exception]]:
+        """Like get_catalog, but return an iterator over the catalog rows as
+        dicts, yielded as each catalog query completes, instead of merging
+        every result into a single agate.Table.
+
+        If schemas_filter is given, only rows for those lowercased
+        (database, schema) pairs are returned, and where possible only those
+        schemas are queried.
+
+        The queries run as the iterator is consumed, and the returned list of
+        exceptions is only complete once it has been exhausted.
+        """
+        exceptions: List[Exception] = []
+        if type(self).get_catalog is not BaseAdapter.get_catalog:
+            # adapters that build their catalog their own way keep doing so
+            rows = self._iter_catalog_table_rows(manifest, schemas_filter, exceptions)
+        else:
+            rows = self._iter_catalog_rows(manifest, schemas_filter, exceptions)
+        return rows, exceptions
+
+    def _iter_catalog_table_rows(
+        self,
+        manifest: Manifest,
+        schemas_filter: Optional[Set[Tuple[Optional[str], str]]],
+        exceptions: List[Exception],
+    ) -> Iterator[Dict[str, Any]]:
+        table, table_exceptions = self.get_catalog(manifest)
+        exceptions.extend(table_exceptions)
+        for row in table:
+            data = dict(zip(table.column_names, row))
+            if schemas_filter is not None:
+                key = (lowercase(data.get("table_database")), str(data["table_schema"]).lower())
+                if key not in schemas_filter:
+                    continue
+            yield data
+
+    def _iter_catalog_rows(
+        self,
+        manifest: Manifest,
+        schemas_filter: Optional[Set[Tuple[Optional[str], str]]],
+        exceptions: List[Exception],
+    ) -> Iterator[Dict[str, Any]]:
+        with executor(self.config) as tpe:
+            futures: List[Future[List[Dict[str, Any]]]] = []
+            for info, schemas in self._get_catalog_chunks(manifest, schemas_filter):
+                name = ".".join([str(info.database), "information_schema"])
+
+                fut = tpe.submit_connected(
+                    self, name, self._get_one_catalog_rows, info, schemas, manifest
+                )
+                futures.append(fut)
+
+            for rows in iter_as_completed(futures, exceptions):
+                yield from rows
+
     def cancel_open_connections(self):
         """Cancel all open connections."""
         return self.connections.cancel_open()
@@ -1141,24 +1293,29 @@ join diff_count using (id)
 """.strip()
 
 
-def catch_as_completed(
-    futures,  # typing: List[Future[agate.Table]]
-) -> Tuple[agate.Table, List[Exception]]:
-
-    # catalogs: agate.Table = agate.Table(rows=[])
-    tables: List[agate.Table] = []
-    exceptions: List[Exception] = []
-
+def iter_as_completed(futures: List[Future], exceptions: List[Exception]) -> Iterator[Any]:
+    """Yield the result of each future as it completes. Errors are warned
+    about and collected into the exceptions list, except for ctrl+c and other
+    BaseExceptions, which are re-raised.
+    """
     for future in as_completed(futures):
         exc = future.exception()
         # we want to re-raise on ctrl+c and BaseException
         if exc is None:
-            catalog = future.result()
-            tables.append(catalog)
+            yield future.result()
         elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
             raise exc
         else:
             warn_or_error(f"Encountered an error while generating catalog: {str(exc)}")
             # exc is not None, derives from Exception, and isn't ctrl+c
             exceptions.append(exc)
+
+
+def catch_as_completed(
+    futures,  # typing: List[Future[agate.Table]]
+) -> Tuple[agate.Table, List[Exception]]:
+
+    # catalogs: agate.Table = agate.Table(rows=[])
+    exceptions: List[Exception] = []
+    tables: List[agate.Table] = list(iter_as_completed(futures, exceptions))
     return merge_tables(tables), exceptions
@@ -7,6 +7,7 @@ import agate
 import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.sql.results import DEFAULT_FETCH_BATCH_SIZE, ResultStream, dedupe_column_names
 from dbt.contracts.connection import Connection, ConnectionState, AdapterResponse
 from dbt.events.functions import fire_event
 from dbt.events.types import ConnectionUsed, SQLQuery, SQLCommit, SQLQueryStatus
@@ -20,8 +21,13 @@ class SQLConnectionManager(BaseConnectionManager):
         - cancel
         - get_response
         - open
+
+    Methods that may be overridden:
+        - open_cursor, to support server-side cursors for execute_iter
     """
 
+    FETCH_BATCH_SIZE: int = DEFAULT_FETCH_BATCH_SIZE
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -51,6 +57,16 @@ class SQLConnectionManager(BaseConnectionManager):
         auto_begin: bool = True,
         bindings: Optional[Any] = None,
         abridge_sql_log: bool = False,
+    ) -> Tuple[Connection, Any]:
+        return self._execute_on_cursor(sql, auto_begin, bindings, abridge_sql_log)
+
+    def _execute_on_cursor(
+        self,
+        sql: str,
+        auto_begin: bool = True,
+        bindings: Optional[Any] = None,
+        abridge_sql_log: bool = False,
+        server_side: bool = False,
     ) -> Tuple[Connection, Any]:
         connection = self.get_thread_connection()
         if auto_begin and connection.transaction_open is False:
@@ -66,7 +82,7 @@ class SQLConnectionManager(BaseConnectionManager):
             fire_event(SQLQuery(conn_name=connection.name, sql=log_sql))
             pre = time.time()
 
-            cursor = connection.handle.cursor()
+            cursor = self.open_cursor(connection, server_side=server_side)
             cursor.execute(sql, bindings)
 
             fire_event(
@@ -77,6 +93,14 @@ class SQLConnectionManager(BaseConnectionManager):
 
             return connection, cursor
 
+    def open_cursor(self, connection: Connection, server_side: bool = False) -> Any:
+        """Open a new cursor on the connection's handle. If server_side is
+        set, adapters that support it should return a cursor that keeps the
+        result set on the server and fetches it in batches. The default
+        implementation ignores it and returns a regular cursor.
+        """
+        return connection.handle.cursor()
+
     @abc.abstractclassmethod
     def get_response(cls, cursor: Any) -> AdapterResponse:
         """Get the status of the cursor."""
@@ -88,20 +112,8 @@ class SQLConnectionManager(BaseConnectionManager):
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> List[Dict[str, Any]]:
-        # TODO CT-211
-        unique_col_names = dict()  # type: ignore[var-annotated]
-        # TODO CT-211
-        for idx in range(len(column_names)):  # type: ignore[arg-type]
-            # TODO CT-211
-            col_name = column_names[idx]  # type: ignore[index]
-            if col_name in unique_col_names:
-                unique_col_names[col_name] += 1
-                # TODO CT-211
-                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"  # type: ignore[index] # noqa
-            else:
-                # TODO CT-211
-                unique_col_names[column_names[idx]] = 1  # type: ignore[index]
-        return [dict(zip(column_names, row)) for row in rows]
+        unique_col_names = dedupe_column_names(list(column_names))
+        return [dict(zip(unique_col_names, row)) for row in rows]
 
     @classmethod
     def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
@@ -109,9 +121,10 @@ class SQLConnectionManager(BaseConnectionManager):
         column_names: List[str] = []
 
         if cursor.description is not None:
-            column_names = [col[0] for col in cursor.description]
+            raw_column_names = [col[0] for col in cursor.description]
             rows = cursor.fetchall()
-            data = cls.process_results(column_names, rows)
+            data = cls.process_results(raw_column_names, rows)
+            column_names = dedupe_column_names(raw_column_names)
 
         return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
 
@@ -127,6 +140,29 @@ class SQLConnectionManager(BaseConnectionManager):
             table = dbt.clients.agate_helper.empty_table()
         return response, table
 
+    def execute_iter(
+        self, sql: str, auto_begin: bool = False, batch_size: Optional[int] = None
+    ) -> ResultStream:
+        """Execute the given SQL and return a stream over its result rows,
+        instead of materializing them all into an agate.Table.
+
+        The query runs on a server-side cursor where the adapter supports
+        one, so only a single statement that returns rows may be given. The
+        stream must be consumed (or closed) before the transaction ends. Its
+        `response` is set once it has been consumed.
+        """
+        sql = self._add_query_comment(sql)
+        # not through add_query, which adapters override without server_side
+        _, cursor = self._execute_on_cursor(sql, auto_begin, server_side=True)
+        if batch_size is None:
+            batch_size = self.FETCH_BATCH_SIZE
+        return ResultStream(
+            cursor,
+            batch_size,
+            get_response=self.get_response,
+            exception_handler=lambda: self.exception_handler(sql),
+        )
+
     def add_begin_query(self):
         return self.add_query("BEGIN", auto_begin=False)
 
@@ -7,6 +7,7 @@ import dbt.exceptions
 from dbt.adapters.base import BaseAdapter, available
 from dbt.adapters.cache import _make_key
 from dbt.adapters.sql import SQLConnectionManager
+from dbt.adapters.sql.results import ResultStream
 from dbt.events.functions import fire_event
 from dbt.events.types import ColTypeChange, SchemaCreation, SchemaDrop
 
@@ -65,6 +66,21 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    @available.parse_none
+    def execute_iter(
+        self, sql: str, auto_begin: bool = False, batch_size: Optional[int] = None
+    ) -> ResultStream:
+        """Execute the given SQL and stream its result rows in batches,
+        without building an agate.Table. A thin wrapper around
+        ConnectionManager.execute_iter.
+
+        :param sql: The SQL query to execute. It must return rows.
+        :param auto_begin: If set and there is no transaction in progress,
+            begin a new one.
+        :param batch_size: The number of rows to fetch per round trip.
+        """
+        return self.connections.execute_iter(sql, auto_begin, batch_size)
+
     @classmethod
     def convert_text_type(cls, agate_table: agate.Table, col_idx: int) -> str:
         return "text"
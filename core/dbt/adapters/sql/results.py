@@ -0,0 +1,158 @@
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import agate
+
+import dbt.clients.agate_helper
+from dbt.contracts.connection import AdapterResponse
+
+
+DEFAULT_FETCH_BATCH_SIZE = 10000
+
+
+def dedupe_column_names(column_names: Sequence[str]) -> List[str]:
+    """Give duplicated column names a numeric suffix, so "a", "a" becomes
+    "a", "a_2".
+    """
+    unique_col_names: Dict[str, int] = {}
+    result: List[str] = []
+    for col_name in column_names:
+        if col_name in unique_col_names:
+            unique_col_names[col_name] += 1
+            result.append(f"{col_name}_{unique_col_names[col_name]}")
+        else:
+            unique_col_names[col_name] = 1
+            result.append(col_name)
+    return result
+
+
+class ColumnarResult:
+    """A lightweight, read-only query result.
+
+    Unlike agate.Table, building a ColumnarResult does no per-cell type
+    testing: values are kept exactly as the database driver returned them.
+    Columns are transposed lazily, the first time they are asked for.
+    """
+
+    def __init__(self, column_names: Sequence[str], rows: List[Tuple[Any, ...]]):
+        self.column_names: Tuple[str, ...] = tuple(column_names)
+        self.rows: List[Tuple[Any, ...]] = rows
+        self._columns: Optional[Dict[str, Tuple[Any, ...]]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return iter(self.rows)
+
+    @property
+    def columns(self) -> Dict[str, Tuple[Any, ...]]:
+        if self._columns is None:
+            if self.rows:
+                values = list(zip(*self.rows))
+            else:
+                values = [() for _ in self.column_names]
+            self._columns = dict(zip(self.column_names, values))
+        return self._columns
+
+    def column(self, name: str) -> Tuple[Any, ...]:
+        return self.columns[name]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [dict(zip(self.column_names, row)) for row in self.rows]
+
+    def to_agate(self) -> agate.Table:
+        """Convert this result into the agate.Table that
+        SQLConnectionManager.execute(fetch=True) would have returned.
+        """
+        return dbt.clients.agate_helper.table_from_data_flat(
+            self.to_dicts(), list(self.column_names)
+        )
+
+
+class ResultStream:
+    """An iterator over the rows of an executed cursor, fetched in batches of
+    `batch_size` rows with `fetchmany`, so that the full result set is never
+    held in memory at once.
+
+    Some drivers (e.g. psycopg2 server-side cursors) only populate
+    `cursor.description` after the first fetch, so `column_names` is filled
+    in once iteration has started. Each fetch runs inside
+    `exception_handler`, if one is given, so database errors are handled as
+    they are for any other query. Once the stream is exhausted, `response`
+    holds the cursor's response with the number of rows fetched, and the
+    cursor is closed (as it is on `close()`).
+    """
+
+    def __init__(
+        self,
+        cursor: Any,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        get_response: Optional[Callable[[Any], AdapterResponse]] = None,
+        exception_handler: Optional[Callable[[], ContextManager]] = None,
+    ):
+        self.cursor = cursor
+        self.batch_size = batch_size
+        self.response: Optional[AdapterResponse] = None
+        self._get_response = get_response
+        self._exception_handler = exception_handler
+        self._column_names: Optional[List[str]] = None
+        self._rows_fetched = 0
+        self._closed = False
+
+    @property
+    def column_names(self) -> List[str]:
+        if self._column_names is None:
+            description = self.cursor.description
+            if description is None:
+                return []
+            self._column_names = dedupe_column_names([col[0] for col in description])
+        return self._column_names
+
+    def _fetch_batch(self) -> List[Tuple[Any, ...]]:
+        handler = self._exception_handler() if self._exception_handler else nullcontext()
+        with handler:
+            rows = self.cursor.fetchmany(self.batch_size)
+            if not rows:
+                # make sure column names are captured before the cursor goes away
+                self.column_names
+                if self._get_response is not None:
+                    response = self._get_response(self.cursor)
+                    response.rows_affected = self._rows_fetched
+                    self.response = response
+        self._rows_fetched += len(rows)
+        return rows
+
+    def batches(self) -> Iterator[List[Tuple[Any, ...]]]:
+        if self._closed:
+            return
+        try:
+            while True:
+                rows = self._fetch_batch()
+                if not rows:
+                    break
+                yield rows
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        for batch in self.batches():
+            yield from batch
+
+    def fetch(self) -> ColumnarResult:
+        """Consume the rest of the stream into a ColumnarResult."""
+        rows: List[Tuple[Any, ...]] = []
+        for batch in self.batches():
+            rows.extend(batch)
+        return ColumnarResult(self.column_names, rows)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.cursor.close()
+
+    def __enter__(self) -> "ResultStream":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -53,10 +53,8 @@ Tag = namedtuple("Tag", "block_type_name block_name start end")
 _NAME_PATTERN = r"[A-Za-z_][A-Za-z_0-9]*"
 
 COMMENT_START_PATTERN = regex(r"(?:(?P<comment_start>(\s*\{\#)))")
-COMMENT_END_PATTERN = regex(r"(.*?)(\s*\#\})")
 RAW_START_PATTERN = regex(r"(?:\s*\{\%\-|\{\%)\s*(?P<raw_start>(raw))\s*(?:\-\%\}\s*|\%\})")
 EXPR_START_PATTERN = regex(r"(?P<expr_start>(\{\{\s*))")
-EXPR_END_PATTERN = regex(r"(?P<expr_end>(\s*\}\}))")
 
 BLOCK_START_PATTERN = regex(
     "".join(
@@ -80,13 +78,19 @@ RAW_BLOCK_PATTERN = regex(
     )
 )
 
-TAG_CLOSE_PATTERN = regex(r"(?:(?P<tag_close>(\-\%\}\s*|\%\})))")
-
 # stolen from jinja's lexer. Note that we've consumed all prefix whitespace by
 # the time we want to use this.
 STRING_PATTERN = regex(r"(?P<string>('([^'\\]*(?:\\.[^'\\]*)*)'|" r'"([^"\\]*(?:\\.[^"\\]*)*)"))')
 
-QUOTE_START_PATTERN = regex(r"""(?P<quote>(['"]))""")
+# The tokenizer scans the data once, searching for whichever token could come
+# next with a single pattern. Searching for each kind of token separately
+# would rescan the rest of the file for every kind that doesn't appear again,
+# once per tag. These patterns start with the token itself rather than with
+# the whitespace some tokens take before them, so the search can skip ahead to
+# a token's first character.
+TAG_DELIMITER_PATTERN = regex(r"\{[{%#]")
+EXPR_BODY_PATTERN = regex(r"""(?P<expr_end>(\}\}))|(?P<quote>(['"]))""")
+TAG_BODY_PATTERN = regex(r"""(?P<quote>(['"]))|(?P<tag_close>(\-\%\}\s*|\%\}))""")
 
 
 class TagIterator:
@@ -120,31 +124,49 @@ class TagIterator:
     def _match(self, pattern):
         return pattern.match(self.data, self.pos)
 
-    def _first_match(self, *patterns, **kwargs):
-        matches = []
-        for pattern in patterns:
-            # default to 'search', but sometimes we want to 'match'.
-            if kwargs.get("method", "search") == "search":
-                match = self._search(pattern)
-            else:
-                match = self._match(pattern)
-            if match:
-                matches.append(match)
-        if not matches:
-            return None
-        # if there are multiple matches, pick the least greedy match
-        # TODO: do I need to account for m.start(), or is this ok?
-        return min(matches, key=lambda m: m.end())
-
-    def _expect_match(self, expected_name, *patterns, **kwargs):
-        match = self._first_match(*patterns, **kwargs)
+    def _next_tag_start(self):
+        """Return the match for the next block start, comment start or
+        expression start, or None if there isn't one.
+        """
+        pos = self.pos
+        while True:
+            delimiter = TAG_DELIMITER_PATTERN.search(self.data, pos)
+            if delimiter is None:
+                return None
+            start = delimiter.start()
+            kind = delimiter.group()
+            if kind == "{{":
+                return EXPR_START_PATTERN.match(self.data, start)
+            if kind == "{#" or self.data.startswith("{%-", start):
+                # comment starts and `{%-` take the whitespace before them
+                while start > self.pos and self.data[start - 1].isspace():
+                    start -= 1
+            pattern = COMMENT_START_PATTERN if kind == "{#" else BLOCK_START_PATTERN
+            match = pattern.match(self.data, start)
+            if match is not None:
+                return match
+            # not a block start after all, e.g. `{% "x" %}`
+            pos = delimiter.start() + 1
+
+    def _expect_match(self, expected_name, pattern):
+        match = self._search(pattern)
         if match is None:
-            msg = 'unexpected EOF, expected {}, got "{}"'.format(
-                expected_name, self.data[self.pos :]
-            )
-            dbt.exceptions.raise_compiler_error(msg)
+            self._raise_eof(expected_name)
         return match
 
+    def _raise_eof(self, expected_name):
+        msg = 'unexpected EOF, expected {}, got "{}"'.format(expected_name, self.data[self.pos :])
+        dbt.exceptions.raise_compiler_error(msg)
+
+    def _skip_string(self, quote_match):
+        """Advance past the string that starts at the given quote. An
+        unterminated string is skipped in favor of the next complete one.
+        """
+        match = STRING_PATTERN.search(self.data, quote_match.start())
+        if match is None:
+            self._raise_eof("string")
+        self.advance(match.end())
+
     def handle_expr(self, match):
         """Handle an expression. At this point we're at a string like:
             {{ 1 + 2 }}
@@ -160,21 +182,22 @@ class TagIterator:
         """
         self.advance(match.end())
         while True:
-            match = self._expect_match("}}", EXPR_END_PATTERN, QUOTE_START_PATTERN)
-            if match.groupdict().get("expr_end") is not None:
+            match = self._expect_match("}}", EXPR_BODY_PATTERN)
+            if match.group("expr_end") is not None:
                 break
             else:
                 # it's a quote. we haven't advanced for this match yet, so
                 # just slurp up the whole string, no need to rewind.
-                match = self._expect_match("string", STRING_PATTERN)
-                self.advance(match.end())
+                self._skip_string(match)
 
         self.advance(match.end())
 
     def handle_comment(self, match):
         self.advance(match.end())
-        match = self._expect_match("#}", COMMENT_END_PATTERN)
-        self.advance(match.end())
+        end = self.data.find("#}", self.pos)
+        if end < 0:
+            self._raise_eof("#}")
+        self.advance(end + 2)
 
     def _expect_block_close(self):
         """Search for the tag close marker.
@@ -189,16 +212,13 @@ class TagIterator:
         are quote and `%}` - nothing else can hide the %} and be valid jinja.
         """
         while True:
-            end_match = self._expect_match(
-                'tag close ("%}")', QUOTE_START_PATTERN, TAG_CLOSE_PATTERN
-            )
-            self.advance(end_match.end())
-            if end_match.groupdict().get("tag_close") is not None:
+            end_match = self._expect_match('tag close ("%}")', TAG_BODY_PATTERN)
+            if end_match.group("tag_close") is not None:
+                self.advance(end_match.end())
                 return
-            # must be a string. Rewind to its start and advance past it.
-            self.rewind()
-            string_match = self._expect_match("string", STRING_PATTERN)
-            self.advance(string_match.end())
+            # must be a string. Advance past it.
+            self.advance(end_match.start())
+            self._skip_string(end_match)
 
     def handle_raw(self):
         # raw blocks are super special, they are a single complete regex
@@ -235,9 +255,7 @@ class TagIterator:
 
     def find_tags(self):
         while True:
-            match = self._first_match(
-                BLOCK_START_PATTERN, COMMENT_START_PATTERN, EXPR_START_PATTERN
-            )
+            match = self._next_tag_start()
             if match is None:
                 break
 
@@ -1,11 +1,13 @@
 from codecs import BOM_UTF8
 
 import agate
+import csv
 import datetime
+import os
 import isodate
 import json
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Union, Optional, Any, Tuple, Sequence
 
 from dbt.exceptions import RuntimeException
 
@@ -43,10 +45,12 @@ class ISODateTime(agate.data_types.DateTime):
         raise agate.exceptions.CastError('Can not parse value "%s" as datetime.' % d)
 
 
-def build_type_tester(
+def _build_column_types(
     text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
-) -> agate.TypeTester:
-
+) -> Tuple[List[agate.data_types.DataType], Dict[str, agate.data_types.DataType]]:
+    """Return the data types to test values against, in order, and the data
+    types forced for specific columns.
+    """
     types = [
         Number(null_values=("null", "")),
         agate.data_types.Date(null_values=("null", ""), date_format="%Y-%m-%d"),
@@ -57,7 +61,16 @@ def build_type_tester(
         ),
         agate.data_types.Text(null_values=string_null_values),
     ]
-    force = {k: agate.data_types.Text(null_values=string_null_values) for k in text_columns}
+    force: Dict[str, agate.data_types.DataType] = {
+        k: agate.data_types.Text(null_values=string_null_values) for k in text_columns
+    }
+    return types, force
+
+
+def build_type_tester(
+    text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
+) -> agate.TypeTester:
+    types, force = _build_column_types(text_columns, string_null_values)
     return agate.TypeTester(force=force, types=types)
 
 
@@ -132,17 +145,187 @@ def empty_table():
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
+    if isinstance(table, StreamingSeedTable):
+        # don't read the whole seed into memory
+        return table.rows
     return [r.values() for r in table.rows.values()]
 
 
+def _open_csv(abspath):
+    fp = open(abspath, encoding="utf-8")
+    if fp.read(1) != BOM:
+        fp.seek(0)
+    return fp
+
+
 def from_csv(abspath, text_columns):
     type_tester = build_type_tester(text_columns=text_columns)
-    with open(abspath, encoding="utf-8") as fp:
-        if fp.read(1) != BOM:
-            fp.seek(0)
+    with _open_csv(abspath) as fp:
         return agate.Table.from_csv(fp, column_types=type_tester)
 
 
+# Seeds at least this large are streamed from disk instead of being loaded
+# into an agate.Table all at once.
+STREAMING_SEED_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+
+def load_seed_table(abspath, text_columns) -> Union[agate.Table, "StreamingSeedTable"]:
+    if os.path.getsize(abspath) >= STREAMING_SEED_THRESHOLD_BYTES:
+        return StreamingSeedTable(abspath, text_columns)
+    return from_csv(abspath, text_columns)
+
+
+class SeedRows:
+    """The typed rows of a seed file. Every iteration reads the file again
+    and casts each value to its column's type, one row at a time.
+    """
+
+    def __init__(
+        self,
+        abspath: str,
+        column_types: Sequence[agate.data_types.DataType],
+        num_rows: int,
+    ):
+        self.abspath = abspath
+        self.column_types = column_types
+        self.num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        width = len(self.column_types)
+        with _open_csv(self.abspath) as fp:
+            reader = csv.reader(fp)
+            next(reader, None)
+            for raw in reader:
+                values: List[Optional[str]] = list(raw)
+                if len(values) < width:
+                    values.extend([None] * (width - len(values)))
+                yield tuple(t.cast(v) for t, v in zip(self.column_types, values))
+
+    def batches(self, size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        batch: List[Tuple[Any, ...]] = []
+        for row in self:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class StreamingSeedTable:
+    """A stand-in for the agate.Table of a large seed, whose rows are
+    streamed from the file instead of being held in memory.
+
+    Column types are inferred exactly like agate.TypeTester would, but in a
+    single streaming pass that only keeps, for each column, the candidate
+    types that every value so far can be cast to. That pass also keeps the
+    first `sample_size` rows, and for each column its longest value and its
+    most precise numeric value. Those make up `profile`, a small agate.Table
+    with the same column types as the seed, so adapter type conversions that
+    aggregate over the table (like MaxPrecision) see the same extremes.
+
+    Only part of agate.Table is supported: `column_names`, `column_types`,
+    `rows` (streamed from the file), and `aggregate` with the aggregations
+    `profile` has the same extremes for (MaxPrecision and MaxLength). The
+    first rows are available as `sample`. Anything else raises
+    AttributeError, rather than silently working on a sample of the seed.
+    """
+
+    def __init__(self, abspath: str, text_columns: Iterable[str], sample_size: int = 100):
+        self.original_abspath = os.path.abspath(abspath)
+        self.sample_size = sample_size
+        possible_types, force = _build_column_types(text_columns)
+
+        with _open_csv(abspath) as fp:
+            reader = csv.reader(fp)
+            header: List[str] = next(reader, [])
+            column_names = agate.utils.deduplicate(header, column_names=True)
+            width = len(column_names)
+            hypotheses = [None if name in force else list(possible_types) for name in column_names]
+            sample: List[List[Optional[str]]] = []
+            longest: List[Optional[str]] = [None] * width
+            longest_len = [-1] * width
+            most_precise: List[Optional[str]] = [None] * width
+            precision = [-1] * width
+            number = next(t for t in possible_types if isinstance(t, agate.data_types.Number))
+            num_rows = 0
+
+            for raw in reader:
+                if len(raw) > width:
+                    raise ValueError(
+                        "Row {} has {} values, but Table only has {} columns.".format(
+                            num_rows, len(raw), width
+                        )
+                    )
+                num_rows += 1
+                if len(sample) < sample_size:
+                    sample.append(list(raw))
+                for idx, value in enumerate(raw):
+                    value_len = len(value)
+                    if value_len > longest_len[idx]:
+                        longest[idx], longest_len[idx] = value, value_len
+                    h = hypotheses[idx]
+                    if h is None or len(h) == 1:
+                        continue
+                    h[:] = [t for t in h if t.test(value)]
+                    if number in h:
+                        cast = number.cast(value)
+                        if cast is not None:
+                            exponent = cast.as_tuple().exponent
+                            digits = -exponent if isinstance(exponent, int) else 0
+                            if digits > precision[idx]:
+                                most_precise[idx], precision[idx] = value, digits
+
+        column_types = []
+        for idx, (name, h) in enumerate(zip(column_names, hypotheses)):
+            if h is None:
+                column_types.append(force[name])
+            else:
+                column_types.append(next(t for t in possible_types if t in h))
+            if column_types[idx] is not number:
+                most_precise[idx] = None
+
+        profile_rows = list(sample)
+        if num_rows > 0:
+            profile_rows.append(longest)
+        if any(value is not None for value in most_precise):
+            profile_rows.append(most_precise)
+
+        self.profile = agate.Table(profile_rows, column_names, column_types)
+        self.column_names = self.profile.column_names
+        self.column_types = self.profile.column_types
+        self.rows = SeedRows(self.original_abspath, self.column_types, num_rows)
+
+    @property
+    def sample(self) -> agate.Table:
+        """The first rows of the seed."""
+        return self.profile.limit(min(self.sample_size, len(self.rows)))  # type: ignore
+
+    def aggregate(self, aggregations: Any) -> Any:
+        if not isinstance(aggregations, _PROFILED_AGGREGATIONS):
+            raise NotImplementedError(
+                f"Only MaxPrecision and MaxLength can be aggregated over a streamed seed, "
+                f"got {aggregations!r}"
+            )
+        return self.profile.aggregate(aggregations)  # type: ignore[attr-defined]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise AttributeError(
+            f"{type(self).__name__} has no attribute {name!r}: the seed is streamed from "
+            f"{self.original_abspath}, so only column_names, column_types, rows, aggregate "
+            f"and sample are available"
+        )
+
+
+# aggregations whose result over `profile` is the same as over the whole seed
+_PROFILED_AGGREGATIONS = (agate.MaxPrecision, agate.MaxLength)  # type: ignore[attr-defined]
+
+
 class _NullMarker:
     pass
 
@@ -546,6 +546,13 @@ def _requote_result(raw_value: str, rendered: str) -> str:
 _HAS_RENDER_CHARS_PAT = re.compile(r"({[{%#]|[#}%]})")
 
 
+def has_render_chars(string: str) -> bool:
+    """Return True if string has any jinja control characters, so rendering it
+    may give something other than string.
+    """
+    return _HAS_RENDER_CHARS_PAT.search(string) is not None
+
+
 def get_rendered(
     string: str,
     ctx: Dict[str, Any],
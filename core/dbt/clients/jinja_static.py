@@ -1,15 +1,26 @@
+from typing import Any, List, Optional
+
 import jinja2
 from dbt.clients.jinja import get_environment
 from dbt.exceptions import raise_compiler_error
 
 
 def statically_extract_macro_calls(string, ctx, db_wrapper=None):
+    return resolve_static_macro_calls(statically_find_macro_calls(string), ctx, db_wrapper)
+
+
+def statically_find_macro_calls(string) -> List[List[Any]]:
+    """Find the calls in a macro's SQL that might be calls to other macros,
+    without checking them against the context or resolving adapter.dispatch
+    calls. This only depends on the SQL, so it can be saved by the SQL's
+    checksum. Each call is ["call", name], or
+    ["dispatch", names, macro_name, macro_namespace] for adapter.dispatch.
+    """
     # set 'capture_macros' to capture undefined
     env = get_environment(None, capture_macros=True)
     parsed = env.parse(string)
 
-    standard_calls = ["source", "ref", "config"]
-    possible_macro_calls = []
+    calls: List[List[Any]] = []
     for func_call in parsed.find_all(jinja2.nodes.Call):
         func_name = None
         if hasattr(func_call, "node") and hasattr(func_call.node, "name"):
@@ -40,19 +51,34 @@ def statically_extract_macro_calls(string, ctx, db_wrapper=None):
                 macro_name = func_call.node.attr
                 if package_name == "adapter":
                     if macro_name == "dispatch":
-                        ad_macro_calls = statically_parse_adapter_dispatch(
-                            func_call, ctx, db_wrapper
-                        )
-                        possible_macro_calls.extend(ad_macro_calls)
-                    else:
-                        # This skips calls such as adapter.parse_index
-                        continue
+                        calls.append(["dispatch", *statically_find_adapter_dispatch(func_call)])
+                    # This skips calls such as adapter.parse_index
+                    continue
                 else:
                     func_name = f"{package_name}.{macro_name}"
             else:
                 continue
-        if not func_name:
+        if func_name:
+            calls.append(["call", func_name])
+
+    return calls
+
+
+def resolve_static_macro_calls(calls: List[List[Any]], ctx, db_wrapper=None) -> List[str]:
+    """Turn the calls statically_find_macro_calls found into the names of the
+    macros they might call.
+    """
+    standard_calls = ["source", "ref", "config"]
+    possible_macro_calls: List[str] = []
+    for call in calls:
+        if call[0] == "dispatch":
+            _, names, macro_name, macro_namespace = call
+            possible_macro_calls.extend(names)
+            possible_macro_calls.extend(
+                resolve_adapter_dispatch(macro_name, macro_namespace, db_wrapper)
+            )
             continue
+        func_name = call[1]
         if func_name in standard_calls:
             continue
         elif ctx.get(func_name):
@@ -87,7 +113,10 @@ def statically_extract_macro_calls(string, ctx, db_wrapper=None):
 #   dyn_args=None,
 #   dyn_kwargs=None
 # )
-def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
+def statically_find_adapter_dispatch(func_call):
+    """Return the macro names in an adapter.dispatch call's arguments, and the
+    macro name and namespace to dispatch with.
+    """
     possible_macro_calls = []
     # This captures an adapter.dispatch('<macro_name>') call.
 
@@ -133,26 +162,23 @@ def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
                     )
 
     # positional arguments
-    if packages_arg:
-        if packages_arg_type == "List":
-            # This will remain to enable static resolution
-            packages = []
-            for item in packages_arg.items:
-                packages.append(item.value)
-        elif packages_arg_type == "Const":
-            # This will remain to enable static resolution
-            macro_namespace = packages_arg.value
+    if packages_arg and packages_arg_type == "Const":
+        # This will remain to enable static resolution
+        macro_namespace = packages_arg.value
+
+    return possible_macro_calls, func_name, macro_namespace
 
+
+def resolve_adapter_dispatch(
+    func_name: Optional[str], macro_namespace: Optional[str], db_wrapper
+) -> List[str]:
+    possible_macro_calls = []
     if db_wrapper:
         macro = db_wrapper.dispatch(func_name, macro_namespace=macro_namespace).macro
         func_name = f"{macro.package_name}.{macro.name}"
         possible_macro_calls.append(func_name)
     else:  # this is only for test/unit/test_macro_calls.py
         if macro_namespace:
-            packages = [macro_namespace]
-        else:
-            packages = []
-        for package_name in packages:
-            possible_macro_calls.append(f"{package_name}.{func_name}")
+            possible_macro_calls.append(f"{macro_namespace}.{func_name}")
 
     return possible_macro_calls
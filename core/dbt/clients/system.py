@@ -9,9 +9,10 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import tempfile
 import requests
 import stat
-from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union
+from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union, Iterable
 
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -170,6 +171,39 @@ def write_file(path: str, contents: str = "") -> bool:
     return True
 
 
+def write_file_atomic(path: str, chunks: Iterable[str]) -> bool:
+    """Write the chunks of text to a temporary file next to path, then rename
+    it to path. Readers never see a partially written file, and an existing
+    file at path is left alone if writing fails.
+    """
+    path = convert_path(path)
+    tmp_path = None
+    try:
+        make_directory(os.path.dirname(path))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or None, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except Exception as exc:
+        if os.name == "nt":
+            # see write_file
+            if getattr(exc, "winerror", 0) == 3:
+                reason = "Path was too long"
+            else:
+                reason = "Path was possibly too long"
+            fire_event(SystemCouldNotWrite(path=path, reason=reason, exc=exc))
+        else:
+            raise
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
 def read_json(path: str) -> Dict[str, Any]:
     return json.loads(load_file_contents(path))
 
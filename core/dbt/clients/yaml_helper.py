@@ -1,13 +1,17 @@
 import dbt.exceptions
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import yaml
 
 # the C version is faster, but it doesn't always exist
 try:
     from yaml import CLoader as Loader, CSafeLoader as SafeLoader, CDumper as Dumper
+
+    YAML_LOADER = "libyaml"
 except ImportError:
     from yaml import Loader, SafeLoader, Dumper  # type: ignore  # noqa: F401
 
+    YAML_LOADER = "pure-Python"
+
 
 YAML_ERROR_MESSAGE = """
 Syntax error near line {line_number}
@@ -51,6 +55,16 @@ def safe_load(contents) -> Optional[Dict[str, Any]]:
     return yaml.load(contents, Loader=SafeLoader)
 
 
+def try_safe_load(contents) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Load yaml in a worker process. Errors only make this return False: the
+    caller loads the contents again to raise them with their context.
+    """
+    try:
+        return True, safe_load(contents)
+    except yaml.YAMLError:
+        return False, None
+
+
 def load_yaml_text(contents):
     try:
         return safe_load(contents)
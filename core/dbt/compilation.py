@@ -1,15 +1,20 @@
+import copy
+import dataclasses
+import functools
+import hashlib
+import json
 import os
+import re
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, cast, Optional
+from typing import List, Dict, Any, Set, Tuple, cast, Optional
 
 import networkx as nx  # type: ignore
 import pickle
-import sqlparse
 
 from dbt import flags
 from dbt.adapters.factory import get_adapter
 from dbt.clients import jinja
-from dbt.clients.system import make_directory
+from dbt.clients.system import make_directory, rmdir, write_file_atomic
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.manifest import Manifest, UniqueID
 from dbt.contracts.graph.compiled import (
@@ -20,7 +25,7 @@ from dbt.contracts.graph.compiled import (
     ManifestNode,
     NonSourceCompiledNode,
 )
-from dbt.contracts.graph.parsed import ParsedNode
+from dbt.contracts.graph.parsed import ParsedMacro, ParsedNode
 from dbt.exceptions import (
     dependency_not_found,
     InternalException,
@@ -28,10 +33,17 @@ from dbt.exceptions import (
 )
 from dbt.graph import Graph
 from dbt.events.functions import fire_event
-from dbt.events.types import FoundStats, CompilingNode, WritingInjectedSQLForNode
+from dbt.events.types import (
+    FoundStats,
+    CompilingNode,
+    ReusingCompiledSQL,
+    WritingInjectedSQLForNode,
+)
 from dbt.node_types import NodeType
 from dbt.events.format import pluralize
 import dbt.tracking
+import dbt.utils
+from dbt.version import __version__
 
 graph_file_name = "graph.gpickle"
 
@@ -44,6 +56,323 @@ def _compiled_type_for(model: ParsedNode):
     return COMPILED_TYPES[type(model)]
 
 
+_WORD = re.compile(r"\w+")
+_LINE_END = re.compile(r"\r\n|\r|\n")
+
+
+def _skip_whitespace_and_comments(sql: str, pos: int) -> int:
+    """Return the position of the first character at or after pos that isn't
+    whitespace or part of a comment.
+    """
+    length = len(sql)
+    while pos < length:
+        if sql[pos].isspace():
+            pos += 1
+        elif sql.startswith("--", pos):
+            match = _LINE_END.search(sql, pos)
+            pos = length if match is None else match.end()
+        elif sql.startswith("/*", pos):
+            end = sql.find("*/", pos + 2)
+            if end < 0:
+                # an unterminated comment: there's nothing after it
+                return length
+            pos = end + 2
+        else:
+            break
+    return pos
+
+
+def _match_keyword(sql: str, pos: int, keyword: str) -> Optional[int]:
+    """If the word at pos is keyword (in any case), return the position just
+    after it.
+    """
+    match = _WORD.match(sql, pos)
+    if match is not None and match.group().lower() == keyword:
+        return match.end()
+    return None
+
+
+def _skip_whitespace(sql: str, pos: int) -> int:
+    while pos < len(sql) and sql[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _cte_insertion_point(sql: str) -> Tuple[int, bool]:
+    """Find where CTEs should be injected into sql. If sql starts with a
+    `with` (or `with recursive`) keyword, after comments and whitespace,
+    that's after the keyword and the whitespace following it. Otherwise it's
+    the start of sql, after any leading whitespace. Return the position and
+    whether sql starts with `with`.
+    """
+    start = _skip_whitespace_and_comments(sql, 0)
+    with_end = _match_keyword(sql, start, "with")
+    if with_end is None:
+        return _skip_whitespace(sql, 0), False
+    recursive_end = _match_keyword(sql, _skip_whitespace_and_comments(sql, with_end), "recursive")
+    if recursive_end is not None:
+        return _skip_whitespace(sql, recursive_end), True
+    return _skip_whitespace(sql, with_end), True
+
+
+COMPILED_SQL_CACHE_DIR = "compiled_sql_cache"
+
+_CACHEABLE_TYPES = (NodeType.Model, NodeType.Test, NodeType.Snapshot, NodeType.Analysis)
+
+# Names that make compiled SQL depend on more than the inputs hashed by
+# CompiledSQLCache.key: on the state of the database, the time, the
+# environment or the rest of the graph. Nodes whose SQL, or the SQL of a
+# macro they call, mentions one of them are always compiled. adapter.dispatch
+# only depends on the target type and the dispatch config, which are hashed.
+_INTROSPECTIVE = re.compile(
+    r"\b(?:run_query|statement|load_result|is_incremental|adapter\s*\.\s*(?!dispatch\b)\w+"
+    r"|run_started_at|invocation_id|env_var|graph|modules)\b"
+)
+
+# node fields that don't go into rendering its SQL, or that are only set
+# once it's compiled
+_UNHASHED_NODE_FIELDS = (
+    "created_at",
+    "build_path",
+    "deferred",
+    "compiled",
+    "compiled_sql",
+    "extra_ctes_injected",
+    "extra_ctes",
+    "relation_name",
+    "compiled_path",
+)
+
+
+def _is_context_override(macro: ParsedMacro) -> bool:
+    """Return whether the macro overrides how every node resolves refs,
+    sources or relation names.
+    """
+    return macro.name in ("ref", "source") or macro.name.startswith("generate_")
+
+
+class CompiledSQLCache:
+    """The compiled SQL of nodes, kept in the target directory between
+    invocations. Entries are keyed by a hash of everything that goes into
+    rendering a node's SQL, so a node whose inputs haven't changed since it
+    was last compiled doesn't need to be rendered again. A task creates one
+    for its invocation and passes it to Compiler.compile_node.
+    """
+
+    def __init__(self, config) -> None:
+        self.config = config
+        # the hash of the inputs that are the same for every node, or None if
+        # one of them is introspective
+        self._invocation_digest: Optional[str] = None
+        self._invocation_hashed = False
+        # the key of the cache entry each node used in this invocation
+        self.used_keys: Dict[str, str] = {}
+
+    @property
+    def cache_dir(self) -> str:
+        return os.path.join(self.config.target_path, COMPILED_SQL_CACHE_DIR)
+
+    def _get_invocation_digest(self, manifest: Manifest) -> Optional[str]:
+        """Hash the vars, target, quoting and dispatch config, the flags that
+        affect rendering and the macros that override ref, source or
+        generate_*, once per invocation.
+        """
+        if self._invocation_hashed:
+            return self._invocation_digest
+        overrides = [macro for macro in manifest.macros.values() if _is_context_override(macro)]
+        macros = _hash_macros(manifest, [macro.unique_id for macro in overrides])
+        digest = None
+        if macros is not None:
+            config = self.config
+            inputs = {
+                "dbt_version": __version__,
+                "vars": config.vars.to_dict(),
+                "cli_vars": config.cli_vars,
+                "target": config.to_target_dict(),
+                "quoting": config.quoting,
+                "dispatch": config.dispatch,
+                "full_refresh": flags.FULL_REFRESH,
+                "which": flags.WHICH,
+                "overrides": macros,
+            }
+            data = json.dumps(inputs, sort_keys=True, cls=dbt.utils.JSONEncoder)
+            digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        self._invocation_digest = digest
+        self._invocation_hashed = True
+        return digest
+
+    def key(self, node: ManifestNode, manifest: Manifest) -> Optional[str]:
+        """Hash everything that goes into rendering the node's SQL: the node,
+        the relations it refers to, the macros it calls (and the macros they
+        call), and the inputs that are the same for every node. Return None
+        if the node's compiled SQL can't be cached.
+        """
+        if node.resource_type not in _CACHEABLE_TYPES or _INTROSPECTIVE.search(node.raw_sql):
+            return None
+        invocation = self._get_invocation_digest(manifest)
+        if invocation is None:
+            return None
+        macros = _hash_macros(manifest, node.depends_on.macros)
+        if macros is None:
+            return None
+
+        relations: Dict[str, Any] = {}
+        for unique_id in node.depends_on.nodes:
+            dependency = manifest.nodes.get(unique_id) or manifest.sources.get(unique_id)
+            if dependency is None:
+                return None
+            quoting = getattr(dependency, "quoting", None)
+            relations[unique_id] = [
+                dependency.name,
+                dependency.database,
+                dependency.schema,
+                dependency.identifier,
+                dependency.is_ephemeral_model,
+                dependency.config.to_dict(omit_none=True),
+                quoting.to_dict(omit_none=True) if quoting is not None else None,
+            ]
+
+        node_dict = node.to_dict(omit_none=True)
+        for name in _UNHASHED_NODE_FIELDS:
+            node_dict.pop(name, None)
+        inputs = {
+            "invocation": invocation,
+            "node": node_dict,
+            "relations": relations,
+            "macros": macros,
+        }
+        data = json.dumps(inputs, sort_keys=True, cls=dbt.utils.JSONEncoder)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _path(self, unique_id: str, key: str) -> str:
+        return os.path.join(self.cache_dir, unique_id, f"{key}.json")
+
+    def read(self, unique_id: str, key: str) -> Optional[Dict[str, Any]]:
+        self.used_keys[unique_id] = key
+        try:
+            with open(self._path(unique_id, key), encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, key: str, node: NonSourceCompiledNode) -> None:
+        entry = {
+            "compiled_sql": node.compiled_sql,
+            "extra_ctes": [cte.id for cte in node.extra_ctes],
+        }
+        try:
+            write_file_atomic(self._path(node.unique_id, key), [json.dumps(entry)])
+        except OSError:
+            # the cache only saves time; compiling still worked
+            pass
+
+    def prune(self, manifest: Manifest) -> None:
+        """Remove the entries of nodes that are no longer in the manifest,
+        and the stale entries of nodes compiled in this invocation. Entries
+        of other nodes are kept for the next invocation that selects them.
+        """
+        used = dict(self.used_keys)
+        self.used_keys.clear()
+        try:
+            entries = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for unique_id in entries:
+            node_dir = os.path.join(self.cache_dir, unique_id)
+            try:
+                if unique_id not in manifest.nodes:
+                    rmdir(node_dir)
+                elif unique_id in used:
+                    for name in os.listdir(node_dir):
+                        if name != f"{used[unique_id]}.json":
+                            os.remove(os.path.join(node_dir, name))
+            except OSError:
+                # the cache only saves time
+                pass
+
+
+@functools.lru_cache(maxsize=None)
+def _macro_fingerprint(macro_sql: str) -> Tuple[str, bool]:
+    """Return a hash of the macro's SQL, and whether it is introspective."""
+    digest = hashlib.sha256(macro_sql.encode("utf-8")).hexdigest()
+    return digest, _INTROSPECTIVE.search(macro_sql) is not None
+
+
+def _macro_closure(manifest: Manifest, macro_ids: List[str]) -> List[ParsedMacro]:
+    """Return the macros with the given unique IDs, and the macros they
+    depend on, recursively.
+    """
+    seen: Set[str] = set()
+    stack = list(macro_ids)
+    macros: List[ParsedMacro] = []
+    while stack:
+        unique_id = stack.pop()
+        if unique_id in seen:
+            continue
+        seen.add(unique_id)
+        macro = manifest.macros.get(unique_id)
+        if macro is not None:
+            macros.append(macro)
+            stack.extend(macro.depends_on.macros)
+    return macros
+
+
+def _hash_macros(manifest: Manifest, macro_ids: List[str]) -> Optional[Dict[str, str]]:
+    """Hash the SQL of the macros with the given unique IDs, and of the
+    macros they depend on. Return None if any of them is introspective.
+    """
+    macros: Dict[str, str] = {}
+    for macro in _macro_closure(manifest, macro_ids):
+        digest, introspective = _macro_fingerprint(macro.macro_sql)
+        if introspective:
+            return None
+        macros[macro.unique_id] = digest
+    return macros
+
+
+# fields a node loses when it's serialized, which start out empty on the
+# compiled node
+_UNSERIALIZED_FIELDS = ("config_call_dict", "_event_status")
+
+
+def _copy_node_value(value: Any) -> Any:
+    """Copy a node field's value: lists, dicts and dataclasses (like the
+    config, depends_on, columns and docs) are copied all the way down, other
+    values (strings, numbers, enums) are immutable and shared.
+    """
+    if isinstance(value, list):
+        return [_copy_node_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_node_value(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        copied = copy.copy(value)
+        copied.__dict__.update((k, _copy_node_value(v)) for k, v in value.__dict__.items())
+        return copied
+    return value
+
+
+def _compiled_node_from(node: ParsedNode) -> NonSourceCompiledNode:
+    """Build the uncompiled compiled form of a parsed node by copying its
+    fields. This is equivalent to, and much faster than, building it from
+    node.to_dict(). Nothing mutable is shared with the parsed node, so
+    changing either one (like an adapter changing the config while the node
+    runs) doesn't change the other.
+    """
+    compiled_type = _compiled_type_for(node)
+    values = {}
+    for field in dataclasses.fields(node):
+        values[field.name] = _copy_node_value(getattr(node, field.name))
+    for name in _UNSERIALIZED_FIELDS:
+        values[name] = {}
+    return compiled_type(
+        compiled=False,
+        compiled_sql=None,
+        extra_ctes_injected=False,
+        extra_ctes=[],
+        **values,
+    )
+
+
 def print_compile_stats(stats):
     names = {
         NodeType.Model: "model",
@@ -230,39 +559,28 @@ class Compiler:
            select * from internal_cte"
 
         (Whitespace enhanced for readability.)
+
+        If `sql` starts with `with recursive`, the CTEs are injected after
+        `recursive`, which applies to the whole list of CTEs.
         """
         if len(ctes) == 0:
             return sql
 
-        parsed_stmts = sqlparse.parse(sql)
-        parsed = parsed_stmts[0]
-
-        with_stmt = None
-        for token in parsed.tokens:
-            if token.is_keyword and token.normalized == "WITH":
-                with_stmt = token
-                break
-
-        if with_stmt is None:
-            # no with stmt, add one, and inject CTEs right at the beginning
-            first_token = parsed.token_first()
-            with_stmt = sqlparse.sql.Token(sqlparse.tokens.Keyword, "with")
-            parsed.insert_before(first_token, with_stmt)
+        pos, has_with = _cte_insertion_point(sql)
+        ctes_sql = ", ".join(c.sql for c in ctes)
+        if has_with:
+            # the existing CTEs follow the injected ones
+            return "".join((sql[:pos], ctes_sql, ",", sql[pos:]))
         else:
-            # stmt exists, add a comma (which will come after injected CTEs)
-            trailing_comma = sqlparse.sql.Token(sqlparse.tokens.Punctuation, ",")
-            parsed.insert_after(with_stmt, trailing_comma)
-
-        token = sqlparse.sql.Token(sqlparse.tokens.Keyword, ", ".join(c.sql for c in ctes))
-        parsed.insert_after(with_stmt, token)
-
-        return str(parsed)
+            # no with stmt, add one, and inject CTEs right at the beginning
+            return "".join((sql[:pos], "with", ctes_sql, sql[pos:]))
 
     def _recursively_prepend_ctes(
         self,
         model: NonSourceCompiledNode,
         manifest: Manifest,
         extra_context: Optional[Dict[str, Any]],
+        cache: Optional[CompiledSQLCache] = None,
     ) -> Tuple[NonSourceCompiledNode, List[InjectedCTE]]:
         """This method is called by the 'compile_node' method. Starting
         from the node that it is passed in, it will recursively call
@@ -312,10 +630,10 @@ class Compiler:
             else:
                 # This is an ephemeral parsed model that we can compile.
                 # Compile and update the node
-                cte_model = self._compile_node(cte_model, manifest, extra_context)
+                cte_model = self._compile_node(cte_model, manifest, extra_context, cache)
                 # recursively call this method
                 cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
-                    cte_model, manifest, extra_context
+                    cte_model, manifest, extra_context, cache
                 )
                 # Save compiled SQL file and sync manifest
                 self._write_node(cte_model)
@@ -337,7 +655,8 @@ class Compiler:
         model.compiled_sql = injected_sql
         model.extra_ctes_injected = True
         model.extra_ctes = prepended_ctes
-        model.validate(model.to_dict(omit_none=True))
+        if flags.VALIDATE_COMPILED_NODES:
+            model.validate(model.to_dict(omit_none=True))
 
         manifest.update_node(model)
 
@@ -352,34 +671,42 @@ class Compiler:
         node: ManifestNode,
         manifest: Manifest,
         extra_context: Optional[Dict[str, Any]] = None,
+        cache: Optional[CompiledSQLCache] = None,
     ) -> NonSourceCompiledNode:
         if extra_context is None:
             extra_context = {}
 
         fire_event(CompilingNode(unique_id=node.unique_id))
 
-        data = node.to_dict(omit_none=True)
-        data.update(
-            {
-                "compiled": False,
-                "compiled_sql": None,
-                "extra_ctes_injected": False,
-                "extra_ctes": [],
-            }
-        )
-        compiled_node = _compiled_type_for(node).from_dict(data)
-
-        context = self._create_node_context(compiled_node, manifest, extra_context)
+        compiled_node = _compiled_node_from(node)
+
+        cache_key = None
+        if cache is not None and not extra_context:
+            cache_key = cache.key(node, manifest)
+        cached = cache.read(node.unique_id, cache_key) if cache and cache_key else None
+        if cached is not None:
+            fire_event(ReusingCompiledSQL(unique_id=node.unique_id))
+            compiled_node.compiled_sql = cached["compiled_sql"]
+            for cte_id in cached["extra_ctes"]:
+                # like RuntimeRefResolver.create_relation, the CTE's sql is
+                # filled in when CTEs are injected
+                compiled_node.set_cte(cte_id, None)  # type: ignore
+        else:
+            context = self._create_node_context(compiled_node, manifest, extra_context)
 
-        compiled_node.compiled_sql = jinja.get_rendered(
-            node.raw_sql,
-            context,
-            node,
-        )
+            compiled_node.compiled_sql = jinja.get_rendered(
+                node.raw_sql,
+                context,
+                node,
+            )
+            if cache and cache_key:
+                cache.write(cache_key, compiled_node)
 
         compiled_node.relation_name = self._get_relation_name(node)
 
         compiled_node.compiled = True
+        if flags.VALIDATE_COMPILED_NODES:
+            compiled_node.validate(compiled_node.to_dict(omit_none=True))
 
         return compiled_node
 
@@ -503,16 +830,18 @@ class Compiler:
         manifest: Manifest,
         extra_context: Optional[Dict[str, Any]] = None,
         write: bool = True,
+        cache: Optional[CompiledSQLCache] = None,
     ) -> NonSourceCompiledNode:
         """This is the main entry point into this code. It's called by
         CompileRunner.compile, GenericRPCRunner.compile, and
         RunTask.get_hook_sql. It calls '_compile_node' to convert
         the node into a compiled node, and then calls the
-        recursive method to "prepend" the ctes.
+        recursive method to "prepend" the ctes. If a cache is passed, nodes
+        whose inputs haven't changed reuse their cached compiled SQL.
         """
-        node = self._compile_node(node, manifest, extra_context)
+        node = self._compile_node(node, manifest, extra_context, cache)
 
-        node, _ = self._recursively_prepend_ctes(node, manifest, extra_context)
+        node, _ = self._recursively_prepend_ctes(node, manifest, extra_context, cache)
         if write:
             self._write_node(node)
         return node
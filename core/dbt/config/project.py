@@ -541,6 +541,11 @@ class Project:
     config_version: int
     unrendered: RenderComponents
     project_env_vars: Dict[str, Any]
+    # The resolved dbt_project.yml configs, filled in and used by the
+    # ContextConfigGenerators
+    config_cache: Dict[Any, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def all_source_paths(self) -> List[str]:
@@ -71,6 +71,24 @@ class SchemaYamlVars:
         self.vars = {}
 
 
+class SchemaYamlVar(ConfiguredVar):
+    def __init__(
+        self,
+        context: Dict[str, Any],
+        config: AdapterRequiredConfig,
+        project_name: str,
+        schema_yaml_vars: Optional[SchemaYamlVars],
+    ):
+        super().__init__(context, config, project_name)
+        self.schema_yaml_vars = schema_yaml_vars
+
+    def __call__(self, var_name, default=Var._VAR_NOTSET):
+        return_value = super().__call__(var_name, default)
+        if self.schema_yaml_vars:
+            self.schema_yaml_vars.vars[var_name] = return_value
+        return return_value
+
+
 class SchemaYamlContext(ConfiguredContext):
     # subclass is DocsRuntimeContext
     def __init__(self, config, project_name: str, schema_yaml_vars: Optional[SchemaYamlVars]):
@@ -80,7 +98,7 @@ class SchemaYamlContext(ConfiguredContext):
 
     @contextproperty
     def var(self) -> ConfiguredVar:
-        return ConfiguredVar(self._ctx, self.config, self._project_name)
+        return SchemaYamlVar(self._ctx, self.config, self._project_name, self.schema_yaml_vars)
 
     @contextmember
     def env_var(self, var: str, default: Optional[str] = None) -> str:
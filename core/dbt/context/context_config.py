@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Iterator, Dict, Any, TypeVar, Generic
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, TypeVar, Generic
 
 from dbt.config import RuntimeConfig, Project, IsFQNResource
 from dbt.contracts.graph.model_config import BaseConfig, get_config_for
@@ -70,6 +70,77 @@ class RenderedConfig(ConfigSource):
         return model_configs
 
 
+class _FrozenList(tuple):
+    """A list in a cached config layer, which every node can share because
+    it can't be changed.
+    """
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    elif isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return value with the frozen dicts and lists in it replaced by new
+    ones. Values with nothing frozen in them are returned as they are.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    elif isinstance(value, _FrozenList):
+        return [_thaw(item) for item in value]
+    elif isinstance(value, dict):
+        thawed = {key: _thaw(item) for key, item in value.items()}
+        if all(thawed[key] is item for key, item in value.items()):
+            return value
+        return thawed
+    elif isinstance(value, list):
+        thawed_list = [_thaw(item) for item in value]
+        if all(new is old for new, old in zip(thawed_list, value)):
+            return value
+        return thawed_list
+    return value
+
+
+def _thaw_layer(partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Unfreeze the top level of a config layer before it's merged into a
+    config. Merging only changes top-level values, so the values nested in
+    dicts are still shared until _thaw copies them for a node. Lists are
+    thawed all the way, because hooks are parsed from the dicts in them.
+    """
+    return {
+        key: dict(value)
+        if isinstance(value, MappingProxyType)
+        else _thaw(value)
+        if isinstance(value, _FrozenList)
+        else value
+        for key, value in partial.items()
+    }
+
+
+def _config_layer(level_config: Dict[str, Any]) -> Dict[str, Any]:
+    layer = {}
+    for key, value in level_config.items():
+        if key.startswith("+"):
+            layer[key[1:].strip()] = _freeze(value)
+        elif not isinstance(value, dict):
+            layer[key] = _freeze(value)
+    return layer
+
+
+def _config_prefix(model_configs: Dict[str, Any], fqn: List[str]) -> Tuple[str, ...]:
+    """Return the part of the fqn that has levels in model_configs. Every
+    node with the same prefix gets the same configs from it.
+    """
+    depth = 0
+    for depth, _ in enumerate(fqn_search(model_configs, fqn)):
+        pass
+    return tuple(fqn[:depth])
+
+
 class BaseContextConfigGenerator(Generic[T]):
     def __init__(self, active_project: RuntimeConfig):
         self._active_project = active_project
@@ -88,25 +159,59 @@ class BaseContextConfigGenerator(Generic[T]):
             )
         return dependencies[project_name]
 
-    def _project_configs(
+    def _get_config_cache(
+        self, project: Project, resource_type: NodeType
+    ) -> Tuple[Dict[str, Any], Dict[Any, Any]]:
+        """Return the project's configs for the resource type, and the cache
+        of what this kind of generator has resolved from them.
+        """
+        model_configs = self.get_config_source(project).get_config_dict(resource_type)
+        cache_key = (type(self), resource_type)
+        cached = project.config_cache.get(cache_key)
+        if cached is None or cached[0] is not model_configs:
+            cached = (model_configs, {})
+            project.config_cache[cache_key] = cached
+        return cached
+
+    def _project_config_layers(
         self, project: Project, fqn: List[str], resource_type: NodeType
-    ) -> Iterator[Dict[str, Any]]:
-        src = self.get_config_source(project)
-        model_configs = src.get_config_dict(resource_type)
-        for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
-
-    def _active_project_configs(
-        self, fqn: List[str], resource_type: NodeType
-    ) -> Iterator[Dict[str, Any]]:
-        return self._project_configs(self._active_project, fqn, resource_type)
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Return the configs the project sets at each level of the fqn,
+        with the "+" taken off their keys.
+
+        They're built once for each fqn prefix and shared by every node with
+        that prefix, so their dicts and lists are frozen. Nested values stay
+        frozen, and shared, until calculate_node_config thaws them.
+        """
+        model_configs, cache = self._get_config_cache(project, resource_type)
+        key = ("layers", _config_prefix(model_configs, fqn))
+        if key not in cache:
+            cache[key] = tuple(_config_layer(level) for level in fqn_search(model_configs, fqn))
+        return cache[key]
+
+    def _project_config_result(
+        self, project: Project, fqn: List[str], resource_type: NodeType, base: bool
+    ) -> T:
+        """Return the initial result updated with the project's configs for
+        the fqn. It's cached like the layers, and _copy_result makes sure
+        the cached result isn't changed.
+        """
+        model_configs, cache = self._get_config_cache(project, resource_type)
+        key = ("result", base, _config_prefix(model_configs, fqn))
+        if key not in cache:
+            result = self.initial_result(resource_type=resource_type, base=base)
+            for fqn_config in self._project_config_layers(project, fqn, resource_type):
+                result = self._update_from_config(result, fqn_config)
+            cache[key] = result
+        return self._copy_result(cache[key])
+
+    @abstractmethod
+    def _copy_result(self, result: T) -> T:
+        ...
+
+    @abstractmethod
+    def _thaw_result(self, result: T) -> T:
+        ...
 
     @abstractmethod
     def _update_from_config(self, result: T, partial: Dict[str, Any], validate: bool = False) -> T:
@@ -127,11 +232,7 @@ class BaseContextConfigGenerator(Generic[T]):
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
 
-        result = self.initial_result(resource_type=resource_type, base=base)
-
-        project_configs = self._project_configs(own_config, fqn, resource_type)
-        for fqn_config in project_configs:
-            result = self._update_from_config(result, fqn_config)
+        result = self._project_config_result(own_config, fqn, resource_type, base)
 
         # When schema files patch config, it has lower precedence than
         # config in the models (config_call_dict), so we add the patch_config_dict
@@ -144,9 +245,13 @@ class BaseContextConfigGenerator(Generic[T]):
         result = self._update_from_config(result, config_call_dict)
 
         if own_config.project_name != self._active_project.project_name:
-            for fqn_config in self._active_project_configs(fqn, resource_type):
+            active_configs = self._project_config_layers(self._active_project, fqn, resource_type)
+            for fqn_config in active_configs:
                 result = self._update_from_config(result, fqn_config)
 
+        # the node gets its own copies of the values nested in the layers
+        result = self._thaw_result(result)
+
         # this is mostly impactful in the snapshot config case
         # TODO CT-211
         return result  # type: ignore[return-value]
@@ -180,8 +285,17 @@ class ContextConfigGenerator(BaseContextConfigGenerator[C]):
         result = config_cls.from_dict({})
         return result
 
+    def _copy_result(self, result: C) -> C:
+        # update_from never changes the config, it returns a new one
+        return result
+
+    def _thaw_result(self, result: C) -> C:
+        # result is the node's own config, built by update_from
+        result.__dict__.update((key, _thaw(value)) for key, value in result.__dict__.items())
+        return result
+
     def _update_from_config(self, result: C, partial: Dict[str, Any], validate: bool = False) -> C:
-        translated = self._active_project.credentials.translate_aliases(partial)
+        translated = self._active_project.credentials.translate_aliases(_thaw_layer(partial))
         return result.update_from(
             translated, self._active_project.credentials.type, validate=validate
         )
@@ -233,12 +347,20 @@ class UnrenderedConfigGenerator(BaseContextConfigGenerator[Dict[str, Any]]):
     def initial_result(self, resource_type: NodeType, base: bool) -> Dict[str, Any]:
         return {}
 
+    def _copy_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        # _update_from_config replaces the result's values in place
+        return dict(result)
+
+    def _thaw_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        return _thaw(result)
+
     def _update_from_config(
         self,
         result: Dict[str, Any],
         partial: Dict[str, Any],
         validate: bool = False,
     ) -> Dict[str, Any]:
+        # the values are clobbered, not merged, so they can stay frozen
         translated = self._active_project.credentials.translate_aliases(partial)
         result.update(translated)
         return result
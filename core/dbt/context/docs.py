@@ -1,16 +1,46 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from dbt.exceptions import (
     doc_invalid_args,
     doc_target_not_found,
 )
 from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.connection import AdapterRequiredConfig
+from dbt.contracts.files import SchemaSourceFile
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.contracts.graph.parsed import ParsedMacro, ParsedSourceDefinition
+from dbt.node_types import NodeType
 
-from dbt.context.base import contextmember
-from dbt.context.configured import SchemaYamlContext
+from dbt.context.base import contextmember, contextproperty, Var
+from dbt.context.configured import ConfiguredVar, SchemaYamlContext
+
+# The schema file keys of the things with descriptions, other than sources
+DESCRIPTION_YAML_KEYS = {
+    NodeType.Model: "models",
+    NodeType.Seed: "seeds",
+    NodeType.Snapshot: "snapshots",
+    NodeType.Analysis: "analyses",
+    NodeType.Macro: "macros",
+    NodeType.Exposure: "exposures",
+    NodeType.Metric: "metrics",
+}
+
+
+class DocsRuntimeVar(ConfiguredVar):
+    def __init__(
+        self,
+        context: Dict[str, Any],
+        config: AdapterRequiredConfig,
+        project_name: str,
+        docs_context: "DocsRuntimeContext",
+    ):
+        super().__init__(context, config, project_name)
+        self.docs_context = docs_context
+
+    def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self.docs_context.save_var_name(var_name)
+        return super().__call__(var_name, default)
 
 
 class DocsRuntimeContext(SchemaYamlContext):
@@ -25,6 +55,34 @@ class DocsRuntimeContext(SchemaYamlContext):
         self.node = node
         self.manifest = manifest
 
+    @contextproperty
+    def var(self) -> ConfiguredVar:
+        return DocsRuntimeVar(self._ctx, self.config, self._project_name, self)
+
+    def save_var_name(self, var_name: str) -> None:
+        # Save the var name in the file (and schema file entry) the description
+        # came from, so that partial parsing can reparse it when --vars changes.
+        yaml_key: Optional[str] = None
+        name = self.node.name
+        if isinstance(self.node, ParsedSourceDefinition):
+            file_id = self.node.file_id
+            yaml_key = "sources"
+            name = self.node.source_name
+        elif getattr(self.node, "patch_path", None):
+            file_id = self.node.patch_path  # type: ignore[union-attr]
+            yaml_key = DESCRIPTION_YAML_KEYS.get(self.node.resource_type)
+        else:
+            file_id = self.node.file_id
+            yaml_key = DESCRIPTION_YAML_KEYS.get(self.node.resource_type)
+        if file_id not in self.manifest.files:
+            return
+        source_file = self.manifest.files[file_id]
+        if isinstance(source_file, SchemaSourceFile):
+            if yaml_key:
+                source_file.add_var(var_name, yaml_key, name)
+        elif var_name not in source_file.vars:
+            source_file.vars.append(var_name)
+
     @contextmember
     def doc(self, *args: str) -> str:
         """The `doc` function is used to reference docs blocks in schema.yml
@@ -83,3 +141,29 @@ def generate_runtime_docs_context(
     ctx = DocsRuntimeContext(config, target, manifest, current_project)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
+
+
+class DocsRuntimeContexts:
+    """The docs contexts for rendering descriptions, built the first time a
+    description needs one, and shared by everything in the same package.
+
+    Only `doc` uses the node the context was built for, to resolve the doc in
+    the node's package and to record the node in the doc's file, so the shared
+    context is pointed at each node before it's returned.
+    """
+
+    def __init__(self, config: RuntimeConfig, manifest: Manifest, current_project: str) -> None:
+        self.config = config
+        self.manifest = manifest
+        self.current_project = current_project
+        self._contexts: Dict[str, Tuple[DocsRuntimeContext, Dict[str, Any]]] = {}
+
+    def get(self, target: Any) -> Dict[str, Any]:
+        package_name = target.package_name
+        if package_name not in self._contexts:
+            ctx = DocsRuntimeContext(self.config, target, self.manifest, self.current_project)
+            # This is not a Mashumaro to_dict call
+            self._contexts[package_name] = (ctx, ctx.to_dict())
+        ctx, ctx_dict = self._contexts[package_name]
+        ctx.node = target
+        return ctx_dict
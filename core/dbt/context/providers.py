@@ -27,6 +27,7 @@ from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from .macros import MacroNamespaceBuilder, MacroNamespace
 from .manifest import ManifestContext
 from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.files import SchemaSourceFile
 from dbt.contracts.graph.manifest import Manifest, Disabled
 from dbt.contracts.graph.compiled import (
     CompiledResource,
@@ -516,9 +517,11 @@ class ModelConfiguredVar(Var):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: CompiledResource,
+        manifest: Optional[Manifest] = None,
     ) -> None:
         self._node: CompiledResource
         self._config: RuntimeConfig = config
+        self._manifest: Optional[Manifest] = manifest
         super().__init__(context, config.cli_vars, node=node)
 
     def packages_for_node(self) -> Iterable[Project]:
@@ -549,6 +552,26 @@ class ModelConfiguredVar(Var):
 
 
 class ParseVar(ModelConfiguredVar):
+    def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self.save_var_name(var_name)
+        return super().__call__(var_name, default)
+
+    def save_var_name(self, var_name):
+        # Save the var name in the source_file, so that partial parsing can
+        # reparse just this file (or schema entry) when --vars changes it.
+        if self._manifest is None or self._node.file_id not in self._manifest.files:
+            # hooks come from dbt_project.yml which doesn't have a real file_id
+            return
+        source_file = self._manifest.files[self._node.file_id]
+        if isinstance(source_file, SchemaSourceFile):
+            # only generic tests come from schema files
+            file_key_name = getattr(self._node, "file_key_name", None)
+            if file_key_name:
+                (yaml_key, name) = file_key_name.split(".")
+                source_file.add_var(var_name, yaml_key, name)
+        elif var_name not in source_file.vars:
+            source_file.vars.append(var_name)
+
     def get_missing_var(self, var_name):
         # in the parser, just always return None.
         return None
@@ -558,6 +581,15 @@ class RuntimeVar(ModelConfiguredVar):
     pass
 
 
+class GenerateNameVar(RuntimeVar):
+    def __call__(self, var_name, default=Var._VAR_NOTSET):
+        # Every node's database, schema and alias are generated with these
+        # macros, so partial parsing needs to know about any var they read.
+        if self._manifest is not None:
+            self._manifest.generate_name_vars.add(var_name)
+        return super().__call__(var_name, default)
+
+
 # Providers
 class Provider(Protocol):
     execute: bool
@@ -581,7 +613,7 @@ class GenerateNameProvider(Provider):
     execute = False
     Config = RuntimeConfigObject
     DatabaseWrapper = ParseDatabaseWrapper
-    Var = RuntimeVar
+    Var = GenerateNameVar
     ref = ParseRefResolver
     source = ParseSourceResolver
 
@@ -717,7 +749,7 @@ class ProviderContext(ManifestContext):
             raise_compiler_error(message_if_exception, self.model)
 
     @contextmember
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self) -> Union[agate.Table, agate_helper.StreamingSeedTable]:
         if not isinstance(self.model, (ParsedSeedNode, CompiledSeedNode)):
             raise_compiler_error(
                 "can only load_agate_table for seeds (got a {})".format(self.model.resource_type)
@@ -725,10 +757,10 @@ class ProviderContext(ManifestContext):
         path = os.path.join(self.model.root_path, self.model.original_file_path)
         column_types = self.model.config.column_types
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types)
+            table = agate_helper.load_seed_table(path, text_columns=column_types)
         except ValueError as e:
             raise_compiler_error(str(e))
-        table.original_abspath = os.path.abspath(path)
+        table.original_abspath = os.path.abspath(path)  # type: ignore
         return table
 
     @contextproperty
@@ -946,6 +978,7 @@ class ProviderContext(ManifestContext):
             context=self._ctx,
             config=self.config,
             node=self.model,
+            manifest=self.manifest,
         )
 
     @contextproperty("adapter")
@@ -187,6 +187,7 @@ class SourceFile(BaseSourceFile):
     docs: List[str] = field(default_factory=list)
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
+    vars: List[str] = field(default_factory=list)
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
@@ -229,6 +230,7 @@ class SchemaSourceFile(BaseSourceFile):
     # created too, but those are in 'sources'
     sop: List[SourceKey] = field(default_factory=list)
     env_vars: Dict[str, Any] = field(default_factory=dict)
+    vars: Dict[str, Any] = field(default_factory=dict)
     pp_dict: Optional[Dict[str, Any]] = None
     pp_test_index: Optional[Dict[str, Any]] = None
 
@@ -314,5 +316,20 @@ class SchemaSourceFile(BaseSourceFile):
             if not self.env_vars[yaml_key]:
                 del self.env_vars[yaml_key]
 
+    def add_var(self, var, yaml_key, name):
+        if yaml_key not in self.vars:
+            self.vars[yaml_key] = {}
+        if name not in self.vars[yaml_key]:
+            self.vars[yaml_key][name] = []
+        if var not in self.vars[yaml_key][name]:
+            self.vars[yaml_key][name].append(var)
+
+    def delete_from_vars(self, yaml_key, name):
+        # Like delete_from_env_vars, for the vars read by the entry
+        if yaml_key in self.vars and name in self.vars[yaml_key]:
+            del self.vars[yaml_key][name]
+            if not self.vars[yaml_key]:
+                del self.vars[yaml_key]
+
 
 AnySourceFile = Union[SchemaSourceFile, SourceFile]
@@ -19,6 +19,9 @@ from typing import (
     cast,
     AbstractSet,
     ClassVar,
+    Container,
+    Iterable,
+    Iterator,
 )
 from typing_extensions import Protocol
 from uuid import UUID
@@ -40,8 +43,21 @@ from dbt.contracts.graph.parsed import (
     ManifestNodes,
 )
 from dbt.contracts.graph.unparsed import SourcePatch
-from dbt.contracts.files import SourceFile, SchemaSourceFile, FileHash, AnySourceFile
-from dbt.contracts.util import BaseArtifactMetadata, SourceKey, ArtifactMixin, schema_version
+from dbt.contracts.files import (
+    SourceFile,
+    SchemaSourceFile,
+    FileHash,
+    AnySourceFile,
+    ParseFileType,
+)
+from dbt.contracts.util import (
+    BaseArtifactMetadata,
+    SourceKey,
+    ArtifactMixin,
+    LazyArtifactMap,
+    ArtifactSnapshot,
+    schema_version,
+)
 from dbt.dataclass_schema import dbtClassMixin
 from dbt.exceptions import (
     CompilationException,
@@ -113,12 +129,14 @@ class DocLookup(dbtClassMixin):
 
 
 class SourceLookup(dbtClassMixin):
+    # flattened like RefableLookup.unique_ids
     def __init__(self, manifest: "Manifest"):
         self.storage: Dict[str, Dict[PackageName, UniqueID]] = {}
+        self.unique_ids: Dict[Tuple[str, Optional[PackageName]], UniqueID] = {}
         self.populate(manifest)
 
     def get_unique_id(self, search_name, package: Optional[PackageName]):
-        return find_unique_id_for_package(self.storage, search_name, package)
+        return self.unique_ids.get((search_name, package))
 
     def find(self, search_name, package: Optional[PackageName], manifest: "Manifest"):
         unique_id = self.get_unique_id(search_name, package)
@@ -131,6 +149,10 @@ class SourceLookup(dbtClassMixin):
             self.storage[source.search_name] = {}
 
         self.storage[source.search_name][source.package_name] = source.unique_id
+        self.unique_ids[(source.search_name, source.package_name)] = source.unique_id
+        self.unique_ids[(source.search_name, None)] = next(
+            iter(self.storage[source.search_name].values())
+        )
 
     def populate(self, manifest):
         for source in manifest.sources.values():
@@ -150,14 +172,16 @@ class RefableLookup(dbtClassMixin):
     _lookup_types: ClassVar[set] = set(NodeType.refable())
 
     # refables are actually unique, so the Dict[PackageName, UniqueID] will
-    # only ever have exactly one value, but doing 3 dict lookups instead of 1
-    # is not a big deal at all and retains consistency
+    # only ever have exactly one value. Every ref in every node is looked up
+    # here, so unique_ids flattens it, with what find_unique_id_for_package
+    # would find for (name, None) precomputed.
     def __init__(self, manifest: "Manifest"):
         self.storage: Dict[str, Dict[PackageName, UniqueID]] = {}
+        self.unique_ids: Dict[Tuple[str, Optional[PackageName]], UniqueID] = {}
         self.populate(manifest)
 
     def get_unique_id(self, key, package: Optional[PackageName]):
-        return find_unique_id_for_package(self.storage, key, package)
+        return self.unique_ids.get((key, package))
 
     def find(self, key, package: Optional[PackageName], manifest: "Manifest"):
         unique_id = self.get_unique_id(key, package)
@@ -170,6 +194,8 @@ class RefableLookup(dbtClassMixin):
             if node.name not in self.storage:
                 self.storage[node.name] = {}
             self.storage[node.name][node.package_name] = node.unique_id
+            self.unique_ids[(node.name, node.package_name)] = node.unique_id
+            self.unique_ids[(node.name, None)] = next(iter(self.storage[node.name].values()))
 
     def populate(self, manifest):
         for node in manifest.nodes.values():
@@ -426,6 +452,12 @@ class Searchable(Protocol):
         raise NotImplementedError("search_name not implemented")
 
 
+class HasNodes(Protocol):
+    @property
+    def nodes(self) -> Mapping[UniqueID, ManifestNode]:
+        raise NotImplementedError("nodes not implemented")
+
+
 D = TypeVar("D")
 
 
@@ -555,6 +587,152 @@ class ParsingInfo:
     static_analysis_path_count: int = 0
 
 
+@dataclass
+class ReverseIndex(dbtClassMixin):
+    """Maps keys, like a macro's unique ID, to the unique IDs of everything
+    that refers to them. What each referrer refers to is kept as well, so a
+    referrer's entries can be replaced without searching the whole index.
+    """
+
+    references: Dict[str, Set[str]] = field(default_factory=dict)
+    referrers: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def get(self, key: str) -> List[str]:
+        return sorted(self.referrers.get(key, ()))
+
+    def set(self, referrer: str, keys: Iterable[str]) -> None:
+        self.remove(referrer)
+        key_set = set(keys)
+        if not key_set:
+            return
+        self.references[referrer] = key_set
+        for key in key_set:
+            self.referrers.setdefault(key, set()).add(referrer)
+
+    def remove(self, referrer: str) -> None:
+        for key in self.references.pop(referrer, ()):
+            referrers = self.referrers[key]
+            referrers.discard(referrer)
+            if not referrers:
+                del self.referrers[key]
+
+    def remove_missing(self, existing: Container[str]) -> None:
+        for referrer in [r for r in self.references if r not in existing]:
+            self.remove(referrer)
+
+
+def _file_var_names(source_file: AnySourceFile, attr: str) -> Iterator[str]:
+    # attr is "env_vars" or "vars". Schema files keep them by yaml_key and name.
+    var_names = getattr(source_file, attr)
+    if isinstance(source_file, SchemaSourceFile):
+        for names in var_names.values():
+            for var_list in names.values():
+                yield from var_list
+    else:
+        yield from var_names
+
+
+@dataclass
+class PartialParsingIndexes(dbtClassMixin):
+    """The reverse indexes partial parsing uses to find what to reparse when
+    a macro, node, env var or var changes. They're saved with the manifest, and
+    each parse only updates the entries for what it parsed. The objects that
+    call doc() are already kept with each doc's file (in SourceFile.nodes).
+    """
+
+    # macro unique_id -> nodes and macros with it in depends_on.macros
+    macro_children: ReverseIndex = field(default_factory=ReverseIndex)
+    # node or source unique_id -> nodes, exposures and metrics with it in
+    # depends_on.nodes. This includes the tests on each source.
+    node_children: ReverseIndex = field(default_factory=ReverseIndex)
+    # env var -> file_ids of the files that read it
+    env_var_files: ReverseIndex = field(default_factory=ReverseIndex)
+    # var -> file_ids of the files that read it
+    var_files: ReverseIndex = field(default_factory=ReverseIndex)
+    built: bool = False
+
+    def update(
+        self,
+        manifest: "Manifest",
+        started_at: Optional[float] = None,
+        file_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Update the entries for the objects in the manifest created since
+        started_at, and for file_ids, and drop the entries for objects and
+        files that were removed. If started_at is None, or the indexes were
+        never built, rebuild them from the whole manifest.
+        """
+        if not self.built:
+            started_at = None
+        if started_at is None:
+            self.macro_children = ReverseIndex()
+            self.node_children = ReverseIndex()
+            self.env_var_files = ReverseIndex()
+            self.var_files = ReverseIndex()
+            file_ids = None
+
+        self.macro_children.remove_missing(set(chain(manifest.nodes, manifest.macros)))
+        for macro_child in chain(manifest.nodes.values(), manifest.macros.values()):
+            if started_at is None or macro_child.created_at >= started_at:
+                self.macro_children.set(macro_child.unique_id, macro_child.depends_on.macros)
+
+        self.node_children.remove_missing(
+            set(chain(manifest.nodes, manifest.exposures, manifest.metrics))
+        )
+        for node_child in chain(
+            manifest.nodes.values(), manifest.exposures.values(), manifest.metrics.values()
+        ):
+            if started_at is None or node_child.created_at >= started_at:
+                self.node_children.set(node_child.unique_id, node_child.depends_on.nodes)
+
+        self.env_var_files.remove_missing(manifest.files)
+        self.var_files.remove_missing(manifest.files)
+        for file_id in manifest.files if file_ids is None else file_ids:
+            if file_id in manifest.files:
+                source_file = manifest.files[file_id]
+                self.env_var_files.set(file_id, _file_var_names(source_file, "env_vars"))
+                self.var_files.set(file_id, _file_var_names(source_file, "vars"))
+
+        self.built = True
+
+
+@dataclass
+class MacroParseCache(dbtClassMixin):
+    """What parsing finds in macro files that only depends on their contents,
+    keyed by checksum, so macro files that haven't changed (usually all of an
+    installed package's) aren't parsed again. It's saved with the manifest,
+    and kept when the rest of the saved manifest can't be reused.
+    """
+
+    # file checksum -> [name, start, end] of each macro in the file's contents
+    macro_blocks: Dict[str, List[Tuple[str, int, int]]] = field(default_factory=dict)
+    # macro_sql checksum -> what statically_find_macro_calls found in it
+    macro_calls: Dict[str, List[List[Any]]] = field(default_factory=dict)
+
+    def prune(self, manifest: "Manifest") -> None:
+        """Drop the entries for files and macros that aren't in the manifest."""
+        file_checksums = {
+            source_file.checksum.checksum
+            for source_file in manifest.files.values()
+            if source_file.parse_file_type == ParseFileType.Macro
+        }
+        self.macro_blocks = {
+            checksum: blocks
+            for checksum, blocks in self.macro_blocks.items()
+            if checksum in file_checksums
+        }
+        macro_checksums = {macro_sql_checksum(macro) for macro in manifest.macros.values()}
+        self.macro_calls = {
+            checksum: calls
+            for checksum, calls in self.macro_calls.items()
+            if checksum in macro_checksums
+        }
+
+
+def macro_sql_checksum(macro: ParsedMacro) -> str:
+    return FileHash.from_contents(macro.macro_sql).checksum
+
+
 @dataclass
 class ManifestStateCheck(dbtClassMixin):
     vars_hash: FileHash = field(default_factory=FileHash.empty)
@@ -562,6 +740,8 @@ class ManifestStateCheck(dbtClassMixin):
     profile_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_hash: FileHash = field(default_factory=FileHash.empty)
     project_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # --vars name -> checksum of its value
+    cli_vars_hashes: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -585,6 +765,11 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     source_patches: MutableMapping[SourceKey, SourcePatch] = field(default_factory=dict)
     disabled: MutableMapping[str, List[CompileResultNode]] = field(default_factory=dict)
     env_vars: MutableMapping[str, str] = field(default_factory=dict)
+    partial_parsing_indexes: PartialParsingIndexes = field(default_factory=PartialParsingIndexes)
+    macro_parse_cache: MacroParseCache = field(default_factory=MacroParseCache)
+    # the vars read by the generate_*_name macros, which every node is parsed
+    # with, so partial parsing can't be used when one of them changes
+    generate_name_vars: Set[str] = field(default_factory=set)
 
     _doc_lookup: Optional[DocLookup] = field(
         default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
@@ -748,6 +933,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             disabled={k: _deepcopy(v) for k, v in self.disabled.items()},
             files={k: _deepcopy(v) for k, v in self.files.items()},
             state_check=_deepcopy(self.state_check),
+            generate_name_vars=set(self.generate_name_vars),
         )
 
     def build_parent_and_child_maps(self):
@@ -792,6 +978,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     def write(self, path):
         self.writable_manifest().write(path)
 
+    def snapshot(self) -> ArtifactSnapshot:
+        return self.writable_manifest().snapshot()
+
     # Called in dbt.compilation.Linker.write_graph and
     # dbt.graph.queue.get and ._include_in_cost
     def expect(self, unique_id: str) -> GraphMemberNode:
@@ -851,6 +1040,16 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._analysis_lookup = AnalysisLookup(self)
         return self._analysis_lookup
 
+    def clear_lookups(self):
+        """Clear the lookups by name, for them to be rebuilt the next time
+        they're used. Called when nodes are removed from the manifest.
+        """
+        self._doc_lookup = None
+        self._source_lookup = None
+        self._ref_lookup = None
+        self._disabled_lookup = None
+        self._analysis_lookup = None
+
     # Called by dbt.parser.manifest._resolve_refs_for_exposure
     # and dbt.parser.manifest._process_refs_for_node
     def resolve_ref(
@@ -861,22 +1060,20 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         node_package: str,
     ) -> MaybeNonSource:
 
-        node: Optional[ManifestNode] = None
-        disabled: Optional[List[ManifestNode]] = None
-
+        ref_lookup = self.ref_lookup
         candidates = _search_packages(current_project, node_package, target_model_package)
         for pkg in candidates:
-            node = self.ref_lookup.find(target_model_name, pkg, self)
-
-            if node is not None and node.config.enabled:
-                return node
+            unique_id = ref_lookup.get_unique_id(target_model_name, pkg)
+            if unique_id is not None:
+                node = ref_lookup.perform_lookup(unique_id, self)
+                if node.config.enabled:
+                    return node
 
-            # it's possible that the node is disabled
-            if disabled is None:
-                disabled = self.disabled_lookup.find(target_model_name, pkg)
-
-        if disabled:
-            return Disabled(disabled[0])
+        # it's possible that the node is disabled
+        for pkg in candidates:
+            disabled = self.disabled_lookup.find(target_model_name, pkg)
+            if disabled:
+                return Disabled(disabled[0])
         return None
 
     # Called by dbt.parser.manifest._resolve_sources_for_exposure
@@ -889,23 +1086,19 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         node_package: str,
     ) -> MaybeParsedSource:
         search_name = f"{target_source_name}.{target_table_name}"
+        source_lookup = self.source_lookup
         candidates = _search_packages(current_project, node_package)
-
-        source: Optional[ParsedSourceDefinition] = None
-        disabled: Optional[List[ParsedSourceDefinition]] = None
-
         for pkg in candidates:
-            source = self.source_lookup.find(search_name, pkg, self)
-            if source is not None and source.config.enabled:
-                return source
-
-            if disabled is None:
-                disabled = self.disabled_lookup.find(
-                    f"{target_source_name}.{target_table_name}", pkg
-                )
+            unique_id = source_lookup.get_unique_id(search_name, pkg)
+            if unique_id is not None:
+                source = source_lookup.perform_lookup(unique_id, self)
+                if source.config.enabled:
+                    return source
 
-        if disabled:
-            return Disabled(disabled[0])
+        for pkg in candidates:
+            disabled = self.disabled_lookup.find(search_name, pkg)
+            if disabled:
+                return Disabled(disabled[0])
         return None
 
     # Called by DocsRuntimeContext.doc
@@ -932,26 +1125,38 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     def merge_from_artifact(
         self,
         adapter,
-        other: "WritableManifest",
+        other: HasNodes,
         selected: AbstractSet[UniqueID],
     ) -> None:
-        """Given the selected unique IDs and a writable manifest, update this
-        manifest by replacing any unselected nodes with their counterpart.
+        """Given the selected unique IDs and a writable or --state manifest,
+        update this manifest by replacing any unselected nodes with their
+        counterpart.
 
-        Only non-ephemeral refable nodes are examined.
+        Only non-ephemeral refable nodes are examined. The nodes of a --state
+        manifest are checked in their serialized form, so only the nodes that
+        are merged get built.
         """
         refables = set(NodeType.refable())
         merged = set()
-        for unique_id, node in other.nodes.items():
+        other_nodes = other.nodes
+        for unique_id in other_nodes:
             current = self.nodes.get(unique_id)
-            if current and (
-                node.resource_type in refables
-                and not node.is_ephemeral
-                and unique_id not in selected
+            if not current or unique_id in selected:
+                continue
+            if isinstance(other_nodes, LazyArtifactMap):
+                raw = other_nodes.raw(unique_id)
+                resource_type = raw.get("resource_type")
+                is_ephemeral = (raw.get("config") or {}).get("materialized") == "ephemeral"
+            else:
+                resource_type = other_nodes[unique_id].resource_type
+                is_ephemeral = other_nodes[unique_id].is_ephemeral
+            if (
+                resource_type in refables
+                and not is_ephemeral
                 and not adapter.get_relation(current.database, current.schema, current.identifier)
             ):
                 merged.add(unique_id)
-                self.nodes[unique_id] = node.replace(deferred=True)
+                self.nodes[unique_id] = other_nodes[unique_id].replace(deferred=True)
 
         # log up to 5 items
         sample = list(islice(merged, 5))
@@ -1005,6 +1210,8 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         # nodes can't be overwritten!
         _check_duplicates(node, self.nodes)
         self.nodes[node.unique_id] = node
+        if self._ref_lookup is not None:
+            self._ref_lookup.add_node(node)
 
     def add_node(self, source_file: AnySourceFile, node: ManifestNodes, test_from=None):
         self.add_node_nofile(node)
@@ -1030,6 +1237,8 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self.disabled[node.unique_id].append(node)
         else:
             self.disabled[node.unique_id] = [node]
+        if self._disabled_lookup is not None:
+            self._disabled_lookup.add_node(node)
 
     def add_disabled(self, source_file: AnySourceFile, node: CompileResultNode, test_from=None):
         self.add_disabled_nofile(node)
@@ -1069,6 +1278,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self.source_patches,
             self.disabled,
             self.env_vars,
+            self.partial_parsing_indexes,
+            self.macro_parse_cache,
+            self.generate_name_vars,
             self._doc_lookup,
             self._source_lookup,
             self._ref_lookup,
@@ -253,6 +253,8 @@ class UserConfig(ExtensibleDbtClassMixin, Replaceable, UserConfigContract):
     use_experimental_parser: Optional[bool] = None
     static_parser: Optional[bool] = None
     indirect_selection: Optional[str] = None
+    compiled_sql_cache: Optional[bool] = None
+    fast_json_artifacts: Optional[bool] = None
 
 
 @dataclass
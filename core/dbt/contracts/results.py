@@ -6,6 +6,7 @@ from dbt.contracts.util import (
     ArtifactMixin,
     VersionedSchema,
     Replaceable,
+    ArtifactSnapshot,
     schema_version,
 )
 from dbt.exceptions import InternalException
@@ -32,8 +33,6 @@ from typing import (
     Sequence,
 )
 
-from dbt.clients.system import write_json
-
 
 @dataclass
 class TimingInfo(dbtClassMixin):
@@ -184,14 +183,19 @@ class RunExecutionResult(
     args: Dict[str, Any] = field(default_factory=dict)
     generated_at: datetime = field(default_factory=datetime.utcnow)
 
-    def write(self, path: str):
-        writable = RunResultsArtifact.from_execution_results(
+    def writable(self) -> "RunResultsArtifact":
+        return RunResultsArtifact.from_execution_results(
             results=self.results,
             elapsed_time=self.elapsed_time,
             generated_at=self.generated_at,
             args=self.args,
         )
-        writable.write(path)
+
+    def write(self, path: str):
+        self.writable().write(path)
+
+    def snapshot(self) -> ArtifactSnapshot:
+        return self.writable().snapshot()
 
 
 @dataclass
@@ -215,9 +219,6 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
         )
         return cls(metadata=meta, results=processed_results, elapsed_time=elapsed_time, args=args)
 
-    def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))
-
 
 @dataclass
 class RunOperationResult(ExecutionResult):
@@ -13,7 +13,7 @@ from dbt.contracts.results import (
     ExecutionResult,
     RunExecutionResult,
 )
-from dbt.contracts.util import VersionedSchema, schema_version
+from dbt.contracts.util import ArtifactSnapshot, VersionedSchema, schema_version
 from dbt.logger import LogMessage
 
 
@@ -53,14 +53,19 @@ class RemoteExecutionResult(ExecutionResult, RemoteResult):
     args: Dict[str, Any] = field(default_factory=dict)
     generated_at: datetime = field(default_factory=datetime.utcnow)
 
-    def write(self, path: str):
-        writable = RunResultsArtifact.from_execution_results(
+    def writable(self) -> RunResultsArtifact:
+        return RunResultsArtifact.from_execution_results(
             generated_at=self.generated_at,
             results=self.results,
             elapsed_time=self.elapsed_time,
             args=self.args,
         )
-        writable.write(path)
+
+    def write(self, path: str):
+        self.writable().write(path)
+
+    def snapshot(self) -> ArtifactSnapshot:
+        return self.writable().snapshot()
 
     @classmethod
     def from_local_result(
@@ -1,21 +1,173 @@
+import hashlib
+import os
+import tempfile
 from pathlib import Path
-from .graph.manifest import WritableManifest
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import msgpack  # type: ignore
+
+from .graph.compiled import ManifestNode
+from .graph.manifest import ManifestMetadata, WritableManifest
+from .graph.parsed import ParsedExposure, ParsedMetric, ParsedNode, ParsedSourceDefinition
 from .results import RunResultsArtifact
-from typing import Optional
-from dbt.exceptions import IncompatibleSchemaException
+from .util import LazyArtifactMap
+from dbt.exceptions import IncompatibleSchemaException, RuntimeException
+from dbt.utils import loads_json_fast
+from dbt.version import __version__
+
+
+# The state cache is written under the target path, not next to the --state
+# manifest, whose directory is often read-only or shared between jobs.
+STATE_CACHE_DIR = "state_cache"
+# Bump this when the contents of the state cache change, so caches written by
+# an older dbt are rebuilt.
+STATE_CACHE_VERSION = 1
+
+# The manifest sections state selectors and --defer use. Everything else
+# (docs, disabled nodes, the parent and child maps, selectors) is dropped, and
+# macros are reduced to a hash of their SQL.
+NODE_SECTIONS = ("nodes", "sources", "exposures", "metrics")
+
+
+def macro_sql_checksum(macro_sql: str) -> str:
+    return hashlib.sha256(macro_sql.encode("utf-8")).hexdigest()
+
+
+def build_manifest_node(dct: Dict[str, Any]) -> ManifestNode:
+    # This is how WritableManifest.from_dict builds its nodes: compiled nodes
+    # are read back as parsed nodes.
+    return ParsedNode._deserialize(dct)
+
+
+class StateManifest:
+    """The parts of a --state manifest that state selectors and --defer use.
+
+    Nodes, sources, exposures and metrics are only built when they're looked
+    up. Deferred nodes replace nodes in the current manifest, so they're kept
+    whole, and the state cache saves parsing the JSON rather than space.
+    Macros are only compared by their SQL, so only a hash of it is kept.
+    """
+
+    def __init__(
+        self,
+        metadata: Dict[str, Any],
+        nodes: Dict[str, Dict[str, Any]],
+        sources: Dict[str, Dict[str, Any]],
+        exposures: Dict[str, Dict[str, Any]],
+        metrics: Dict[str, Dict[str, Any]],
+        macro_sql_checksums: Dict[str, str],
+    ):
+        self.metadata: ManifestMetadata = ManifestMetadata.from_dict(metadata)
+        self.nodes: Mapping[str, ManifestNode] = LazyArtifactMap(nodes, build_manifest_node)
+        self.sources: Mapping[str, ParsedSourceDefinition] = LazyArtifactMap(
+            sources, ParsedSourceDefinition.from_dict
+        )
+        self.exposures: Mapping[str, ParsedExposure] = LazyArtifactMap(
+            exposures, ParsedExposure.from_dict
+        )
+        self.metrics: Mapping[str, ParsedMetric] = LazyArtifactMap(metrics, ParsedMetric.from_dict)
+        self.macro_sql_checksums: Dict[str, str] = macro_sql_checksums
+
+    @staticmethod
+    def project(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a serialized manifest to the arguments of StateManifest."""
+        projected = {key: data.get(key) or {} for key in NODE_SECTIONS}
+        projected["metadata"] = data.get("metadata") or {}
+        projected["macro_sql_checksums"] = {
+            unique_id: macro_sql_checksum(macro["macro_sql"])
+            for unique_id, macro in (data.get("macros") or {}).items()
+        }
+        return projected
+
+    @classmethod
+    def read(cls, path: Path, cache_dir: Optional[Path] = None) -> "StateManifest":
+        """Read the manifest at path. With a cache_dir, it's read from the
+        state cache there if that was built from the same file, and the cache
+        is built otherwise.
+        """
+        cache_path: Optional[Path] = None
+        cache_key: List[Any] = []
+        projected: Optional[Dict[str, Any]] = None
+        if cache_dir is not None:
+            stat = path.stat()
+            cache_key = [STATE_CACHE_VERSION, __version__, stat.st_size, stat.st_mtime_ns]
+            cache_path = cache_dir / state_cache_file_name(path)
+            projected = _read_state_cache(cache_path, cache_key)
+        if projected is None:
+            try:
+                with path.open("rb") as fp:
+                    data = loads_json_fast(fp.read())
+            except (EnvironmentError, ValueError) as exc:
+                raise RuntimeException(
+                    f'Could not read WritableManifest at "{path}" as JSON: {exc}'
+                ) from exc
+            WritableManifest.check_schema_version(data)
+            projected = cls.project(data)
+            if cache_path is not None:
+                _write_state_cache(cache_path, {"key": cache_key, "manifest": projected})
+        else:
+            WritableManifest.check_schema_version(projected)
+        return cls(**projected)
+
+
+def state_cache_file_name(path: Path) -> str:
+    """The name of the state cache for the --state manifest at path. Each
+    --state directory gets its own cache.
+    """
+    digest = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+    return f"{digest[:16]}.msgpack"
+
+
+def _read_state_cache(path: Path, key: Any) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("rb") as fp:
+            cache = msgpack.unpackb(fp.read(), raw=False)
+    except Exception:
+        # missing, unreadable or corrupt: rebuild it
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+    return cache.get("manifest")
+
+
+def _write_state_cache(path: Path, cache: Dict[str, Any]) -> None:
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(msgpack.packb(cache, use_bin_type=True))
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except Exception:
+        # The cache only saves time, so carry on without it.
+        pass
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def macro_sql_checksums(manifest: Union[WritableManifest, StateManifest]) -> Dict[str, str]:
+    if isinstance(manifest, StateManifest):
+        return manifest.macro_sql_checksums
+    return {
+        unique_id: macro_sql_checksum(macro.macro_sql)
+        for unique_id, macro in manifest.macros.items()
+    }
 
 
 class PreviousState:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, target_path: Optional[str] = None):
         self.path: Path = path
-        self.manifest: Optional[WritableManifest] = None
+        self.manifest: Optional[Union[WritableManifest, StateManifest]] = None
         self.results: Optional[RunResultsArtifact] = None
 
         manifest_path = self.path / "manifest.json"
         if manifest_path.exists() and manifest_path.is_file():
             try:
                 # we want to bail with an error if schema versions don't match
-                self.manifest = WritableManifest.read_and_check_versions(str(manifest_path))
+                cache_dir = Path(target_path, STATE_CACHE_DIR) if target_path else None
+                self.manifest = StateManifest.read(manifest_path, cache_dir)
             except IncompatibleSchemaException as exc:
                 exc.add_filename(str(manifest_path))
                 raise
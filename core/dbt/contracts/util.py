@@ -1,13 +1,31 @@
+import copy
 import dataclasses
+import json
 import os
 from datetime import datetime
-from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional
-
-from dbt.clients.system import write_json, read_json
+from typing import (
+    Callable,
+    Generic,
+    List,
+    Tuple,
+    ClassVar,
+    Type,
+    TypeVar,
+    Dict,
+    Any,
+    Optional,
+    Iterator,
+    Mapping,
+    Sequence,
+    Union,
+)
+
+from dbt.clients.system import write_json, read_json, write_file_atomic
 from dbt.exceptions import InternalException, RuntimeException, IncompatibleSchemaException
 from dbt.version import __version__
 from dbt.events.functions import get_invocation_id
 from dbt.dataclass_schema import dbtClassMixin
+from dbt.utils import dumps_json_fast, use_orjson
 
 SourceKey = Tuple[str, str]
 
@@ -53,6 +71,160 @@ class Writable:
     def write(self, path: str):
         write_json(path, self.to_dict(omit_none=False))  # type: ignore
 
+    def snapshot(self) -> "ArtifactSnapshot":
+        return ArtifactSnapshot(self.to_dict(omit_none=False), {})  # type: ignore
+
+
+def _is_streamable_item(value: Any) -> bool:
+    if isinstance(value, dbtClassMixin):
+        return True
+    if isinstance(value, list):
+        return all(isinstance(v, (dbtClassMixin, str)) for v in value)
+    return False
+
+
+def _serialize_item(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_serialize_item(v) for v in value]
+    if isinstance(value, dbtClassMixin):
+        return value.to_dict(omit_none=False)
+    return value
+
+
+def _streamable_fields(obj: dbtClassMixin) -> Dict[str, Union[Mapping, Sequence]]:
+    streamable: Dict[str, Union[Mapping, Sequence]] = {}
+    for field in dataclasses.fields(obj):
+        value = getattr(obj, field.name)
+        if isinstance(value, Mapping) and value:
+            if all(isinstance(k, str) and _is_streamable_item(v) for k, v in value.items()):
+                streamable[field.name] = value
+        elif isinstance(value, (list, tuple)) and value:
+            if all(_is_streamable_item(v) for v in value):
+                streamable[field.name] = value
+    return streamable
+
+
+def _split_streamable(
+    obj: dbtClassMixin,
+) -> Tuple[Dict[str, Any], Dict[str, Union[Mapping, Sequence]]]:
+    """Serialize obj without its top-level collections of nodes, results,
+    etc., and return that along with the collections.
+    """
+    streamable = _streamable_fields(obj)
+    shell = copy.copy(obj)
+    for name, value in streamable.items():
+        object.__setattr__(shell, name, {} if isinstance(value, Mapping) else [])
+    data = shell.to_dict(omit_none=False)
+    if any(name not in data for name in streamable):
+        # a field was renamed on serialization, don't try to stream it
+        return obj.to_dict(omit_none=False), {}
+    return data, streamable
+
+
+def _iter_json_chunks(
+    data: Dict[str, Any], streamable: Dict[str, Union[Mapping, Sequence]], serialize_item
+) -> Iterator[str]:
+    # match the output of the encoder used for the values
+    item_sep, key_sep = (",", ":") if use_orjson() else (", ", ": ")
+    yield "{"
+    for idx, (key, value) in enumerate(data.items()):
+        if idx:
+            yield item_sep
+        yield json.dumps(key) + key_sep
+        if key not in streamable:
+            yield dumps_json_fast(value)
+            continue
+        items = streamable[key]
+        if isinstance(items, Mapping):
+            yield "{"
+            for item_idx, (item_key, item) in enumerate(items.items()):
+                prefix = item_sep if item_idx else ""
+                yield f"{prefix}{json.dumps(item_key)}{key_sep}{dumps_json_fast(serialize_item(item))}"
+            yield "}"
+        else:
+            yield "["
+            for item_idx, item in enumerate(items):
+                prefix = item_sep if item_idx else ""
+                yield f"{prefix}{dumps_json_fast(serialize_item(item))}"
+            yield "]"
+    yield "}"
+
+
+def iter_json_chunks(obj: dbtClassMixin) -> Iterator[str]:
+    """Serialize obj to JSON, in chunks.
+
+    The result is the same as serializing obj.to_dict(omit_none=False), but
+    the items of top-level collections of nodes, results, etc. are converted
+    to dicts and encoded one at a time, so the full dict tree and JSON string
+    of a large artifact never have to be held in memory at once.
+    """
+    data, streamable = _split_streamable(obj)
+    return _iter_json_chunks(data, streamable, _serialize_item)
+
+
+class ArtifactSnapshot:
+    """An artifact's top-level fields, serialized, with copies of its
+    collections of nodes, results, etc. Taking one is cheap: the collections
+    are copied, but the items in them are only converted to dicts when the
+    snapshot is written, usually on another thread, one at a time. So items
+    added to or removed from the artifact after the snapshot is taken aren't
+    written, and pending snapshots don't hold the dict trees of their items.
+    The output is the same as the artifact's own write().
+    """
+
+    def __init__(self, data: Dict[str, Any], streamable: Dict[str, Union[Mapping, Sequence]]):
+        self.data = data
+        self.streamable = streamable
+
+    @classmethod
+    def from_artifact(cls, obj: dbtClassMixin) -> "ArtifactSnapshot":
+        data, streamable = _split_streamable(obj)
+        copies: Dict[str, Union[Mapping, Sequence]] = {
+            name: dict(items) if isinstance(items, Mapping) else list(items)
+            for name, items in streamable.items()
+        }
+        return cls(data, copies)
+
+    def write(self, path: str):
+        write_file_atomic(path, _iter_json_chunks(self.data, self.streamable, _serialize_item))
+
+
+V = TypeVar("V")
+
+
+class LazyArtifactMap(Mapping[str, V], Generic[V]):
+    """A read-only mapping of unique IDs to the objects in an artifact. Each
+    object is built from its serialized dict the first time it's looked up,
+    so objects that are never looked up are never built.
+    """
+
+    def __init__(self, raw: Dict[str, Dict[str, Any]], build: Callable[[Dict[str, Any]], V]):
+        self._raw = raw
+        self._build = build
+        self._built: Dict[str, V] = {}
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            return self._built[key]
+        except KeyError:
+            pass
+        value = self._build(self._raw[key])
+        self._built[key] = value
+        return value
+
+    def raw(self, key: str) -> Dict[str, Any]:
+        """The serialized dict of an object, without building it."""
+        return self._raw[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
 
 class AdditionalPropertiesMixin:
     """Make this class an extensible property.
@@ -210,6 +382,11 @@ class VersionedSchema(dbtClassMixin):
                 f'Could not read {cls.__name__} at "{path}" as JSON: {exc}'
             ) from exc
 
+        cls.check_schema_version(data)
+        return cls.from_dict(data)  # type: ignore
+
+    @classmethod
+    def check_schema_version(cls, data: Dict[str, Any]) -> None:
         # Check metadata version. There is a class variable 'dbt_schema_version', but
         # that doesn't show up in artifacts, where it only exists in the 'metadata'
         # dictionary.
@@ -222,8 +399,6 @@ class VersionedSchema(dbtClassMixin):
                         expected=str(cls.dbt_schema_version), found=previous_schema_version
                     )
 
-        return cls.from_dict(data)  # type: ignore
-
 
 T = TypeVar("T", bound="ArtifactMixin")
 
@@ -237,6 +412,13 @@ T = TypeVar("T", bound="ArtifactMixin")
 class ArtifactMixin(VersionedSchema, Writable, Readable):
     metadata: BaseArtifactMetadata
 
+    def write(self, path: str):
+        # artifacts can be very large, so stream them to disk
+        write_file_atomic(path, iter_json_chunks(self))
+
+    def snapshot(self) -> ArtifactSnapshot:
+        return ArtifactSnapshot.from_artifact(self)
+
     @classmethod
     def validate(cls, data):
         super().validate(data)
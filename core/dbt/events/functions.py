@@ -1,12 +1,32 @@
 import colorama
 from colorama import Style
 import dbt.events.functions as this  # don't worry I hate it too.
-from dbt.events.base_types import NoStdOut, Event, NoFile, ShowException, Cache
+from dbt.events.base_types import (
+    NoStdOut,
+    Event,
+    NoFile,
+    ShowException,
+    Cache,
+    TestLevel,
+    DebugLevel,
+    InfoLevel,
+    WarnLevel,
+    ErrorLevel,
+)
+from dbt.events.history import EventHistory
 from dbt.events.types import EventBufferFull, T_Event, MainReportVersion, EmptyLine
 import dbt.flags as flags
 
 # TODO this will need to move eventually
-from dbt.logger import SECRET_ENV_PREFIX, make_log_dir_if_missing, GLOBAL_LOGGER
+from dbt.logger import (
+    SECRET_ENV_PREFIX,
+    make_log_dir_if_missing,
+    GLOBAL_LOGGER,
+    SecretScrubber,
+    build_secret_scrubber,
+    get_secret_scrubber,
+)
+import atexit
 from datetime import datetime
 import json
 import io
@@ -17,19 +37,19 @@ from logging import Logger
 import sys
 from logging.handlers import RotatingFileHandler
 import os
+import queue
 import uuid
 import threading
-from typing import Any, Dict, List, Optional, Union
-from collections import deque
+import traceback
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 global LOG_VERSION
 LOG_VERSION = 2
 
 # create the global event history buffer with the default max size (10k)
-# python 3.7 doesn't support type hints on globals, but mypy requires them. hence the ignore.
 # TODO the flags module has not yet been resolved when this is created
 global EVENT_HISTORY
-EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+EVENT_HISTORY = EventHistory(maxlen=flags.EVENT_BUFFER_SIZE)
 
 # create the global file logger with no configuration
 global FILE_LOG
@@ -50,6 +70,10 @@ format_color = True
 format_json = False
 invocation_id: Optional[str] = None
 
+# the background writer used when async logging is enabled. set up by
+# setup_event_logger and stopped by cleanup_event_logger.
+EVENT_WRITER: Optional["EventWriter"] = None
+
 # Colorama needs some help on windows because we're using logger.info
 # intead of print(). If the Windows env doesn't have a TERM var set,
 # then we should override the logging stream to use the colorama
@@ -62,7 +86,7 @@ if sys.platform == "win32":
 def setup_event_logger(log_path, level_override=None):
     # flags have been resolved, and log_path is known
     global EVENT_HISTORY
-    EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+    EVENT_HISTORY = EventHistory(maxlen=flags.EVENT_BUFFER_SIZE)
 
     make_log_dir_if_missing(log_path)
     this.format_json = flags.LOG_FORMAT == "json"
@@ -105,6 +129,31 @@ def setup_event_logger(log_path, level_override=None):
     this.FILE_LOG.handlers.clear()
     this.FILE_LOG.addHandler(file_handler)
 
+    # (re)start the background writer if events should be written asynchronously
+    cleanup_event_logger()
+    if flags.ASYNC_LOGGING and not flags.ENABLE_LEGACY_LOGGER:
+        this.EVENT_WRITER = EventWriter()
+
+
+# stops the background writer, if there is one, once every queued event has been written
+def cleanup_event_logger() -> None:
+    writer = this.EVENT_WRITER
+    if writer is not None:
+        this.EVENT_WRITER = None
+        writer.close()
+
+
+# make sure queued events are written even if dbt exits without cleaning up
+atexit.register(cleanup_event_logger)
+
+
+# blocks until every queued event has been written. A no-op when events are
+# written synchronously.
+def flush_event_logger() -> None:
+    writer = this.EVENT_WRITER
+    if writer is not None:
+        writer.flush()
+
 
 # used for integration tests
 def capture_stdout_logs() -> StringIO:
@@ -129,18 +178,15 @@ def env_secrets() -> List[str]:
 
 
 def scrub_secrets(msg: str, secrets: List[str]) -> str:
-    scrubbed = msg
-
-    for secret in secrets:
-        scrubbed = scrubbed.replace(secret, "*****")
-
-    return scrubbed
+    return build_secret_scrubber(tuple(secrets)).scrub(msg)
 
 
 # returns a dictionary representation of the event fields.
 # the message may contain secrets which must be scrubbed at the usage site.
 def event_to_serializable_dict(
     e: T_Event,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
 ) -> Dict[str, Any]:
 
     log_line = dict()
@@ -160,13 +206,13 @@ def event_to_serializable_dict(
     event_dict = {
         "type": "log_line",
         "log_version": LOG_VERSION,
-        "ts": get_ts_rfc3339(),
+        "ts": get_ts_rfc3339(ts),
         "pid": e.get_pid(),
         "msg": e.message(),
         "level": e.level_tag(),
         "data": log_line,
         "invocation_id": e.get_invocation_id(),
-        "thread_name": e.get_thread_name(),
+        "thread_name": thread_name or e.get_thread_name(),
         "code": e.code,
     }
 
@@ -175,52 +221,76 @@ def event_to_serializable_dict(
 
 # translates an Event to a completely formatted text-based log line
 # type hinting everything as strings so we don't get any unintentional string conversions via str()
-def create_info_text_log_line(e: T_Event) -> str:
+def create_info_text_log_line(
+    e: T_Event, ts: Optional[datetime] = None, scrubber: Optional[SecretScrubber] = None
+) -> str:
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S")
-    scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
-    log_line: str = f"{color_tag}{ts}  {scrubbed_msg}"
+    ts_str: str = (ts or get_ts()).strftime("%H:%M:%S")
+    scrubbed_msg: str = (scrubber or get_secret_scrubber()).scrub(e.message())
+    log_line: str = f"{color_tag}{ts_str}  {scrubbed_msg}"
     return log_line
 
 
-def create_debug_text_log_line(e: T_Event) -> str:
+def create_debug_text_log_line(
+    e: T_Event,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> str:
     log_line: str = ""
+    ts = ts or get_ts()
     # Create a separator if this is the beginning of an invocation
     if type(e) == MainReportVersion:
         separator = 30 * "="
-        log_line = f"\n\n{separator} {get_ts()} | {get_invocation_id()} {separator}\n"
+        log_line = f"\n\n{separator} {ts} | {get_invocation_id()} {separator}\n"
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S.%f")
-    scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
+    ts_str: str = ts.strftime("%H:%M:%S.%f")
+    scrubbed_msg: str = (scrubber or get_secret_scrubber()).scrub(e.message())
     level: str = e.level_tag() if len(e.level_tag()) == 5 else f"{e.level_tag()} "
     thread = ""
-    if threading.current_thread().name:
+    if thread_name is None:
         thread_name = threading.current_thread().name
+    if thread_name:
         thread_name = thread_name[:10]
         thread_name = thread_name.ljust(10, " ")
         thread = f" [{thread_name}]:"
-    log_line = log_line + f"{color_tag}{ts} [{level}]{thread} {scrubbed_msg}"
+    log_line = log_line + f"{color_tag}{ts_str} [{level}]{thread} {scrubbed_msg}"
     return log_line
 
 
 # translates an Event to a completely formatted json log line
-def create_json_log_line(e: T_Event) -> Optional[str]:
+def create_json_log_line(
+    e: T_Event,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> Optional[str]:
     if type(e) == EmptyLine:
         return None  # will not be sent to logger
     # using preformatted ts string instead of formatting it here to be extra careful about timezone
-    values = event_to_serializable_dict(e)
+    values = event_to_serializable_dict(e, ts=ts, thread_name=thread_name)
     raw_log_line = json.dumps(values, sort_keys=True)
-    return scrub_secrets(raw_log_line, env_secrets())
+    return (scrubber or get_secret_scrubber()).scrub(raw_log_line)
 
 
 # calls create_stdout_text_log_line() or create_json_log_line() according to logger config
-def create_log_line(e: T_Event, file_output=False) -> Optional[str]:
+# ts and thread_name default to now and the current thread. They are passed
+# explicitly when the event is formatted later, on another thread.
+def create_log_line(
+    e: T_Event,
+    file_output=False,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> Optional[str]:
     if this.format_json:
-        return create_json_log_line(e)  # json output, both console and file
+        # json output, both console and file
+        return create_json_log_line(e, ts=ts, thread_name=thread_name, scrubber=scrubber)
     elif file_output is True or flags.DEBUG:
-        return create_debug_text_log_line(e)  # default file output
+        # default file output
+        return create_debug_text_log_line(e, ts=ts, thread_name=thread_name, scrubber=scrubber)
     else:
-        return create_info_text_log_line(e)  # console output
+        return create_info_text_log_line(e, ts=ts, scrubber=scrubber)  # console output
 
 
 # allows for resuse of this obnoxious if else tree.
@@ -265,6 +335,191 @@ def send_exc_to_logger(
         )
 
 
+# debug messages are only shown with --debug, and only errors are shown with --quiet
+def stdout_level_enabled(level_tag: str) -> bool:
+    if level_tag == "debug" and not flags.DEBUG:
+        return False
+    if level_tag != "error" and flags.QUIET:
+        return False
+    return True
+
+
+# the file log is written at the debug level, unless its level was raised.
+# Before setup_event_logger configures it, it has nowhere to write to.
+def file_level_enabled(level_tag: str) -> bool:
+    if not FILE_LOG.isEnabledFor(_LOGGING_LEVELS.get(level_tag, logging.INFO)):
+        return False
+    return any(not isinstance(h, logging.NullHandler) for h in FILE_LOG.handlers)
+
+
+_LEVEL_TAGS = (
+    (TestLevel, "test"),
+    (DebugLevel, "debug"),
+    (InfoLevel, "info"),
+    (WarnLevel, "warn"),
+    (ErrorLevel, "error"),
+)
+
+_LOGGING_LEVELS = {
+    "test": logging.DEBUG,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+def event_enabled(event_type: Type[Event]) -> bool:
+    """Return whether events of this type would be written to the log file or
+    stdout with the current flags and loggers, without constructing one.
+
+    Call sites use this to skip building (and firing) events whose payload is
+    expensive and only used for log output, like NodeFinished. fire_event uses
+    it to skip formatting events that no logger would write, which are only
+    recorded in EVENT_HISTORY.
+    """
+    if issubclass(event_type, Cache) and not flags.LOG_CACHE_EVENTS:
+        return False
+    if flags.ENABLE_LEGACY_LOGGER:
+        return True
+    level_tag = next((tag for cls, tag in _LEVEL_TAGS if issubclass(event_type, cls)), "info")
+    if not issubclass(event_type, NoFile) and file_level_enabled(level_tag):
+        return True
+    if issubclass(event_type, NoStdOut):
+        return False
+    return stdout_level_enabled(level_tag)
+
+
+# formats the lines an event is written to the log file and stdout with, as
+# (to_file, log_line) pairs
+def format_event(
+    e: Event,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+    scrubber: Optional[SecretScrubber] = None,
+) -> List[Tuple[bool, str]]:
+    lines: List[Tuple[bool, str]] = []
+
+    # always logs debug level regardless of user input
+    if not isinstance(e, NoFile) and file_level_enabled(e.level_tag()):
+        log_line = create_log_line(
+            e, file_output=True, ts=ts, thread_name=thread_name, scrubber=scrubber
+        )
+        # doesn't send exceptions to exception logger
+        if log_line:
+            lines.append((True, log_line))
+
+    # explicitly checking the level here so that potentially expensive-to-construct
+    # log messages are not constructed if they are never shown.
+    if not isinstance(e, NoStdOut) and stdout_level_enabled(e.level_tag()):
+        log_line = create_log_line(e, ts=ts, thread_name=thread_name, scrubber=scrubber)
+        if log_line:
+            lines.append((False, log_line))
+
+    return lines
+
+
+# sends an event to the file and stdout loggers, on the thread that fired it
+def write_event(e: Event) -> None:
+    # look up the secrets once for both log lines
+    for to_file, log_line in format_event(e, scrubber=get_secret_scrubber()):
+        if to_file:
+            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
+        elif not isinstance(e, ShowException):
+            send_to_logger(STDOUT_LOG, level_tag=e.level_tag(), log_line=log_line)
+        else:
+            send_exc_to_logger(
+                STDOUT_LOG,
+                level_tag=e.level_tag(),
+                log_line=log_line,
+                exc_info=e.exc_info,
+                stack_info=e.stack_info,
+                extra=e.extra,
+            )
+
+
+# the level tag of a fired event and its formatted log lines, not yet scrubbed
+QueuedEvent = Tuple[str, List[Tuple[bool, str]]]
+
+# the max number of queued events the writer scrubs and writes at once
+EVENT_WRITER_BATCH_SIZE = 1000
+
+# formats the queued log lines without scrubbing them, the writer does that
+_NO_SECRETS = SecretScrubber(())
+
+
+class EventWriter:
+    """Writes events to the file and stdout loggers from a background thread.
+
+    fire_event formats the event's log lines when it's fired, so they show
+    the event's payload (nodes, results, timings) as it was then, and puts
+    them on a queue. The writer thread takes them off the queue in batches of
+    up to `batch_size`, and scrubs and writes them in order, looking up the
+    secret scrubber once per batch. Events are always written in the order
+    they were fired.
+
+    The writer is flushed and stopped by cleanup_event_logger, which is also
+    registered to run at interpreter exit, so queued events are not lost when
+    dbt exits or crashes.
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_size: int = EVENT_WRITER_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, e: Event) -> None:
+        lines = format_event(
+            e, ts=get_ts(), thread_name=threading.current_thread().name, scrubber=_NO_SECRETS
+        )
+        if lines:
+            self.queue.put((e.level_tag(), lines))
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = self._write_batch(batch)
+            for _ in batch:
+                self.queue.task_done()
+
+    def _write_batch(self, batch: List[Any]) -> bool:
+        scrubber = get_secret_scrubber()
+        for item in batch:
+            if item is self._STOP:
+                return True
+            level_tag, lines = item
+            try:
+                for to_file, log_line in lines:
+                    logger = FILE_LOG if to_file else STDOUT_LOG
+                    send_to_logger(logger, level_tag=level_tag, log_line=scrubber.scrub(log_line))
+            except Exception:
+                # there's nowhere to raise this to, and one bad event must
+                # not stop the events after it from being written.
+                traceback.print_exc(file=sys.stderr)
+        return False
+
+    def _on_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def flush(self) -> None:
+        if self._thread.is_alive() and not self._on_writer_thread():
+            self.queue.join()
+
+    def close(self) -> None:
+        if self._thread.is_alive() and not self._on_writer_thread():
+            self.queue.put(self._STOP)
+            self._thread.join()
+
+
 # top-level method for accessing the new eventing system
 # this is where all the side effects happen branched by event type
 # (i.e. - mutating the event history, printing to stdout, logging
@@ -274,7 +529,7 @@ def fire_event(e: Event) -> None:
     if isinstance(e, Cache) and not flags.LOG_CACHE_EVENTS:
         return
 
-    # if and only if the event history deque will be completely filled by this event
+    # if and only if the event history will be completely filled by this event
     # fire warning that old events are now being dropped
     global EVENT_HISTORY
     if len(EVENT_HISTORY) == (flags.EVENT_BUFFER_SIZE - 1):
@@ -292,34 +547,19 @@ def fire_event(e: Event) -> None:
             send_to_logger(GLOBAL_LOGGER, e.level_tag(), log_line)
         return  # exit the function to avoid using the current logger as well
 
-    # always logs debug level regardless of user input
-    if not isinstance(e, NoFile):
-        log_line = create_log_line(e, file_output=True)
-        # doesn't send exceptions to exception logger
-        if log_line:
-            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
-
-    if not isinstance(e, NoStdOut):
-        # explicitly checking the debug flag here so that potentially expensive-to-construct
-        # log messages are not constructed if debug messages are never shown.
-        if e.level_tag() == "debug" and not flags.DEBUG:
-            return  # eat the message in case it was one of the expensive ones
-        if e.level_tag() != "error" and flags.QUIET:
-            return  # eat all non-exception messages in quiet mode
-
-        log_line = create_log_line(e)
-        if log_line:
-            if not isinstance(e, ShowException):
-                send_to_logger(STDOUT_LOG, level_tag=e.level_tag(), log_line=log_line)
-            else:
-                send_exc_to_logger(
-                    STDOUT_LOG,
-                    level_tag=e.level_tag(),
-                    log_line=log_line,
-                    exc_info=e.exc_info,
-                    stack_info=e.stack_info,
-                    extra=e.extra,
-                )
+    if not event_enabled(type(e)):
+        return  # only recorded in the event history
+
+    writer = this.EVENT_WRITER
+    if writer is None:
+        write_event(e)
+    elif isinstance(e, ShowException):
+        # the exception being handled only exists on this thread, so write
+        # this event here, after everything queued before it
+        writer.flush()
+        write_event(e)
+    else:
+        writer.put(e)
 
 
 def get_invocation_id() -> str:
@@ -343,7 +583,7 @@ def get_ts() -> datetime:
 
 
 # preformatted time stamp
-def get_ts_rfc3339() -> str:
-    ts = get_ts()
+def get_ts_rfc3339(ts: Optional[datetime] = None) -> str:
+    ts = ts or get_ts()
     ts_rfc3339 = ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return ts_rfc3339
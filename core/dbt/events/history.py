@@ -0,0 +1,227 @@
+import copy
+import sys
+import threading
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+import msgpack  # type: ignore
+
+from dbt.adapters.reference_keys import _ReferenceKey
+from dbt.events.base_types import Event
+from dbt.helper_types import Lazy
+
+
+# The most recent events are kept as they were fired, so the loggers can
+# still use them (and compute their lazy values) before they're encoded.
+RECENT_EVENTS = 256
+
+# msgpack extension types for the values in events msgpack can't pack itself
+_EXT_LAZY = 1
+_EXT_TUPLE = 2
+_EXT_SET = 3
+_EXT_REFERENCE_KEY = 4
+_EXT_TEXT = 5
+_EXT_KEPT = 6
+
+# A recent event: its interned code and the event. An encoded event: its
+# interned code, class, field names, the msgpack-encoded field values, and
+# the exceptions in them, which are kept as objects rather than encoded.
+RecentRecord = Tuple[str, Event]
+EncodedRecord = Tuple[str, Type[Event], Tuple[str, ...], bytes, Tuple[BaseException, ...]]
+EventRecord = Union[RecentRecord, EncodedRecord]
+
+# every event of a class usually has the same field names, so one tuple of
+# them is shared by all of its records
+_FIELD_NAMES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _pack(value: Any, kept: List[BaseException]) -> bytes:
+    return msgpack.packb(
+        value, default=partial(_default, kept), use_bin_type=True, strict_types=True
+    )
+
+
+def _copy_exception(exc: BaseException) -> Optional[BaseException]:
+    """A copy of the exception without its traceback, context and cause, which
+    reference the frames (and everything in them) it was raised through.
+    """
+    try:
+        copied = copy.copy(exc)
+    except Exception:
+        return None
+    if type(copied) is not type(exc):
+        return None
+    copied.__traceback__ = None
+    copied.__context__ = None
+    copied.__cause__ = None
+    return copied
+
+
+def _default(kept: List[BaseException], obj: Any) -> Any:
+    if isinstance(obj, Lazy):
+        # The deferred function may hold on to the objects the history
+        # shouldn't keep alive, so the value is computed now and kept instead.
+        try:
+            value = obj.force()
+        except Exception:
+            value = None
+        return msgpack.ExtType(_EXT_LAZY, _pack(value, kept))
+    if isinstance(obj, _ReferenceKey):
+        return msgpack.ExtType(_EXT_REFERENCE_KEY, _pack(list(obj), kept))
+    if isinstance(obj, tuple):
+        return msgpack.ExtType(_EXT_TUPLE, _pack(list(obj), kept))
+    if isinstance(obj, (set, frozenset)):
+        return msgpack.ExtType(_EXT_SET, _pack(list(obj), kept))
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, list):
+        return list(obj)
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, BaseException):
+        copied = _copy_exception(obj)
+        if copied is not None:
+            kept.append(copied)
+            return msgpack.ExtType(_EXT_KEPT, _pack(len(kept) - 1, kept))
+    # anything else is kept as its text, not the object
+    return msgpack.ExtType(_EXT_TEXT, str(obj).encode("utf-8"))
+
+
+def _ext_hook(kept: Tuple[BaseException, ...], code: int, data: bytes) -> Any:
+    if code == _EXT_TEXT:
+        return data.decode("utf-8")
+    value = _unpack(data, kept)
+    if code == _EXT_KEPT:
+        return kept[value]
+    if code == _EXT_LAZY:
+        return Lazy(lambda: value, memo=value)
+    if code == _EXT_REFERENCE_KEY:
+        return _ReferenceKey(*value)
+    if code == _EXT_TUPLE:
+        return tuple(value)
+    if code == _EXT_SET:
+        return set(value)
+    return msgpack.ExtType(code, data)
+
+
+def _unpack(data: bytes, kept: Tuple[BaseException, ...]) -> Any:
+    return msgpack.unpackb(
+        data, ext_hook=partial(_ext_hook, kept), raw=False, strict_map_key=False
+    )
+
+
+def _encode(record: EventRecord) -> EventRecord:
+    if len(record) != 2:
+        return record
+    code, e = record  # type: ignore
+    state = vars(e)
+    names = tuple(state)
+    names = _FIELD_NAMES.setdefault(names, names)
+    kept: List[BaseException] = []
+    data = _pack(list(state.values()), kept)
+    return code, type(e), names, data, tuple(kept)
+
+
+def _decode(record: EventRecord) -> Event:
+    if len(record) == 2:
+        return record[1]  # type: ignore
+    _, cls, names, data, kept = record  # type: ignore
+    e = object.__new__(cls)
+    e.__dict__.update(zip(names, _unpack(data, kept)))
+    return e
+
+
+def _record_size(record: EventRecord) -> int:
+    return sys.getsizeof(record) + sum(sys.getsizeof(value) for value in record[1:])
+
+
+class EventHistory:
+    """A fixed-size ring buffer of the most recently fired events.
+
+    Appending an event only stores it. Once an event is older than the
+    RECENT_EVENTS most recent ones, its fields are encoded with msgpack, so
+    the history doesn't keep the nodes, run results and tracebacks they
+    reference alive for the whole run. Lazy values are computed then, and
+    their values kept. Exceptions are kept as copies, without the traceback.
+    Any other value msgpack can't pack is kept as its text. Events are
+    decoded when the history is read: recent events are returned as they
+    were fired, and older ones as copies, with the same types except for
+    those values kept as text.
+
+    Once `maxlen` events are recorded, each new event replaces the oldest one.
+    """
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._records: List[Optional[EventRecord]] = [None] * maxlen
+        self._start = 0
+        self._len = 0
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def append(self, e: Event) -> None:
+        if self.maxlen <= 0:
+            return
+        # `code` is declared as an abstract property on Event, but is a str field on events
+        record: EventRecord = (sys.intern(e.code), e)  # type: ignore
+        size = _record_size(record)
+        with self._lock:
+            idx = (self._start + self._len) % self.maxlen
+            if self._len == self.maxlen:
+                self._nbytes -= _record_size(self._records[idx])  # type: ignore
+                self._start = (self._start + 1) % self.maxlen
+            else:
+                self._len += 1
+            self._records[idx] = record
+            self._nbytes += size
+            if self._len > RECENT_EVENTS:
+                self._encode_at((idx - RECENT_EVENTS) % self.maxlen)
+
+    def _encode_at(self, idx: int) -> None:
+        record = self._records[idx]
+        encoded = _encode(record)  # type: ignore
+        if encoded is not record:
+            self._nbytes += _record_size(encoded) - _record_size(record)  # type: ignore
+            self._records[idx] = encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records = [None] * self.maxlen
+            self._start = 0
+            self._len = 0
+            self._nbytes = 0
+
+    def _snapshot(self) -> List[EventRecord]:
+        with self._lock:
+            records = self._records[self._start :] + self._records[: self._start]
+            return records[: self._len]  # type: ignore
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> Event:
+        with self._lock:
+            if index < 0:
+                index += self._len
+            if not 0 <= index < self._len:
+                raise IndexError("event history index out of range")
+            record = self._records[(self._start + index) % self.maxlen]
+        return _decode(record)  # type: ignore
+
+    def __iter__(self) -> Iterator[Event]:
+        return (_decode(record) for record in self._snapshot())
+
+    def count(self, e: Event) -> int:
+        return sum(
+            1 for record in self._snapshot() if record[0] == e.code and _decode(record) == e
+        )
+
+    def codes(self) -> List[str]:
+        """The codes of the recorded events, oldest first, without decoding them."""
+        return [record[0] for record in self._snapshot()]
+
+    def memory_usage(self) -> int:
+        """The approximate number of bytes used by the history. Recent events
+        are counted by the size of the event objects alone.
+        """
+        return sys.getsizeof(self._records) + self._nbytes
@@ -2,7 +2,7 @@ from dbt.helper_types import Lazy
 from mashumaro import DataClassDictMixin
 from mashumaro.config import BaseConfig as MashBaseConfig
 from mashumaro.types import SerializationStrategy
-from typing import Dict, List
+from typing import Any, Dict, List
 
 
 # The dbtClassMixin serialization class has a DateTime serialization strategy
@@ -41,6 +41,16 @@ class LazySerialization1(SerializationStrategy):
         raise Exception("Don't deserialize into a Lazy value. Try just using the value itself.")
 
 
+# The serializer for Lazy[Dict[str, Any]], used for large payloads that are only
+# needed when an event is serialized, like the run result of NodeFinished.
+class LazySerialization2(SerializationStrategy):
+    def serialize(self, value) -> Dict[str, Any]:
+        return value.force()
+
+    def deserialize(self, value):
+        raise Exception("Don't deserialize into a Lazy value. Try just using the value itself.")
+
+
 # This class is the equivalent of dbtClassMixin that's used for serialization
 # in other parts of the code. That class did extra things which we didn't want
 # to use for events, so this class is a simpler version of dbtClassMixin.
@@ -52,4 +62,5 @@ class EventSerialization(DataClassDictMixin):
             Exception: ExceptionSerialization(),
             BaseException: ExceptionSerialization(),
             Lazy[Dict[str, List[str]]]: LazySerialization1(),
+            Lazy[Dict[str, Any]]: LazySerialization2(),
         }
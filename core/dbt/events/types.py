@@ -801,11 +801,11 @@ class PartialParsingExceptionFile(DebugLevel):
 
 @dataclass
 class PartialParsingFile(DebugLevel):
-    file_dict: Dict
+    file_dict: Lazy[Dict[str, Any]]
     code: str = "I015"
 
     def message(self) -> str:
-        return f"PP file: {self.file_dict}"
+        return f"PP file: {self.file_dict.force()}"
 
 
 @dataclass
@@ -1089,15 +1089,6 @@ class PartialParsingMissingNodes(DebugLevel):
         return f"No nodes found for source file {self.file_id}"
 
 
-@dataclass
-class PartialParsingChildMapMissingUniqueID(DebugLevel):
-    unique_id: str
-    code: str = "I046"
-
-    def message(self) -> str:
-        return f"Partial parsing: {self.unique_id} not found in child_map"
-
-
 @dataclass
 class PartialParsingUpdateSchemaFile(DebugLevel):
     file_id: str
@@ -1143,6 +1134,39 @@ class InvalidRefInTestNode(DebugLevel):
         return self.msg
 
 
+@dataclass
+class SchemaFilesLoaded(DebugLevel):
+    path_count: int
+    loader: str
+    processes: int
+    elapsed: float
+    code: str = "I052"
+
+    def message(self) -> str:
+        files = pluralize(self.path_count, "schema file")
+        processes = "1 process" if self.processes == 1 else f"{self.processes} processes"
+        return (
+            f"Loaded the yaml in {files} with the {self.loader} loader, in {processes}, "
+            f"in {self.elapsed:.2f}s"
+        )
+
+
+@dataclass
+class SlowYamlLoader(WarnLevel):
+    path_count: int
+    elapsed: float
+    code: str = "I053"
+
+    def message(self) -> str:
+        files = pluralize(self.path_count, "schema file")
+        return ui.warning_tag(
+            "PyYAML was installed without libyaml, so yaml is loaded with its "
+            "pure-Python loader, which is about ten times slower. Loading the yaml in "
+            f"{files} took {self.elapsed:.2f}s. Reinstall PyYAML with libyaml available "
+            "to parse faster."
+        )
+
+
 @dataclass
 class RunningOperationCaughtError(ErrorLevel):
     exc: Exception
@@ -1486,6 +1510,28 @@ class BuildingCatalog(InfoLevel):
         return "Building catalog"
 
 
+@dataclass
+class IncrementalCatalogUnavailable(WarnLevel):
+    reason: str
+    code: str = "E045"
+
+    def message(self) -> str:
+        return f"Cannot build the catalog incrementally: {self.reason}. Building the full catalog"
+
+
+@dataclass
+class IncrementalCatalogPlan(InfoLevel):
+    num_reused: int
+    num_queried: int
+    code: str = "E046"
+
+    def message(self) -> str:
+        return (
+            f"Reusing the previous catalog for {pluralize(self.num_reused, 'schema')}, "
+            f"querying {pluralize(self.num_queried, 'changed schema')}"
+        )
+
+
 @dataclass
 class CompileComplete(InfoLevel):
     code: str = "Q002"
@@ -2075,8 +2121,9 @@ class NodeStart(DebugLevel, NodeInfo):
 @dataclass
 class NodeFinished(DebugLevel, NodeInfo):
     unique_id: str
-    # The following isn't a RunResult class because we run into circular imports
-    run_result: Dict[str, Any]
+    # The following isn't a RunResult class because we run into circular imports.
+    # It's lazy because it's only needed when the event is serialized (json logs).
+    run_result: Lazy[Dict[str, Any]]
     code: str = "Q024"
 
     def message(self) -> str:
@@ -2293,6 +2340,15 @@ class WritingInjectedSQLForNode(DebugLevel):
         return f'Writing injected SQL for node "{self.unique_id}"'
 
 
+@dataclass
+class ReusingCompiledSQL(DebugLevel):
+    unique_id: str
+    code: str = "Q036"
+
+    def message(self) -> str:
+        return f"Reusing the cached compiled SQL of {self.unique_id}"
+
+
 @dataclass
 class DisableTracking(WarnLevel):
     code: str = "Z039"
@@ -2384,6 +2440,26 @@ class EventBufferFull(WarnLevel):
         return "Internal event buffer full. Earliest events will be dropped (FIFO)."
 
 
+@dataclass
+class EventHistorySize(DebugLevel):
+    num_events: int
+    num_bytes: int
+    code: str = "Z049"
+
+    def message(self) -> str:
+        return f"Internal event buffer holds {self.num_events} events in {self.num_bytes} bytes"
+
+
+@dataclass
+class ArtifactWriteFailed(ErrorLevel):
+    path: str
+    exc: str
+    code: str = "Z050"
+
+    def message(self) -> str:
+        return f"Could not write {self.path}: {self.exc}"
+
+
 @dataclass
 class RecordRetryException(DebugLevel):
     exc: Exception
@@ -2488,7 +2564,7 @@ if 1 == 0:
     GenericTestFileParse(path="")
     MacroFileParse(path="")
     PartialParsingFullReparseBecauseOfError()
-    PartialParsingFile(file_dict={})
+    PartialParsingFile(file_dict=Lazy.defer(lambda: {}))
     PartialParsingExceptionFile(file="")
     PartialParsingException(exc_info={})
     PartialParsingSkipParsing()
@@ -2517,12 +2593,13 @@ if 1 == 0:
     PartialParsingUpdatedFile(file_id="")
     PartialParsingNodeMissingInSourceFile(source_file="")
     PartialParsingMissingNodes(file_id="")
-    PartialParsingChildMapMissingUniqueID(unique_id="")
     PartialParsingUpdateSchemaFile(file_id="")
     PartialParsingDeletedSource(unique_id="")
     PartialParsingDeletedExposure(unique_id="")
     InvalidDisabledSourceInTestNode(msg="")
     InvalidRefInTestNode(msg="")
+    SchemaFilesLoaded(path_count=0, loader="", processes=0, elapsed=0.0)
+    SlowYamlLoader(path_count=0, elapsed=0.0)
     RunningOperationCaughtError(exc=Exception(""))
     RunningOperationUncaughtError(exc=Exception(""))
     DbtProjectError()
@@ -2714,7 +2791,7 @@ if 1 == 0:
     PrintCancelLine(conn_name="")
     DefaultSelector(name="")
     NodeStart(node_info={}, unique_id="")
-    NodeFinished(node_info={}, unique_id="", run_result={})
+    NodeFinished(node_info={}, unique_id="", run_result=Lazy.defer(lambda: {}))
     QueryCancelationUnsupported(type="")
     ConcurrencyLine(num_threads=0, target_name="")
     NodeCompiling(node_info={}, unique_id="")
@@ -2736,6 +2813,7 @@ if 1 == 0:
     FoundStats(stat_line="")
     CompilingNode(unique_id="")
     WritingInjectedSQLForNode(unique_id="")
+    ReusingCompiledSQL(unique_id="")
     DisableTracking()
     SendingEvent(kwargs="")
     SendEventFailure()
@@ -2746,4 +2824,6 @@ if 1 == 0:
     GeneralWarningMsg(msg="", log_fmt="")
     GeneralWarningException(exc=Exception(""), log_fmt="")
     EventBufferFull()
+    EventHistorySize(num_events=0, num_bytes=0)
+    ArtifactWriteFailed(path="", exc="")
     RecordRetryException(exc=Exception(""))
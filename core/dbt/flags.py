@@ -35,6 +35,10 @@ INDIRECT_SELECTION = None
 LOG_CACHE_EVENTS = None
 EVENT_BUFFER_SIZE = 100000
 QUIET = None
+ASYNC_LOGGING = None
+BLOCKING_ARTIFACT_WRITES = None
+COMPILED_SQL_CACHE = None
+FAST_JSON_ARTIFACTS = None
 
 # Global CLI defaults. These flags are set from three places:
 # CLI args, environment variables, and user_config (profiles.yml).
@@ -57,6 +61,10 @@ flag_defaults = {
     "LOG_CACHE_EVENTS": False,
     "EVENT_BUFFER_SIZE": 100000,
     "QUIET": False,
+    "ASYNC_LOGGING": False,
+    "BLOCKING_ARTIFACT_WRITES": False,
+    "COMPILED_SQL_CACHE": False,
+    "FAST_JSON_ARTIFACTS": False,
 }
 
 
@@ -88,6 +96,11 @@ MACRO_DEBUGGING = env_set_truthy("DBT_MACRO_DEBUGGING")
 DEFER_MODE = env_set_truthy("DBT_DEFER_TO_STATE")
 ARTIFACT_STATE_PATH = env_set_path("DBT_ARTIFACT_STATE_PATH")
 ENABLE_LEGACY_LOGGER = env_set_truthy("DBT_ENABLE_LEGACY_LOGGER")
+# validate compiled nodes against their json schema; slow, for debugging only
+VALIDATE_COMPILED_NODES = env_set_truthy("DBT_VALIDATE_COMPILED_NODES")
+# validate the nodes parsers build against their json schema; slow, for
+# debugging only. Their configs are always validated.
+VALIDATE_PARSED_NODES = env_set_truthy("DBT_VALIDATE_PARSED_NODES")
 
 
 def _get_context():
@@ -106,7 +119,8 @@ def set_from_args(args, user_config):
     global STRICT_MODE, FULL_REFRESH, WARN_ERROR, USE_EXPERIMENTAL_PARSER, STATIC_PARSER
     global WRITE_JSON, PARTIAL_PARSE, USE_COLORS, STORE_FAILURES, PROFILES_DIR, DEBUG, LOG_FORMAT
     global INDIRECT_SELECTION, VERSION_CHECK, FAIL_FAST, SEND_ANONYMOUS_USAGE_STATS
-    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET
+    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET, ASYNC_LOGGING
+    global BLOCKING_ARTIFACT_WRITES, COMPILED_SQL_CACHE, FAST_JSON_ARTIFACTS
 
     STRICT_MODE = False  # backwards compatibility
     # cli args without user_config or env var option
@@ -132,6 +146,10 @@ def set_from_args(args, user_config):
     LOG_CACHE_EVENTS = get_flag_value("LOG_CACHE_EVENTS", args, user_config)
     EVENT_BUFFER_SIZE = get_flag_value("EVENT_BUFFER_SIZE", args, user_config)
     QUIET = get_flag_value("QUIET", args, user_config)
+    ASYNC_LOGGING = get_flag_value("ASYNC_LOGGING", args, user_config)
+    BLOCKING_ARTIFACT_WRITES = get_flag_value("BLOCKING_ARTIFACT_WRITES", args, user_config)
+    COMPILED_SQL_CACHE = get_flag_value("COMPILED_SQL_CACHE", args, user_config)
+    FAST_JSON_ARTIFACTS = get_flag_value("FAST_JSON_ARTIFACTS", args, user_config)
 
 
 def get_flag_value(flag, args, user_config):
@@ -185,4 +203,8 @@ def get_flag_dict():
         "log_cache_events": LOG_CACHE_EVENTS,
         "event_buffer_size": EVENT_BUFFER_SIZE,
         "quiet": QUIET,
+        "async_logging": ASYNC_LOGGING,
+        "blocking_artifact_writes": BLOCKING_ARTIFACT_WRITES,
+        "compiled_sql_cache": COMPILED_SQL_CACHE,
+        "fast_json_artifacts": FAST_JSON_ARTIFACTS,
     }
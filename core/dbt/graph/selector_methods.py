@@ -1,7 +1,19 @@
 import abc
 from itertools import chain
 from pathlib import Path
-from typing import Set, List, Dict, Iterator, Tuple, Any, Union, Type, Optional, Callable
+from typing import (
+    Set,
+    List,
+    Dict,
+    Iterator,
+    Tuple,
+    Any,
+    Union,
+    Type,
+    Optional,
+    Callable,
+    Container,
+)
 
 from dbt.dataclass_schema import StrEnum
 
@@ -13,7 +25,7 @@ from dbt.contracts.graph.compiled import (
     CompileResultNode,
     ManifestNode,
 )
-from dbt.contracts.graph.manifest import Manifest, WritableManifest
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import (
     HasTestMetadata,
     ParsedSingularTestNode,
@@ -22,7 +34,7 @@ from dbt.contracts.graph.parsed import (
     ParsedGenericTestNode,
     ParsedSourceDefinition,
 )
-from dbt.contracts.state import PreviousState
+from dbt.contracts.state import PreviousState, macro_sql_checksum, macro_sql_checksums
 from dbt.exceptions import (
     InternalException,
     RuntimeException,
@@ -396,19 +408,18 @@ class StateSelectorMethod(SelectorMethod):
         # we checked in the caller!
         if self.previous_state is None or self.previous_state.manifest is None:
             raise InternalException("No comparison manifest in _macros_modified")
-        old_macros = self.previous_state.manifest.macros
+        old_macros = macro_sql_checksums(self.previous_state.manifest)
         new_macros = self.manifest.macros
 
         modified = []
         for uid, macro in new_macros.items():
             if uid in old_macros:
-                old_macro = old_macros[uid]
-                if macro.macro_sql != old_macro.macro_sql:
+                if macro_sql_checksum(macro.macro_sql) != old_macros[uid]:
                     modified.append(uid)
             else:
                 modified.append(uid)
 
-        for uid, macro in old_macros.items():
+        for uid in old_macros:
             if uid not in new_macros:
                 modified.append(uid)
 
@@ -497,7 +508,20 @@ class StateSelectorMethod(SelectorMethod):
                 f'Got an invalid selector "{selector}", expected one of ' f'"{list(state_checks)}"'
             )
 
-        manifest: WritableManifest = self.previous_state.manifest
+        manifest = self.previous_state.manifest
+        sections: List[Container[str]] = [
+            manifest.nodes,
+            manifest.sources,
+            manifest.exposures,
+            manifest.metrics,
+        ]
+
+        if selector == "new":
+            # only whether a node existed matters, so don't build the old ones
+            for node, _ in self.all_nodes(included_nodes):
+                if not any(node in section for section in sections):
+                    yield node
+            return
 
         for node, real_node in self.all_nodes(included_nodes):
             previous_node: Optional[SelectorTarget] = None
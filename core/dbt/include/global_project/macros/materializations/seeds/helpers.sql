@@ -80,9 +80,15 @@
 
 {% macro default__load_csv_rows(model, agate_table) %}
 
-  {% set batch_size = get_batch_size() %}
-
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+  {# Use the adapter's bulk loader if it has one #}
+  {% set bulk_sql = adapter.load_seed_bulk(this, agate_table, cols_sql) %}
+  {% if bulk_sql is not none %}
+    {{ return(bulk_sql) }}
+  {% endif %}
+
+  {% set batch_size = get_batch_size() %}
   {% set bindings = [] %}
 
   {% set statements = [] %}
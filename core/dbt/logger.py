@@ -4,12 +4,14 @@ import dbt.ui
 import json
 import logging
 import os
+import re
 import sys
 import time
 import warnings
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, ContextManager, Callable, Dict, Any, Set
+from functools import lru_cache
+from typing import Optional, List, ContextManager, Callable, Dict, Any, Set, Tuple
 
 import colorama
 import logbook
@@ -39,6 +41,53 @@ def get_secret_env() -> List[str]:
     return [v for k, v in os.environ.items() if k.startswith(SECRET_ENV_PREFIX)]
 
 
+class SecretScrubber:
+    """Replaces every occurrence of a set of secrets in a string with "*****".
+
+    All the secrets are compiled into a single regex alternation, so a message
+    is scanned once no matter how many secrets there are. Longer secrets are
+    tried first, so a secret that contains another one is replaced whole.
+    Empty secrets are ignored.
+    """
+
+    def __init__(self, secrets: Tuple[str, ...]):
+        self.secrets = tuple(sorted({s for s in secrets if s}, key=lambda s: (-len(s), s)))
+        self._pattern: Optional["re.Pattern[str]"] = None
+        if self.secrets:
+            self._pattern = re.compile("|".join(re.escape(s) for s in self.secrets))
+
+    def scrub(self, msg: str) -> str:
+        if self._pattern is None:
+            return msg
+        return self._pattern.sub("*****", msg)
+
+
+@lru_cache(maxsize=8)
+def build_secret_scrubber(secrets: Tuple[str, ...]) -> SecretScrubber:
+    return SecretScrubber(secrets)
+
+
+# a snapshot of the environment and the scrubber for the secrets in it
+_SECRET_SCRUBBER_CACHE: Optional[Tuple[Dict[Any, Any], SecretScrubber]] = None
+
+
+# Scanning the whole environment for secrets is comparatively slow, and this
+# is called for every log line. The cached scrubber is reused as long as the
+# environment is the same as when it was built. That's checked by comparing
+# the environment's underlying dict to a copy of it, which doesn't decode
+# every variable the way os.environ.items() does.
+def get_secret_scrubber() -> SecretScrubber:
+    global _SECRET_SCRUBBER_CACHE
+    environ = getattr(os.environ, "_data", None)
+    cached = _SECRET_SCRUBBER_CACHE
+    if cached is not None and environ is not None and cached[0] == environ:
+        return cached[1]
+    scrubber = build_secret_scrubber(tuple(get_secret_env()))
+    if environ is not None:
+        _SECRET_SCRUBBER_CACHE = (dict(environ), scrubber)
+    return scrubber
+
+
 ExceptionInformation = str
 
 
@@ -321,8 +370,9 @@ class TimestampNamed(logbook.Processor):
 
 class ScrubSecrets(logbook.Processor):
     def process(self, record):
-        for secret in get_secret_env():
-            record.message = str(record.message).replace(secret, "*****")
+        scrubber = get_secret_scrubber()
+        if scrubber.secrets:
+            record.message = scrubber.scrub(str(record.message))
 
 
 logger = logbook.Logger("dbt")
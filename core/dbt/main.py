@@ -10,7 +10,8 @@ from contextlib import contextmanager
 from pathlib import Path
 
 import dbt.version
-from dbt.events.functions import fire_event, setup_event_logger
+import dbt.events.functions as event_funcs
+from dbt.events.functions import fire_event, setup_event_logger, cleanup_event_logger
 from dbt.events.types import (
     MainEncounteredError,
     MainKeyboardInterrupt,
@@ -18,6 +19,7 @@ from dbt.events.types import (
     MainReportArgs,
     MainTrackingUserState,
     MainStackTrace,
+    EventHistorySize,
 )
 import dbt.flags as flags
 import dbt.task.build as build_task
@@ -38,6 +40,7 @@ import dbt.task.snapshot as snapshot_task
 import dbt.task.test as test_task
 from dbt.profiler import profiler
 from dbt.adapters.factory import reset_adapters, cleanup_connections
+from dbt.task.artifacts import wait_for_artifacts
 
 import dbt.tracking
 
@@ -146,6 +149,10 @@ def main(args=None):
             fire_event(MainStackTrace(stack_trace=traceback.format_exc()))
             exit_code = ExitCodes.UnhandledError.value
 
+        finally:
+            # write out any events still queued by async logging
+            cleanup_event_logger()
+
     sys.exit(exit_code)
 
 
@@ -188,8 +195,15 @@ def handle_and_check(args):
 
             with adapter_management():
 
-                task, res = run_from_args(parsed)
-                success = task.interpret_results(res)
+                # artifacts are written in the background
+                try:
+                    task, res = run_from_args(parsed)
+                    success = task.interpret_results(res)
+                except BaseException:
+                    # don't let an error writing an artifact replace this one
+                    wait_for_artifacts(raise_errors=False)
+                    raise
+                wait_for_artifacts()
 
             return res, success
 
@@ -236,9 +250,22 @@ def run_from_args(parsed):
 
     with track_run(task):
         results = task.run()
+
+    history = event_funcs.EVENT_HISTORY
+    fire_event(EventHistorySize(num_events=len(history), num_bytes=history.memory_usage()))
     return task, results
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def _build_base_subparser():
     base_subparser = argparse.ArgumentParser(add_help=False)
 
@@ -561,6 +588,25 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         """,
     )
+    generate_sub.add_argument(
+        "--catalog-chunk-size",
+        type=_positive_int,
+        default=None,
+        help="""
+        Split the catalog query for each database into chunks of at most this
+        many schemas, and run them in parallel across threads. By default,
+        each database is queried once for all of its schemas.
+        """,
+    )
+    generate_sub.add_argument(
+        "--incremental-catalog",
+        action="store_true",
+        help="""
+        Reuse the catalog.json in the --state directory for every schema
+        whose nodes and sources are unchanged compared to the --state
+        manifest, and only query the remaining schemas.
+        """,
+    )
     return generate_sub
 
 
@@ -1002,6 +1048,19 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_optional_argument_inverse(
+        "--compiled-sql-cache",
+        enable_help="""
+        Reuse the compiled SQL of nodes whose inputs haven't changed since
+        they were last compiled, from a cache in the target directory. Off by
+        default. This overrides the user configuration file.
+        """,
+        disable_help="""
+        Always compile every node's SQL (the default). This overrides the user
+        configuration file.
+        """,
+    )
+
     # if set, run dbt in single-threaded mode: thread count is ignored, and
     # calls go through `map` instead of the thread pool. This is useful for
     # getting performance information about aspects of dbt that normally run in
@@ -1088,6 +1147,38 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--async-logging",
+        action="store_true",
+        default=None,
+        help="""
+        Format and write log events on a background thread, in batches,
+        instead of on the thread that fired them.
+        """,
+    )
+
+    p.add_argument(
+        "--blocking-artifact-writes",
+        action="store_true",
+        default=None,
+        help="""
+        Write artifacts like manifest.json and run_results.json before
+        moving on, instead of in the background.
+        """,
+    )
+
+    p.add_argument(
+        "--fast-json-artifacts",
+        action="store_true",
+        default=None,
+        help="""
+        Write JSON artifacts with orjson, if it's installed (`pip install
+        dbt-core[fast-json]`). This is faster, but the output isn't byte for
+        byte the same: it has no whitespace after separators, doesn't escape
+        non-ASCII characters, and writes NaN and infinite floats as null.
+        """,
+    )
+
     subs = p.add_subparsers(title="Available sub-commands")
 
     base_subparser = _build_base_subparser()
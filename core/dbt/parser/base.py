@@ -20,6 +20,7 @@ from dbt.contracts.graph.parsed import HasUniqueID, ManifestNodes
 from dbt.contracts.graph.unparsed import UnparsedNode
 from dbt.exceptions import ParsingException, validator_error_message, InternalException
 from dbt import hooks
+from dbt import flags
 from dbt.node_types import NodeType
 from dbt.parser.search import FileBlock
 
@@ -210,7 +211,9 @@ class ConfiguredParser(
         }
         dct.update(kwargs)
         try:
-            return self.parse_from_dict(dct, validate=True)
+            # The dict is built here, and its config was validated when it was
+            # built, so only validate the whole node in strict mode.
+            return self.parse_from_dict(dct, validate=flags.VALIDATE_PARSED_NODES)
         except ValidationError as exc:
             msg = validator_error_message(exc)
             # this is a bit silly, but build an UnparsedNode just for error
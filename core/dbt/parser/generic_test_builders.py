@@ -25,6 +25,80 @@ from dbt.exceptions import raise_compiler_error, raise_parsing_error
 from dbt.parser.search import FileBlock
 
 
+# Generic tests whose refs, sources and config can be read from their kwargs
+# without rendering them with Jinja. None of these test macros call ref(),
+# source() or config() themselves, so the only refs and sources a test has are
+# its `model`, and the kwargs listed here, which must each be a single ref() or
+# source() call (like the `to` kwarg of `relationships`). Keyed by the unique
+# ID of the test macro, so a test macro that's overridden in a project or
+# package is rendered as usual. Packages and plugins add their own tests with
+# register_static_generic_test.
+_STATIC_GENERIC_TESTS: Dict[str, Tuple[str, ...]] = {
+    "macro.dbt.test_not_null": (),
+    "macro.dbt.test_unique": (),
+    "macro.dbt.test_accepted_values": (),
+    "macro.dbt.test_relationships": ("to",),
+}
+
+
+def register_static_generic_test(macro_unique_id: str, relation_kwargs: Tuple[str, ...] = ()):
+    """Let the tests of a generic test macro be parsed without rendering them.
+
+    Only register test macros that don't call ref(), source() or config()
+    themselves. If the macro, or a macro it calls, does anyway, its tests are
+    rendered as usual. relation_kwargs are the names of the kwargs that refer
+    to other relations, as a ref() or source() call.
+    """
+    _STATIC_GENERIC_TESTS[macro_unique_id] = tuple(relation_kwargs)
+
+
+def get_static_generic_test(macro_unique_id: str) -> Optional[Tuple[str, ...]]:
+    """The relation kwargs of a registered static generic test, or None if
+    the test macro isn't registered.
+    """
+    return _STATIC_GENERIC_TESTS.get(macro_unique_id)
+
+
+_STRING_LITERAL = r"""(?:'[^'\\{}]*'|"[^"\\{}]*")"""
+STATIC_RELATION_PATTERN = re.compile(
+    rf"^\s*(?P<func>ref|source)\s*\("
+    rf"(?P<args>\s*{_STRING_LITERAL}\s*(?:,\s*{_STRING_LITERAL}\s*)?)\)\s*$"
+)
+STRING_LITERAL_PATTERN = re.compile(_STRING_LITERAL)
+# a call that a static generic test macro must not make
+MACRO_RELATION_CALL_PATTERN = re.compile(r"\b(?:ref|source|config)\s*\(")
+# kwargs that look like this are rendered as Jinja (see add_rendered_test_kwargs)
+RENDERED_KWARG_PATTERN = re.compile(r"{[{%#]|^\s*(env_var|ref|var|source|doc)\s*\(.+\)\s*$")
+
+
+def extract_static_relation(value: Any) -> Optional[Tuple[str, List[str]]]:
+    """If value is a single ref() or source() call with string literal
+    arguments, return the function name and its arguments. Otherwise, return
+    None.
+    """
+    if not isinstance(value, str):
+        return None
+    match = STATIC_RELATION_PATTERN.match(value)
+    if match is None:
+        return None
+    func = match.group("func")
+    args = [arg[1:-1] for arg in STRING_LITERAL_PATTERN.findall(match.group("args"))]
+    if func == "source" and len(args) != 2:
+        return None
+    return func, args
+
+
+def is_static_kwarg(value: Any) -> bool:
+    """Return True if rendering this test kwarg can't call any macros."""
+    if isinstance(value, str):
+        return RENDERED_KWARG_PATTERN.search(value) is None
+    elif isinstance(value, dict):
+        return all(is_static_kwarg(k) and is_static_kwarg(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return all(is_static_kwarg(v) for v in value)
+    return True
+
+
 def get_nice_generic_test_name(
     test_type: str, test_name: str, args: Dict[str, Any]
 ) -> Tuple[str, str]:
@@ -380,6 +454,8 @@ class TestBuilder(Generic[Testable]):
             config["database"] = self.database
         if self.schema is not None:
             config["schema"] = self.schema
+        if "tags" in self.config:
+            config["tags"] = self.tags()
         return config
 
     def tags(self) -> List[str]:
@@ -1,4 +1,4 @@
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
 import jinja2
 
@@ -33,14 +33,12 @@ class MacroParser(BaseParser[ParsedMacro]):
     def get_compiled_path(cls, block: FileBlock):
         return block.path.relative_path
 
-    def parse_macro(
-        self, block: jinja.BlockTag, base_node: UnparsedMacro, name: str
-    ) -> ParsedMacro:
+    def parse_macro(self, macro_sql: str, base_node: UnparsedMacro, name: str) -> ParsedMacro:
         unique_id = self.generate_unique_id(name)
 
         return ParsedMacro(
             path=base_node.path,
-            macro_sql=block.full_block,
+            macro_sql=macro_sql,
             original_file_path=base_node.original_file_path,
             package_name=base_node.package_name,
             root_path=base_node.root_path,
@@ -49,22 +47,29 @@ class MacroParser(BaseParser[ParsedMacro]):
             unique_id=unique_id,
         )
 
-    def parse_unparsed_macros(self, base_node: UnparsedMacro) -> Iterable[ParsedMacro]:
+    def find_macros(self, base_node: UnparsedMacro) -> List[Tuple[str, int, int]]:
+        """Return the name of each macro in base_node.raw_sql, and where its
+        SQL starts and ends.
+        """
         try:
-            blocks: List[jinja.BlockTag] = [
-                t
-                for t in jinja.extract_toplevel_blocks(
-                    base_node.raw_sql,
-                    allowed_blocks={"macro", "materialization", "test"},
-                    collect_raw_data=False,
-                )
-                if isinstance(t, jinja.BlockTag)
-            ]
+            # the raw data between blocks is collected only to find where
+            # each block starts
+            blocks: List[Tuple[jinja.BlockTag, int]] = []
+            end = 0
+            for t in jinja.extract_toplevel_blocks(
+                base_node.raw_sql,
+                allowed_blocks={"macro", "materialization", "test"},
+                collect_raw_data=True,
+            ):
+                if isinstance(t, jinja.BlockTag):
+                    blocks.append((t, end))
+                end += len(t.full_block)
         except ParsingException as exc:
             exc.add_node(base_node)
             raise
 
-        for block in blocks:
+        macros: List[Tuple[str, int, int]] = []
+        for block, start in blocks:
             try:
                 ast = jinja.parse(block.full_block)
             except ParsingException as e:
@@ -86,8 +91,16 @@ class MacroParser(BaseParser[ParsedMacro]):
                 continue
 
             name: str = macro_name.replace(MACRO_PREFIX, "")
-            node = self.parse_macro(block, base_node, name)
-            yield node
+            macros.append((name, start, start + len(block.full_block)))
+        return macros
+
+    def parse_unparsed_macros(
+        self, base_node: UnparsedMacro, macros: Optional[List[Tuple[str, int, int]]] = None
+    ) -> Iterable[ParsedMacro]:
+        if macros is None:
+            macros = self.find_macros(base_node)
+        for name, start, end in macros:
+            yield self.parse_macro(base_node.raw_sql[start:end], base_node, name)
 
     def parse_file(self, block: FileBlock):
         assert isinstance(block.file, SourceFile)
@@ -106,5 +119,13 @@ class MacroParser(BaseParser[ParsedMacro]):
             resource_type=NodeType.Macro,
         )
 
-        for node in self.parse_unparsed_macros(base_node):
+        # Finding the macros means parsing each one, which only depends on the
+        # file's contents, so it's saved by the file's checksum.
+        macro_blocks = self.manifest.macro_parse_cache.macro_blocks
+        macros = macro_blocks.get(source_file.checksum.checksum)
+        if macros is None:
+            macros = self.find_macros(base_node)
+            macro_blocks[source_file.checksum.checksum] = macros
+
+        for node in self.parse_unparsed_macros(base_node, macros):
             self.manifest.add_macro(block.file, node)
@@ -1,10 +1,26 @@
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
+import json
 import os
+import re
 import traceback
-from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple
+from typing import (
+    Dict,
+    Optional,
+    Mapping,
+    MutableMapping,
+    Callable,
+    Any,
+    List,
+    Set,
+    Type,
+    Union,
+    Tuple,
+    Iterator,
+)
 from itertools import chain
+from functools import partial
 import time
 
 import dbt.exceptions
@@ -16,8 +32,8 @@ from dbt.adapters.factory import (
     get_relation_class_by_name,
     get_adapter_package_names,
 )
-from dbt.helper_types import PathSet
-from dbt.events.functions import fire_event, get_invocation_id
+from dbt.helper_types import Lazy, PathSet
+from dbt.events.functions import event_enabled, fire_event, get_invocation_id
 from dbt.events.types import (
     PartialParsingFullReparseBecauseOfError,
     PartialParsingExceptionFile,
@@ -41,16 +57,16 @@ from dbt.events.types import (
 )
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType
-from dbt.clients.jinja import get_rendered, MacroStack
-from dbt.clients.jinja_static import statically_extract_macro_calls
+from dbt.clients.jinja import get_rendered, has_render_chars, MacroStack
+from dbt.clients.jinja_static import resolve_static_macro_calls, statically_find_macro_calls
 from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
-from dbt.context.docs import generate_runtime_docs_context
+from dbt.context.docs import DocsRuntimeContexts, generate_runtime_docs_context
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
-from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
-from dbt.parser.read_files import read_files, load_source_file
+from dbt.contracts.files import AnySourceFile, FileHash, ParseFileType, SchemaSourceFile
+from dbt.parser.read_files import read_files, load_schema_files, load_source_file
 from dbt.parser.partial import PartialParsing, special_override_macros
 from dbt.contracts.graph.compiled import ManifestNode
 from dbt.contracts.graph.manifest import (
@@ -58,6 +74,7 @@ from dbt.contracts.graph.manifest import (
     Disabled,
     MacroManifest,
     ManifestStateCheck,
+    macro_sql_checksum,
     ParsingInfo,
 )
 from dbt.contracts.graph.parsed import (
@@ -98,6 +115,10 @@ PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
 PARSING_STATE = DbtProcessState("parsing")
 
 
+# A var() call, but not an env_var() call
+VAR_CALL_PATTERN = re.compile(r"\bvar\s*\(")
+
+
 class ReparseReason(StrEnum):
     version_mismatch = "01_version_mismatch"
     file_not_found = "02_file_not_found"
@@ -142,6 +163,7 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     parse_project_elapsed: Optional[float] = None
     patch_sources_elapsed: Optional[float] = None
     process_manifest_elapsed: Optional[float] = None
+    process_refs_elapsed: Optional[float] = None
     load_all_elapsed: Optional[float] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
     _project_index: Dict[str, ProjectLoaderInfo] = field(default_factory=dict)
@@ -186,9 +208,16 @@ class ManifestLoader:
         # have been enabled, but not happening because of some issue.
         self.partially_parsing = False
         self.partial_parser = None
+        # The --vars that changed since the saved manifest was written
+        self.changed_vars: Set[str] = set()
 
+        # The files in a saved manifest that can't be used for partial parsing,
+        # but were read by this version of dbt, so their yaml can be reused
+        self.saved_files: MutableMapping[str, AnySourceFile] = {}
         # This is a saved manifest from a previous run that's used for partial parsing
         self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        if self.saved_manifest is not None:
+            self.manifest.macro_parse_cache = self.saved_manifest.macro_parse_cache
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -237,25 +266,26 @@ class ManifestLoader:
         # used to get the SourceFiles from the manifest files.
         start_read_files = time.perf_counter()
         project_parser_files = {}
-        saved_files = {}
+        saved_files = self.saved_files
         if self.saved_manifest:
             saved_files = self.saved_manifest.files
         for project in self.all_projects.values():
             read_files(project, self.manifest.files, project_parser_files, saved_files)
+        load_schema_files(self.manifest.files, project_parser_files)
         orig_project_parser_files = project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
 
         skip_parsing = False
         if self.saved_manifest is not None:
-            self.partial_parser = PartialParsing(self.saved_manifest, self.manifest.files)
+            self.partial_parser = PartialParsing(
+                self.saved_manifest, self.manifest.files, self.changed_vars
+            )
             skip_parsing = self.partial_parser.skip_parsing()
             if skip_parsing:
                 # nothing changed, so we don't need to generate project_parser_files
                 self.manifest = self.saved_manifest
             else:
-                # create child_map and parent_map
-                self.saved_manifest.build_parent_and_child_maps()
                 # files are different, we need to create a new set of
                 # project_parser_files.
                 try:
@@ -290,8 +320,10 @@ class ManifestLoader:
                         if source_file:
                             parse_file_type = source_file.parse_file_type
                             fire_event(PartialParsingExceptionFile(file=file_id))
-                            file_dict = source_file.to_dict()
-                            fire_event(PartialParsingFile(file_dict=file_dict))
+                            if event_enabled(PartialParsingFile):
+                                fire_event(
+                                    PartialParsingFile(file_dict=Lazy.defer(source_file.to_dict))
+                                )
                     exc_info["parse_file_type"] = parse_file_type
                     fire_event(PartialParsingException(exc_info=exc_info))
 
@@ -399,7 +431,24 @@ class ManifestLoader:
                 self.manifest._parsing_info.static_analysis_path_count
             )
 
+            # update the reverse indexes the next partial parse will use, for
+            # what was parsed this time
+            if self.partially_parsing:
+                self.manifest.partial_parsing_indexes.update(
+                    self.manifest,
+                    self.started_at,
+                    [
+                        file_id
+                        for parser_files in project_parser_files.values()
+                        for file_ids in parser_files.values()
+                        for file_id in file_ids
+                    ],
+                )
+            else:
+                self.manifest.partial_parsing_indexes.update(self.manifest)
+
             # write out the fully parsed manifest
+            self.manifest.macro_parse_cache.prune(self.manifest)
             self.write_manifest_for_partial_parse()
 
         return self.manifest
@@ -516,12 +565,19 @@ class ManifestLoader:
         macro_namespace = TestMacroNamespace(self.macro_resolver, {}, None, MacroStack(), [])
         adapter = get_adapter(self.root_project)
         db_wrapper = ParseProvider().DatabaseWrapper(adapter, macro_namespace)
+        macro_calls_cache = self.manifest.macro_parse_cache.macro_calls
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
-            possible_macro_calls = statically_extract_macro_calls(
-                macro.macro_sql, macro_ctx, db_wrapper
-            )
+            # What might be a macro call only depends on the macro's SQL, so
+            # it's saved by the SQL's checksum. Resolving it depends on the
+            # macros and the context, so that's done every time.
+            checksum = macro_sql_checksum(macro)
+            static_calls = macro_calls_cache.get(checksum)
+            if static_calls is None:
+                static_calls = statically_find_macro_calls(macro.macro_sql)
+                macro_calls_cache[checksum] = static_calls
+            possible_macro_calls = resolve_static_macro_calls(static_calls, macro_ctx, db_wrapper)
             for macro_name in possible_macro_calls:
                 # adapter.dispatch calls can generate a call with the same name as the macro
                 # it ought to be an adapter prefix (postgres_) or default_
@@ -571,6 +627,19 @@ class ManifestLoader:
             fire_event(PartialParsingFailedBecauseConfigChange())
             valid = False
             reparse_reason = ReparseReason.vars_changed
+        changed_vars = self.get_changed_vars(manifest)
+        if changed_vars and self.config_files_read_vars():
+            # The project configs, profile or selectors could have changed,
+            # which can change any node.
+            fire_event(PartialParsingFailedBecauseConfigChange())
+            valid = False
+            reparse_reason = ReparseReason.vars_changed
+        if changed_vars & manifest.generate_name_vars:
+            # The generate_*_name macros could return something else for any
+            # node.
+            fire_event(PartialParsingFailedBecauseConfigChange())
+            valid = False
+            reparse_reason = ReparseReason.vars_changed
         if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
             # Note: This should be made more granular. We shouldn't need to invalidate
             # partial parsing if a non-used profile section has changed.
@@ -609,25 +678,88 @@ class ManifestLoader:
                     fire_event(PartialParsingFailedBecauseHashChanged())
                     valid = False
                     reparse_reason = ReparseReason.project_config_changed
+        if valid:
+            self.changed_vars = changed_vars
         return valid, reparse_reason
 
+    def get_changed_vars(self, manifest: Manifest) -> Set[str]:
+        """Return the names of the --vars that were added, removed or changed
+        since the saved manifest was written. The files that read them are
+        reparsed.
+        """
+        saved_hashes = manifest.state_check.cli_vars_hashes
+        current_hashes = self.manifest.state_check.cli_vars_hashes
+        return {
+            name
+            for name in set(saved_hashes) | set(current_hashes)
+            if saved_hashes.get(name) != current_hashes.get(name)
+        }
+
+    def config_files_read_vars(self) -> bool:
+        """Return True if any dbt_project.yml, the profiles.yml or the
+        selectors.yml calls var(). They're rendered with --vars before parsing,
+        so which files a changed var affects isn't recorded.
+        """
+        paths = [
+            os.path.join(project.project_root, "dbt_project.yml")
+            for project in self.all_projects.values()
+        ]
+        paths.append(os.path.join(flags.PROFILES_DIR, "profiles.yml"))
+        paths.append(os.path.join(self.root_project.project_root, "selectors.yml"))
+        for path in paths:
+            if os.path.exists(path):
+                with open(path) as fp:
+                    if VAR_CALL_PATTERN.search(fp.read()):
+                        return True
+        return False
+
+    # Every node is parsed with the special override macros, so if one of them,
+    # or a macro one of them calls, has changed, everything is reparsed.
     def skip_partial_parsing_because_of_macros(self):
         if not self.partial_parser:
             return False
-        if self.partial_parser.deleted_special_override_macro:
-            return True
+        for unique_id in self.partial_parser.deleted_special_override_macros:
+            # its file may have just been rescheduled for parsing
+            if unique_id not in self.manifest.macros:
+                return True
         # Check for custom versions of these special macros
         for macro_name in special_override_macros:
             macro = self.macro_resolver.get_macro(None, macro_name)
             if macro and macro.package_name != "dbt":
-                if (
-                    macro.file_id in self.partial_parser.file_diff["changed"]
-                    or macro.file_id in self.partial_parser.file_diff["added"]
-                ):
-                    # The file with the macro in it has changed
+                if any(self.macro_changed(unique_id) for unique_id in self.macro_closure(macro)):
                     return True
         return False
 
+    def macro_closure(self, macro: ParsedMacro) -> List[str]:
+        """Return the unique_ids of the macro and of the macros it calls,
+        directly or indirectly.
+        """
+        closure = [macro.unique_id]
+        seen = set(closure)
+        for unique_id in closure:
+            if unique_id not in self.manifest.macros:
+                continue
+            for called_id in self.manifest.macros[unique_id].depends_on.macros:
+                if called_id not in seen:
+                    seen.add(called_id)
+                    closure.append(called_id)
+        return closure
+
+    def macro_changed(self, unique_id: str) -> bool:
+        """Return True if the macro was added, removed or its SQL changed
+        since the saved manifest was written.
+        """
+        assert self.partial_parser is not None
+        if unique_id not in self.manifest.macros:
+            return True
+        macro = self.manifest.macros[unique_id]
+        # reparsed macros replace the saved ones, which are kept here
+        saved_macro = self.partial_parser.deleted_manifest.macros.get(unique_id)
+        if saved_macro is None:
+            file_diff = self.partial_parser.file_diff
+            return macro.file_id in file_diff["changed"] or macro.file_id in file_diff["added"]
+        return saved_macro.macro_sql != macro.macro_sql
+
     def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
         if not flags.PARTIAL_PARSE:
             fire_event(PartialParsingNotEnabled())
@@ -646,11 +778,18 @@ class ManifestLoader:
                 # different version of dbt
                 is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
                 if is_partial_parsable:
+                    # The saved state_check can differ in the --vars
+                    manifest.state_check = self.manifest.state_check
                     # We don't want to have stale generated_at dates
                     manifest.metadata.generated_at = datetime.utcnow()
                     # or invocation_ids
                     manifest.metadata.invocation_id = get_invocation_id()
                     return manifest
+                if manifest.metadata.dbt_version == __version__:
+                    # What was found in the macro and schema files still
+                    # holds for the ones that haven't changed
+                    self.manifest.macro_parse_cache = manifest.macro_parse_cache
+                    self.saved_files = manifest.files
             except Exception as exc:
                 fire_event(ParsedFileLoadFailed(path=path, exc=exc))
                 reparse_reason = ReparseReason.load_file_failure
@@ -677,26 +816,17 @@ class ManifestLoader:
             mli._project_index[project.project_name] = project_info
         return mli
 
-    # TODO: this should be calculated per-file based on the vars() calls made in
-    # parsing, so changing one var doesn't invalidate everything. also there should
-    # be something like that for env_var - currently changing env_vars in way that
-    # impact graph selection or configs will result in weird test failures.
-    # finally, we should hash the actual profile used, not just root project +
+    # TODO: we should hash the actual profile used, not just root project +
     # profiles.yml + relevant args. While sufficient, it is definitely overkill.
     def build_manifest_state_check(self):
         config = self.root_project
         all_projects = self.all_projects
         # if any of these change, we need to reject the parser
 
-        # Create a FileHash of vars string, profile name and target name
-        # This does not capture vars in dbt_project, just the command line
-        # arg vars, but since any changes to that file will cause state_check
-        # to not pass, it doesn't matter.  If we move to more granular checking
-        # of env_vars, that would need to change.
+        # Create a FileHash of profile name and target name
         vars_hash = FileHash.from_contents(
             "\x00".join(
                 [
-                    getattr(config.args, "vars", "{}") or "{}",
                     getattr(config.args, "profile", "") or "",
                     getattr(config.args, "target", "") or "",
                     __version__,
@@ -720,6 +850,15 @@ class ManifestLoader:
             env_var_str += f"{key}:{config.profile_env_vars[key]}|"
         profile_env_vars_hash = FileHash.from_contents(env_var_str)
 
+        # Create a checksum of each of the command line arg vars, so that only
+        # the files that read the vars that changed are reparsed. This does
+        # not capture vars in dbt_project, but any changes to that file will
+        # cause state_check to not pass.
+        cli_vars_hashes = {
+            name: FileHash.from_contents(json.dumps(value, sort_keys=True, default=str)).checksum
+            for name, value in config.cli_vars.items()
+        }
+
         # Create a FileHash of the profile file
         profile_path = os.path.join(flags.PROFILES_DIR, "profiles.yml")
         with open(profile_path) as fp:
@@ -737,6 +876,7 @@ class ManifestLoader:
             project_env_vars_hash=project_env_vars_hash,
             profile_env_vars_hash=profile_env_vars_hash,
             vars_hash=vars_hash,
+            cli_vars_hashes=cli_vars_hashes,
             profile_hash=profile_hash,
             project_hashes=project_hashes,
         )
@@ -813,74 +953,50 @@ class ManifestLoader:
     # Takes references in 'refs' array of nodes and exposures, finds the target
     # node, and updates 'depends_on.nodes' with the unique id
     def process_refs(self, current_project: str):
+        start_process_refs = time.perf_counter()
+        resolved: ResolvedRefs = {}
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
-            _process_refs_for_node(self.manifest, current_project, node)
+            _process_refs_for_node(self.manifest, current_project, node, resolved)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
-            _process_refs_for_exposure(self.manifest, current_project, exposure)
+            _process_refs_for_exposure(self.manifest, current_project, exposure, resolved)
         for metric in self.manifest.metrics.values():
             if metric.created_at < self.started_at:
                 continue
-            _process_refs_for_metric(self.manifest, current_project, metric)
+            _process_refs_for_metric(self.manifest, current_project, metric, resolved)
+        self._perf_info.process_refs_elapsed = time.perf_counter() - start_process_refs
 
     # nodes: node and column descriptions
     # sources: source and table descriptions, column descriptions
     # macros: macro argument descriptions
     # exposures: exposure descriptions
     def process_docs(self, config: RuntimeConfig):
+        # Docs contexts are only built for descriptions that need rendering,
+        # and are shared by everything in a package.
+        docs_contexts = DocsRuntimeContexts(config, self.manifest, config.project_name)
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                node,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_node(ctx, node)
+            _process_docs_for_node(partial(docs_contexts.get, node), node)
         for source in self.manifest.sources.values():
             if source.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                source,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_source(ctx, source)
+            _process_docs_for_source(partial(docs_contexts.get, source), source)
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                macro,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_macro(ctx, macro)
+            _process_docs_for_macro(partial(docs_contexts.get, macro), macro)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                exposure,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_exposure(ctx, exposure)
+            _process_docs_for_exposure(partial(docs_contexts.get, exposure), exposure)
         for metric in self.manifest.metrics.values():
             if metric.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                metric,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_metrics(ctx, metric)
+            _process_docs_for_metrics(partial(docs_contexts.get, metric), metric)
 
     # Loops through all nodes and exposures, for each element in
     # 'sources' array finds the source node and updates the
@@ -991,53 +1107,80 @@ DocsContextCallback = Callable[[Union[ParsedNode, ParsedSourceDefinition]], Dict
 
 
 # node and column descriptions
+# The docs context for a node, source, macro, exposure or metric. It's only
+# built if one of its descriptions needs rendering.
+DocsContextGetter = Callable[[], Dict[str, Any]]
+
+
+def _render_description(description: str, get_context: DocsContextGetter) -> str:
+    # get_rendered returns descriptions without jinja as they are, but only
+    # after the context has been built
+    if not has_render_chars(description):
+        return description
+    return get_rendered(description, get_context())
+
+
 def _process_docs_for_node(
-    context: Dict[str, Any],
+    get_context: DocsContextGetter,
     node: ManifestNode,
 ):
-    node.description = get_rendered(node.description, context)
+    node.description = _render_description(node.description, get_context)
     for column_name, column in node.columns.items():
-        column.description = get_rendered(column.description, context)
+        column.description = _render_description(column.description, get_context)
 
 
 # source and table descriptions, column descriptions
 def _process_docs_for_source(
-    context: Dict[str, Any],
+    get_context: DocsContextGetter,
     source: ParsedSourceDefinition,
 ):
     table_description = source.description
     source_description = source.source_description
-    table_description = get_rendered(table_description, context)
-    source_description = get_rendered(source_description, context)
+    table_description = _render_description(table_description, get_context)
+    source_description = _render_description(source_description, get_context)
     source.description = table_description
     source.source_description = source_description
 
     for column in source.columns.values():
         column_desc = column.description
-        column_desc = get_rendered(column_desc, context)
+        column_desc = _render_description(column_desc, get_context)
         column.description = column_desc
 
 
 # macro argument descriptions
-def _process_docs_for_macro(context: Dict[str, Any], macro: ParsedMacro) -> None:
-    macro.description = get_rendered(macro.description, context)
+def _process_docs_for_macro(get_context: DocsContextGetter, macro: ParsedMacro) -> None:
+    macro.description = _render_description(macro.description, get_context)
     for arg in macro.arguments:
-        arg.description = get_rendered(arg.description, context)
+        arg.description = _render_description(arg.description, get_context)
 
 
 # exposure descriptions
-def _process_docs_for_exposure(context: Dict[str, Any], exposure: ParsedExposure) -> None:
-    exposure.description = get_rendered(exposure.description, context)
+def _process_docs_for_exposure(get_context: DocsContextGetter, exposure: ParsedExposure) -> None:
+    exposure.description = _render_description(exposure.description, get_context)
 
 
-def _process_docs_for_metrics(context: Dict[str, Any], metric: ParsedMetric) -> None:
-    metric.description = get_rendered(metric.description, context)
+def _process_docs_for_metrics(get_context: DocsContextGetter, metric: ParsedMetric) -> None:
+    metric.description = _render_description(metric.description, get_context)
 
 
-def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposure: ParsedExposure):
-    """Given a manifest and exposure in that manifest, process its refs"""
-    for ref in exposure.refs:
-        target_model: Optional[Union[Disabled, ManifestNode]] = None
+# The enabled node each (package, name, package of the node it's in) ref
+# resolved to, shared by everything process_refs resolves. Nodes with refs
+# that can't be resolved are disabled as it goes, so it's checked on hits.
+ResolvedRefs = Dict[Tuple[Optional[str], str, str], ManifestNode]
+
+
+def _resolve_refs(
+    manifest: Manifest,
+    current_project: str,
+    node: Union[ManifestNode, ParsedExposure, ParsedMetric],
+    resolved: Optional[ResolvedRefs] = None,
+) -> Iterator[Tuple[str, Optional[str], Optional[Union[Disabled, ManifestNode]]]]:
+    """Given a manifest and a node, exposure or metric in that manifest,
+    resolve its refs, yielding what each one names and what it resolved to
+    """
+    if resolved is None:
+        resolved = {}
+    for ref in node.refs:
         target_model_name: str
         target_model_package: Optional[str] = None
 
@@ -1050,13 +1193,31 @@ def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposur
                 f"Refs should always be 1 or 2 arguments - got {len(ref)}"
             )
 
-        target_model = manifest.resolve_ref(
-            target_model_name,
-            target_model_package,
-            current_project,
-            exposure.package_name,
-        )
+        key = (target_model_package, target_model_name, node.package_name)
+        target_model: Optional[Union[Disabled, ManifestNode]] = resolved.get(key)
+        if target_model is None or not resolved[key].config.enabled:
+            target_model = manifest.resolve_ref(
+                target_model_name,
+                target_model_package,
+                current_project,
+                node.package_name,
+            )
+            if target_model is not None and not isinstance(target_model, Disabled):
+                resolved[key] = target_model
+
+        yield target_model_name, target_model_package, target_model
+
 
+def _process_refs_for_exposure(
+    manifest: Manifest,
+    current_project: str,
+    exposure: ParsedExposure,
+    resolved: Optional[ResolvedRefs] = None,
+):
+    """Given a manifest and exposure in that manifest, process its refs"""
+    for target_model_name, target_model_package, target_model in _resolve_refs(
+        manifest, current_project, exposure, resolved
+    ):
         if target_model is None or isinstance(target_model, Disabled):
             # This may raise. Even if it doesn't, we don't want to add
             # this exposure to the graph b/c there is no destination exposure
@@ -1069,35 +1230,20 @@ def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposur
 
             continue
 
-        target_model_id = target_model.unique_id
-
-        exposure.depends_on.nodes.append(target_model_id)
+        exposure.depends_on.nodes.append(target_model.unique_id)
         manifest.update_exposure(exposure)
 
 
-def _process_refs_for_metric(manifest: Manifest, current_project: str, metric: ParsedMetric):
+def _process_refs_for_metric(
+    manifest: Manifest,
+    current_project: str,
+    metric: ParsedMetric,
+    resolved: Optional[ResolvedRefs] = None,
+):
     """Given a manifest and a metric in that manifest, process its refs"""
-    for ref in metric.refs:
-        target_model: Optional[Union[Disabled, ManifestNode]] = None
-        target_model_name: str
-        target_model_package: Optional[str] = None
-
-        if len(ref) == 1:
-            target_model_name = ref[0]
-        elif len(ref) == 2:
-            target_model_package, target_model_name = ref
-        else:
-            raise dbt.exceptions.InternalException(
-                f"Refs should always be 1 or 2 arguments - got {len(ref)}"
-            )
-
-        target_model = manifest.resolve_ref(
-            target_model_name,
-            target_model_package,
-            current_project,
-            metric.package_name,
-        )
-
+    for target_model_name, target_model_package, target_model in _resolve_refs(
+        manifest, current_project, metric, resolved
+    ):
         if target_model is None or isinstance(target_model, Disabled):
             # This may raise. Even if it doesn't, we don't want to add
             # this exposure to the graph b/c there is no destination exposure
@@ -1110,35 +1256,20 @@ def _process_refs_for_metric(manifest: Manifest, current_project: str, metric: P
 
             continue
 
-        target_model_id = target_model.unique_id
-
-        metric.depends_on.nodes.append(target_model_id)
+        metric.depends_on.nodes.append(target_model.unique_id)
         manifest.update_metric(metric)
 
 
-def _process_refs_for_node(manifest: Manifest, current_project: str, node: ManifestNode):
+def _process_refs_for_node(
+    manifest: Manifest,
+    current_project: str,
+    node: ManifestNode,
+    resolved: Optional[ResolvedRefs] = None,
+):
     """Given a manifest and a node in that manifest, process its refs"""
-    for ref in node.refs:
-        target_model: Optional[Union[Disabled, ManifestNode]] = None
-        target_model_name: str
-        target_model_package: Optional[str] = None
-
-        if len(ref) == 1:
-            target_model_name = ref[0]
-        elif len(ref) == 2:
-            target_model_package, target_model_name = ref
-        else:
-            raise dbt.exceptions.InternalException(
-                f"Refs should always be 1 or 2 arguments - got {len(ref)}"
-            )
-
-        target_model = manifest.resolve_ref(
-            target_model_name,
-            target_model_package,
-            current_project,
-            node.package_name,
-        )
-
+    for target_model_name, target_model_package, target_model in _resolve_refs(
+        manifest, current_project, node, resolved
+    ):
         if target_model is None or isinstance(target_model, Disabled):
             # This may raise. Even if it doesn't, we don't want to add
             # this node to the graph b/c there is no destination node
@@ -1152,9 +1283,7 @@ def _process_refs_for_node(manifest: Manifest, current_project: str, node: Manif
 
             continue
 
-        target_model_id = target_model.unique_id
-
-        node.depends_on.nodes.append(target_model_id)
+        node.depends_on.nodes.append(target_model.unique_id)
         # TODO: I think this is extraneous, node should already be the same
         # as manifest.nodes[node.unique_id] (we're mutating node here, not
         # making a new one)
@@ -1227,13 +1356,10 @@ def _process_sources_for_node(manifest: Manifest, current_project: str, node: Ma
 # This is called in task.rpc.sql_commands when a "dynamic" node is
 # created in the manifest, in 'add_refs'
 def process_macro(config: RuntimeConfig, manifest: Manifest, macro: ParsedMacro) -> None:
-    ctx = generate_runtime_docs_context(
-        config,
+    _process_docs_for_macro(
+        partial(generate_runtime_docs_context, config, macro, manifest, config.project_name),
         macro,
-        manifest,
-        config.project_name,
     )
-    _process_docs_for_macro(ctx, macro)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
@@ -1242,5 +1368,7 @@ def process_node(config: RuntimeConfig, manifest: Manifest, node: ManifestNode):
 
     _process_sources_for_node(manifest, config.project_name, node)
     _process_refs_for_node(manifest, config.project_name, node)
-    ctx = generate_runtime_docs_context(config, node, manifest, config.project_name)
-    _process_docs_for_node(ctx, node)
+    _process_docs_for_node(
+        partial(generate_runtime_docs_context, config, node, manifest, config.project_name),
+        node,
+    )
@@ -1,6 +1,6 @@
 from copy import deepcopy
 from dbt.context.context_config import ContextConfig
-from dbt.contracts.graph.parsed import ParsedModelNode
+from dbt.contracts.graph.parsed import ParsedModelNode, ParsedNode
 import dbt.flags as flags
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -328,9 +328,9 @@ def _get_stable_sample_result(
 # returns a list of string codes that need a single digit prefix to be prepended
 # before being sent as a tracking event
 def _get_sample_result(
-    sample_node: ParsedModelNode,
+    sample_node: ParsedNode,
     sample_config: ContextConfig,
-    node: ParsedModelNode,
+    node: ParsedNode,
     config: ContextConfig,
 ) -> List[Tuple[int, str]]:
     result: List[Tuple[int, str]] = []
@@ -1,6 +1,6 @@
 import os
 from copy import deepcopy
-from typing import MutableMapping, Dict, List
+from typing import MutableMapping, Dict, Iterable, Set
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.files import (
     AnySourceFile,
@@ -15,7 +15,6 @@ from dbt.events.types import (
     PartialParsingUpdatedFile,
     PartialParsingNodeMissingInSourceFile,
     PartialParsingMissingNodes,
-    PartialParsingChildMapMissingUniqueID,
     PartialParsingUpdateSchemaFile,
     PartialParsingDeletedSource,
     PartialParsingDeletedExposure,
@@ -74,21 +73,34 @@ special_override_macros = [
 # to preserve an unchanged file object in case we need to drop back to a
 # a full parse (such as for certain macro changes)
 class PartialParsing:
-    def __init__(self, saved_manifest: Manifest, new_files: MutableMapping[str, AnySourceFile]):
+    def __init__(
+        self,
+        saved_manifest: Manifest,
+        new_files: MutableMapping[str, AnySourceFile],
+        changed_vars: Iterable[str] = (),
+    ):
         self.saved_manifest = saved_manifest
         self.new_files = new_files
         self.project_parser_files: Dict = {}
         self.saved_files = self.saved_manifest.files
         self.project_parser_files = {}
         self.deleted_manifest = Manifest()
-        self.macro_child_map: Dict[str, List[str]] = {}
+        # The reverse indexes saved with the manifest. A manifest that wasn't
+        # saved by a parse, like in tests, won't have them yet.
+        self.indexes = self.saved_manifest.partial_parsing_indexes
+        if not self.indexes.built:
+            self.indexes.update(self.saved_manifest)
+        self.follow_macro_references = False
+        # The --vars that changed since the saved manifest was written
+        self.changed_vars = set(changed_vars)
         (
             self.env_vars_changed_source_files,
             self.env_vars_changed_schema_files,
         ) = self.build_env_vars_to_files()
         self.build_file_diff()
         self.processing_file = None
-        self.deleted_special_override_macro = False
+        # unique_ids of the custom special override macros that were removed
+        self.deleted_special_override_macros: Set[str] = set()
         self.disabled_by_file_id = self.saved_manifest.build_disabled_by_file_id()
 
     def skip_parsing(self):
@@ -160,7 +172,7 @@ class PartialParsing:
             "unchanged": unchanged,
         }
         if changed_or_deleted_macro_file:
-            self.macro_child_map = self.saved_manifest.build_macro_child_map()
+            self.follow_macro_references = True
         deleted = len(deleted) + len(deleted_schema_files)
         changed = len(changed) + len(changed_schema_files)
         fire_event(PartialParsingEnabled(deleted=deleted, added=len(added), changed=changed))
@@ -171,6 +183,8 @@ class PartialParsing:
     def get_parsing_files(self):
         if self.skip_parsing():
             return {}
+        # Nodes are about to be removed from the saved manifest
+        self.saved_manifest.clear_lookups()
         # Need to add new files first, because changes in schema files
         # might refer to them
         for file_id in self.file_diff["added"]:
@@ -387,10 +401,7 @@ class PartialParsing:
     # We need to re-parse nodes that reference another removed node
     def schedule_referencing_nodes_for_parsing(self, unique_id):
         # Look at "children", i.e. nodes that reference this node
-        if unique_id in self.saved_manifest.child_map:
-            self.schedule_nodes_for_parsing(self.saved_manifest.child_map[unique_id])
-        else:
-            fire_event(PartialParsingChildMapMissingUniqueID(unique_id=unique_id))
+        self.schedule_nodes_for_parsing(self.indexes.node_children.get(unique_id))
 
     def schedule_nodes_for_parsing(self, unique_ids):
         for unique_id in unique_ids:
@@ -468,15 +479,19 @@ class PartialParsing:
                     continue
                 macro = self.saved_manifest.macros[unique_id]
                 if macro.name in special_override_macros:
-                    self.deleted_special_override_macro = True
-
-    def recursively_gather_macro_references(self, macro_unique_id, referencing_nodes):
-        for unique_id in self.macro_child_map[macro_unique_id]:
-            if unique_id in referencing_nodes:
+                    self.deleted_special_override_macros.add(unique_id)
+
+    def recursively_gather_macro_references(self, macro_unique_id, referencing_nodes, seen=None):
+        # 'seen' holds the same ids as referencing_nodes, for quick lookups
+        if seen is None:
+            seen = set(referencing_nodes)
+        for unique_id in self.indexes.macro_children.get(macro_unique_id):
+            if unique_id in seen:
                 continue
+            seen.add(unique_id)
             referencing_nodes.append(unique_id)
             if unique_id.startswith("macro."):
-                self.recursively_gather_macro_references(unique_id, referencing_nodes)
+                self.recursively_gather_macro_references(unique_id, referencing_nodes, seen)
 
     def handle_macro_file_links(self, source_file, follow_references=False):
         # remove the macros in the 'macros' dictionary
@@ -492,11 +507,10 @@ class PartialParsing:
             self.deleted_manifest.macros[unique_id] = base_macro
 
             # Recursively check children of this macro
-            # The macro_child_map might not exist if a macro is removed by
-            # schedule_nodes_for parsing. We only want to follow
-            # references if the macro file itself has been updated or
-            # deleted, not if we're just updating referenced nodes.
-            if self.macro_child_map and follow_references:
+            # We only want to follow references if the macro file itself
+            # has been updated or deleted, not if we're just updating
+            # referenced nodes.
+            if self.follow_macro_references and follow_references:
                 referencing_nodes = []
                 self.recursively_gather_macro_references(unique_id, referencing_nodes)
                 self.schedule_macro_nodes_for_parsing(referencing_nodes)
@@ -801,6 +815,7 @@ class PartialParsing:
             if not found:
                 pp_dict[key].append(patch)
         schema_file.delete_from_env_vars(key, patch["name"])
+        schema_file.delete_from_vars(key, patch["name"])
         self.add_to_pp_files(schema_file)
 
     # For model, seed, snapshot, analysis schema dictionary keys,
@@ -942,7 +957,7 @@ class PartialParsing:
             self.add_to_pp_files(orig_file)
 
     # This builds a dictionary of files that need to be scheduled for parsing
-    # because the env var has changed.
+    # because an env var, or a var in self.changed_vars, has changed.
     # source_files
     #   env_vars_changed_source_files: [file_id, file_id...]
     # schema_files
@@ -973,27 +988,34 @@ class PartialParsing:
         # a list of vars.
         # Create a list of file_ids for source_files that need to be reparsed, and
         # a dictionary of file_ids to yaml_keys to names.
-        for source_file in self.saved_files.values():
-            file_id = source_file.file_id
-            if not source_file.env_vars:
+        # The vars are recorded the same way, in source_file.vars.
+        changed_env_vars = set(changed_vars)
+        changed_file_ids = set()
+        for env_var in changed_env_vars:
+            changed_file_ids.update(self.indexes.env_var_files.get(env_var))
+        for var in self.changed_vars:
+            changed_file_ids.update(self.indexes.var_files.get(var))
+        for file_id in sorted(changed_file_ids):
+            if file_id not in self.saved_files:
                 continue
+            source_file = self.saved_files[file_id]
             if source_file.parse_file_type == ParseFileType.Schema:
-                for yaml_key in source_file.env_vars.keys():
-                    for name in source_file.env_vars[yaml_key].keys():
-                        for env_var in source_file.env_vars[yaml_key][name]:
-                            if env_var in changed_vars:
-                                if file_id not in env_vars_changed_schema_files:
-                                    env_vars_changed_schema_files[file_id] = {}
-                                if yaml_key not in env_vars_changed_schema_files[file_id]:
-                                    env_vars_changed_schema_files[file_id][yaml_key] = []
-                                if name not in env_vars_changed_schema_files[file_id][yaml_key]:
-                                    env_vars_changed_schema_files[file_id][yaml_key].append(name)
-                                break  # if one env_var is changed we can stop
+                for (file_vars, changed) in (
+                    (source_file.env_vars, changed_env_vars),
+                    (source_file.vars, self.changed_vars),
+                ):
+                    for yaml_key in file_vars.keys():
+                        for name in file_vars[yaml_key].keys():
+                            if not changed.intersection(file_vars[yaml_key][name]):
+                                continue
+                            if file_id not in env_vars_changed_schema_files:
+                                env_vars_changed_schema_files[file_id] = {}
+                            if yaml_key not in env_vars_changed_schema_files[file_id]:
+                                env_vars_changed_schema_files[file_id][yaml_key] = []
+                            if name not in env_vars_changed_schema_files[file_id][yaml_key]:
+                                env_vars_changed_schema_files[file_id][yaml_key].append(name)
 
             else:
-                for env_var in source_file.env_vars:
-                    if env_var in changed_vars:
-                        env_vars_changed_source_files.append(file_id)
-                        break  # if one env_var is changed we can stop
+                env_vars_changed_source_files.append(file_id)
 
         return (env_vars_changed_source_files, env_vars_changed_schema_files)
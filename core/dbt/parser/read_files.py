@@ -1,5 +1,9 @@
+import os
 import pathlib
+import time
+from dbt import flags
 from dbt.clients.system import load_file_contents
+from dbt.clients.yaml_helper import YAML_LOADER, try_safe_load
 from dbt.contracts.files import (
     FilePath,
     ParseFileType,
@@ -11,8 +15,18 @@ from dbt.contracts.files import (
 
 from dbt.parser.schemas import yaml_from_file, schema_file_keys, check_format_version
 from dbt.exceptions import ParsingException
+from dbt.events.functions import fire_event
+from dbt.events.types import SchemaFilesLoaded, SlowYamlLoader
 from dbt.parser.search import filesystem_search
-from typing import Optional
+from typing import List, Optional, Set
+
+# Loading yaml in a pool of processes only pays for starting them when there's
+# this much of it to load with libyaml, which loads about 1MB/s. The
+# pure-Python loader is about ten times slower, so it pays off with a tenth as
+# much. The pool uses dbt's multiprocessing context, whose processes aren't
+# forked (it isn't safe with the threads dbt may have running), so each one
+# imports dbt before it can start and it takes four times as much.
+PARALLEL_YAML_MIN_BYTES = 2_000_000
 
 
 # This loads the files contents and creates the SourceFile object
@@ -50,15 +64,81 @@ def load_source_file(
         file_contents = load_file_contents(path.absolute_path, strip=False)
         source_file.checksum = FileHash.from_contents(file_contents)
         source_file.contents = file_contents.strip()
+        if (
+            parse_file_type == ParseFileType.Schema
+            and saved_files
+            and source_file.file_id in saved_files
+            and saved_files[source_file.file_id].checksum == source_file.checksum
+        ):
+            # touched but not changed, so its yaml hasn't changed either
+            source_file.dfy = saved_files[source_file.file_id].dfy
+
+    # The yaml in schema files is loaded afterwards, for all of them at once,
+    # by load_schema_files.
+    return source_file
+
+
+def load_schema_files(files, parser_files) -> None:
+    """Load the yaml in the schema files read_files read, and drop the ones
+    with no yaml in them. It's loaded in a pool of processes when there's a
+    lot of it.
+    """
+    to_load: List[SchemaSourceFile] = []
+    contents: List[str] = []
+    for project_files in parser_files.values():
+        for file_id in project_files["SchemaParser"]:
+            source_file = files[file_id]
+            # files that weren't read, or were read but haven't changed,
+            # already have their yaml
+            if source_file.contents and not source_file.dfy:
+                to_load.append(source_file)
+                contents.append(source_file.contents)
+    if not to_load:
+        return
 
-    if parse_file_type == ParseFileType.Schema and source_file.contents:
-        dfy = yaml_from_file(source_file)
+    start = time.perf_counter()
+    size = sum(len(c) for c in contents)
+    context = flags.MP_CONTEXT
+    min_bytes = PARALLEL_YAML_MIN_BYTES
+    if YAML_LOADER != "libyaml":
+        min_bytes //= 10
+    if context.get_start_method() != "fork":
+        min_bytes *= 4
+    processes = min(os.cpu_count() or 1, max(2, size // min_bytes))
+    if size < min_bytes or processes < 2:
+        processes = 1
+        results = [try_safe_load(c) for c in contents]
+    else:
+        with context.Pool(processes) as pool:
+            results = pool.map(try_safe_load, contents)
+
+    empty: Set[str] = set()
+    for source_file, (loaded, dfy) in zip(to_load, results):
+        if not loaded:
+            # load it again to raise the error, with where it happened
+            dfy = yaml_from_file(source_file)
         if dfy:
             validate_yaml(source_file.path.original_file_path, dfy)
             source_file.dfy = dfy
         else:
-            source_file = None
-    return source_file
+            empty.add(source_file.file_id)
+
+    for file_id in empty:
+        del files[file_id]
+    if empty:
+        for project_files in parser_files.values():
+            project_files["SchemaParser"] = [
+                file_id for file_id in project_files["SchemaParser"] if file_id not in empty
+            ]
+
+    elapsed = time.perf_counter() - start
+    fire_event(
+        SchemaFilesLoaded(
+            path_count=len(to_load), loader=YAML_LOADER, processes=processes, elapsed=elapsed
+        )
+    )
+    if YAML_LOADER != "libyaml":
+        fire_event(SlowYamlLoader(path_count=len(to_load), elapsed=elapsed))
 
 
 # Do some minimal validation of the yaml in a schema file.
@@ -1,10 +1,24 @@
 import itertools
 import os
 import pathlib
+import random
 
 from abc import ABCMeta, abstractmethod
+from copy import deepcopy
 from hashlib import md5
-from typing import Iterable, Dict, Any, Union, List, Optional, Generic, TypeVar, Type
+from typing import (
+    Iterable,
+    Dict,
+    Any,
+    Union,
+    List,
+    Optional,
+    Generic,
+    TypeVar,
+    Tuple,
+    Type,
+    Set,
+)
 
 from dbt.dataclass_schema import ValidationError, dbtClassMixin
 
@@ -58,10 +72,16 @@ from dbt.exceptions import (
     raise_duplicate_source_patch_name,
     warn_or_error,
 )
+from dbt.events.functions import fire_event
+from dbt.events.types import SampleFullJinjaRendering
 from dbt.node_types import NodeType
 from dbt.parser.base import SimpleParser
 from dbt.parser.search import FileBlock
 from dbt.parser.generic_test_builders import (
+    get_static_generic_test,
+    extract_static_relation,
+    is_static_kwarg,
+    MACRO_RELATION_CALL_PATTERN,
     TestBuilder,
     GenericTestBlock,
     TargetBlock,
@@ -69,8 +89,11 @@ from dbt.parser.generic_test_builders import (
     TestBlock,
     Testable,
 )
+from dbt.parser.models import _get_sample_result
 from dbt.ui import warning_tag
 from dbt.utils import get_pseudo_test_path, coerce_dict_str
+import dbt.tracking as tracking
+from dbt import flags, utils
 
 
 UnparsedSchemaYaml = Union[
@@ -187,6 +210,11 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
         self.macro_resolver = MacroResolver(
             self.manifest.macros, self.root_project.project_name, internal_package_names
         )
+        # test macro unique ID -> whether its implementation is overridden
+        self._dispatch_overrides: Dict[str, bool] = {}
+        # test macro unique ID -> whether it, or a macro it calls, calls ref(),
+        # source() or config()
+        self._relation_calls: Dict[str, bool] = {}
 
     @classmethod
     def get_compiled_path(cls, block: FileBlock) -> str:
@@ -261,8 +289,7 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
             "file_key_name": file_key_name,
         }
         try:
-            ParsedGenericTestNode.validate(dct)
-            return ParsedGenericTestNode.from_dict(dct)
+            return self.parse_from_dict(dct, validate=flags.VALIDATE_PARSED_NODES)
         except ValidationError as exc:
             msg = validator_error_message(exc)
             # this is a bit silly, but build an UnparsedNode just for error
@@ -295,6 +322,9 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
             if self.schema_yaml_vars.env_vars:
                 self.store_env_vars(target, schema_file_id, self.schema_yaml_vars.env_vars)
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                self.store_vars(target, schema_file_id, self.schema_yaml_vars.vars)
+                self.schema_yaml_vars.vars = {}
 
         except ParsingException as exc:
             context = _trimmed(str(target))
@@ -350,24 +380,33 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
         self.manifest.env_vars.update(env_vars)
         if schema_file_id in self.manifest.files:
             schema_file = self.manifest.files[schema_file_id]
-            if isinstance(target, UnpatchedSourceDefinition):
-                search_name = target.source.name
-                yaml_key = target.source.yaml_key
-                if "." in search_name:  # source file definitions
-                    (search_name, _) = search_name.split(".")
-            else:
-                search_name = target.name
-                yaml_key = target.yaml_key
+            (yaml_key, search_name) = self._get_yaml_key_and_name(target)
             for var in env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
 
-    # This does special shortcut processing for the two
-    # most common internal macros, not_null and unique,
-    # which avoids the jinja rendering to resolve config
-    # and variables, etc, which might be in the macro.
-    # In the future we will look at generalizing this
-    # more to handle additional macros or to use static
-    # parsing to avoid jinja overhead.
+    def store_vars(self, target, schema_file_id, vars):
+        if schema_file_id in self.manifest.files:
+            schema_file = self.manifest.files[schema_file_id]
+            (yaml_key, search_name) = self._get_yaml_key_and_name(target)
+            for var in vars.keys():
+                schema_file.add_var(var, yaml_key, search_name)
+
+    def _get_yaml_key_and_name(self, target):
+        if isinstance(target, UnpatchedSourceDefinition):
+            search_name = target.source.name
+            yaml_key = target.source.yaml_key
+            if "." in search_name:  # source file definitions
+                (search_name, _) = search_name.split(".")
+        else:
+            search_name = target.name
+            yaml_key = target.yaml_key
+        return (yaml_key, search_name)
+
+    # This does special shortcut processing for the registered static generic
+    # tests, like not_null and unique, which avoids the jinja rendering to
+    # resolve config and variables, etc, which might be in the macro. The
+    # refs, sources and config of these tests are read from their kwargs
+    # instead.
     def render_test_update(self, node, config, builder, schema_file_id):
         macro_unique_id = self.macro_resolver.get_macro_id(
             node.package_name, "test_" + builder.name
@@ -375,39 +414,143 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
         # Add the depends_on here so we can limit the macros added
         # to the context in rendering processing
         node.depends_on.add_macro(macro_unique_id)
-        if macro_unique_id in ["macro.dbt.test_not_null", "macro.dbt.test_unique"]:
-            config_call_dict = builder.get_static_config()
-            config._config_call_dict = config_call_dict
-            # This sets the config from dbt_project
-            self.update_parsed_node_config(node, config)
-            # source node tests are processed at patch_source time
-            if isinstance(builder.target, UnpatchedSourceDefinition):
-                sources = [builder.target.fqn[-2], builder.target.fqn[-1]]
-                node.sources.append(sources)
-            else:  # all other nodes
-                node.refs.append([builder.target.name])
-        else:
-            try:
-                # make a base context that doesn't have the magic kwargs field
-                context = generate_test_context(
-                    node,
-                    self.root_project,
-                    self.manifest,
-                    config,
-                    self.macro_resolver,
+        relations = self._get_static_test_relations(macro_unique_id, builder)
+        if relations is None:
+            self._render_test_update(node, config)
+            return
+
+        # `True` roughly 1/5000 times this function is called, like the
+        # stable static parser sample in ModelParser
+        sample = random.randint(1, 5001) == 5000
+        jinja_sample_node = None
+        jinja_sample_config = None
+        if sample:
+            fire_event(SampleFullJinjaRendering(path=node.path))
+            jinja_sample_node = deepcopy(node)
+            jinja_sample_config = deepcopy(config)
+            # rendering mutates the node and the config
+            self._render_test_update(jinja_sample_node, jinja_sample_config)
+
+        config._config_call_dict = builder.get_static_config()
+        # This sets the config from dbt_project
+        self.update_parsed_node_config(node, config)
+        for func, args in relations:
+            if func == "source":
+                node.sources.append(args)
+            else:
+                node.refs.append(args)
+
+        if jinja_sample_node is not None and jinja_sample_config is not None:
+            result = [
+                f"9{code}_generic_test_{msg}"
+                for code, msg in _get_sample_result(
+                    jinja_sample_node, jinja_sample_config, node, config
                 )
-                # update with rendered test kwargs (which collects any refs)
-                # Note: This does not actually update the kwargs with the rendered
-                # values. That happens in compilation.
-                add_rendered_test_kwargs(context, node, capture_macros=True)
-                # the parsed node is not rendered in the native context.
-                get_rendered(node.raw_sql, context, node, capture_macros=True)
-                self.update_parsed_node_config(node, config)
-                # env_vars should have been updated in the context env_var method
-            except ValidationError as exc:
-                # we got a ValidationError - probably bad types in config()
-                msg = validator_error_message(exc)
-                raise ParsingException(msg, node=node) from exc
+            ]
+            if tracking.active_user is not None:  # None in some tests
+                tracking.track_experimental_parser_sample(
+                    {
+                        "project_id": self.root_project.hashed_name(),
+                        "file_id": utils.get_hash(node),
+                        "status": result,
+                    }
+                )
+
+    def _get_static_test_relations(
+        self, macro_unique_id: Optional[str], builder: TestBuilder
+    ) -> Optional[List[Tuple[str, List[str]]]]:
+        """If the refs and sources of this test can be read from its kwargs,
+        return them as (function name, arguments) pairs, in the order
+        rendering the kwargs would find them. Otherwise, return None.
+        """
+        if macro_unique_id is None:
+            return None
+        relation_kwargs = get_static_generic_test(macro_unique_id)
+        if (
+            relation_kwargs is None
+            or self._has_dispatch_override(macro_unique_id)
+            or self._calls_relation_functions(macro_unique_id)
+        ):
+            return None
+        relations: List[Tuple[str, List[str]]] = []
+        for key, value in builder.args.items():
+            if key == "model":
+                # source node tests are processed at patch_source time
+                if isinstance(builder.target, UnpatchedSourceDefinition):
+                    relations.append(("source", [builder.target.fqn[-2], builder.target.fqn[-1]]))
+                else:  # all other nodes
+                    relations.append(("ref", [builder.target.name]))
+            elif key == "column_name":
+                # column names are never rendered
+                continue
+            elif key in relation_kwargs:
+                relation = extract_static_relation(value)
+                if relation is None:
+                    return None
+                relations.append(relation)
+            elif not is_static_kwarg(value):
+                return None
+        return relations
+
+    def _has_dispatch_override(self, macro_unique_id: str) -> bool:
+        """The static generic test macros dispatch to their
+        implementation, so a project or package can still replace it with a
+        macro named like `default__test_not_null`. Check for one.
+        """
+        if macro_unique_id not in self._dispatch_overrides:
+            _, package_name, macro_name = macro_unique_id.split(".", 2)
+            suffix = f"__{macro_name}"
+            self._dispatch_overrides[macro_unique_id] = any(
+                name.endswith(suffix)
+                for package, namespace in self.macro_resolver.packages.items()
+                if package != package_name
+                for name in namespace
+            )
+        return self._dispatch_overrides[macro_unique_id]
+
+    def _calls_relation_functions(self, macro_unique_id: str) -> bool:
+        """Check that a registered static generic test macro, and the macros
+        it calls (like its dispatched implementation), really don't call
+        ref(), source() or config(), which only rendering would find.
+        """
+        if macro_unique_id not in self._relation_calls:
+            seen: Set[str] = set()
+            stack = [macro_unique_id]
+            calls = False
+            while stack and not calls:
+                unique_id = stack.pop()
+                if unique_id in seen:
+                    continue
+                seen.add(unique_id)
+                macro = self.manifest.macros.get(unique_id)
+                if macro is not None:
+                    calls = MACRO_RELATION_CALL_PATTERN.search(macro.macro_sql) is not None
+                    stack.extend(macro.depends_on.macros)
+            self._relation_calls[macro_unique_id] = calls
+        return self._relation_calls[macro_unique_id]
+
+    def _render_test_update(self, node, config):
+        try:
+            # make a base context that doesn't have the magic kwargs field
+            context = generate_test_context(
+                node,
+                self.root_project,
+                self.manifest,
+                config,
+                self.macro_resolver,
+            )
+            # update with rendered test kwargs (which collects any refs)
+            # Note: This does not actually update the kwargs with the rendered
+            # values. That happens in compilation.
+            add_rendered_test_kwargs(context, node, capture_macros=True)
+            # the parsed node is not rendered in the native context.
+            get_rendered(node.raw_sql, context, node, capture_macros=True)
+            self.update_parsed_node_config(node, config)
+            # env_vars should have been updated in the context env_var method
+        except ValidationError as exc:
+            # we got a ValidationError - probably bad types in config()
+            msg = validator_error_message(exc)
+            raise ParsingException(msg, node=node) from exc
 
     def parse_node(self, block: GenericTestBlock) -> ParsedGenericTestNode:
         """In schema parsing, we rewrite most of the part of parse_node that
@@ -640,6 +783,12 @@ class YamlReader(metaclass=ABCMeta):
                 for var in self.schema_yaml_vars.env_vars.keys():
                     schema_file.add_env_var(var, self.key, entry["name"])
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                schema_file = self.yaml.file
+                assert isinstance(schema_file, SchemaSourceFile)
+                for var in self.schema_yaml_vars.vars.keys():
+                    schema_file.add_var(var, self.key, entry["name"])
+                self.schema_yaml_vars.vars = {}
 
             yield entry
 
@@ -0,0 +1,73 @@
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from dbt import flags
+from dbt.events.functions import fire_event
+from dbt.events.types import ArtifactWriteFailed
+
+
+class ArtifactWriter:
+    """Writes artifacts on a background thread, in the order they were
+    submitted, so writing them doesn't hold up the task that produced them.
+
+    Submitting an artifact only takes a snapshot of it: its collections of
+    nodes and results are copied, so nodes and results added or replaced
+    afterwards aren't written. Converting each item to a dict, encoding the
+    JSON and writing the file all happen in the background. wait() blocks
+    until every submitted artifact is written.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Tuple[str, Future]] = []
+        self._lock = threading.Lock()
+
+    def submit(self, artifact: Any, path: str) -> None:
+        snapshot = artifact.snapshot()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="artifact-writer"
+                )
+            self._futures.append((path, self._executor.submit(snapshot.write, path)))
+
+    def wait(self, raise_errors: bool = True) -> None:
+        """Wait for the submitted artifacts to be written. The first error is
+        re-raised, or with raise_errors=False, every error is logged instead.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        error: Optional[BaseException] = None
+        for path, future in futures:
+            exc = future.exception()
+            if exc is None:
+                continue
+            if not raise_errors:
+                fire_event(ArtifactWriteFailed(path=path, exc=str(exc)))
+            elif error is None:
+                error = exc
+        if error is not None:
+            raise error
+
+
+ARTIFACT_WRITER = ArtifactWriter()
+
+
+def write_artifact(artifact: Any, path: str) -> None:
+    """Write the artifact to path in the background, or right away if
+    --blocking-artifact-writes is set.
+    """
+    if flags.BLOCKING_ARTIFACT_WRITES:
+        artifact.write(path)
+    else:
+        ARTIFACT_WRITER.submit(artifact, path)
+
+
+def wait_for_artifacts(raise_errors: bool = True) -> None:
+    ARTIFACT_WRITER.wait(raise_errors)
+
+
+# make sure artifacts are written before the interpreter exits
+atexit.register(wait_for_artifacts, False)
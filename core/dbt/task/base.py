@@ -6,6 +6,7 @@ from typing import Type, Union, Dict, Any, Optional
 
 from dbt import tracking
 from dbt import flags
+from dbt.compilation import CompiledSQLCache
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
     NodeStatus,
@@ -205,6 +206,8 @@ class BaseRunner(metaclass=ABCMeta):
 
         self.skip = False
         self.skip_cause: Optional[RunResult] = None
+        # set by the task when compiled SQL is cached
+        self.compiled_sql_cache: Optional[CompiledSQLCache] = None
 
     @abstractmethod
     def compile(self, manifest: Manifest) -> Any:
@@ -32,7 +32,7 @@ class CompileRunner(BaseRunner):
 
     def compile(self, manifest):
         compiler = self.adapter.get_compiler()
-        return compiler.compile_node(self.node, manifest, {})
+        return compiler.compile_node(self.node, manifest, {}, cache=self.compiled_sql_cache)
 
 
 class CompileTask(GraphRunnableTask):
@@ -2,6 +2,7 @@ import os
 import threading
 import time
 
+from .artifacts import write_artifact
 from .base import BaseRunner
 from .printer import (
     print_run_result_error,
@@ -205,7 +206,7 @@ class FreshnessTask(GraphRunnableTask):
 
     def write_result(self, result):
         artifact = FreshnessExecutionResultArtifact.from_result(result)
-        artifact.write(self.result_path())
+        write_artifact(artifact, self.result_path())
 
     def get_result(self, results, elapsed_time, generated_at):
         return FreshnessResult.from_node_results(
@@ -1,10 +1,12 @@
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from itertools import chain
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Set
 
 from dbt.dataclass_schema import ValidationError
 
+from .artifacts import write_artifact
 from .compile import CompileTask
 
 from dbt.adapters.factory import get_adapter
@@ -30,7 +32,11 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    IncrementalCatalogUnavailable,
+    IncrementalCatalogPlan,
 )
+from dbt.graph import UniqueId
+from dbt.graph.selector_methods import StateSelectorMethod
 from dbt.parser.manifest import ManifestLoader
 import dbt.utils
 import dbt.compilation
@@ -62,7 +68,7 @@ def build_catalog_table(data) -> CatalogTable:
 
 # keys are database name, schema name, table name
 class Catalog(Dict[CatalogKey, CatalogTable]):
-    def __init__(self, columns: List[PrimitiveDict]):
+    def __init__(self, columns: Iterable[PrimitiveDict]):
         super().__init__()
         for col in columns:
             self.add_column(col)
@@ -237,14 +243,16 @@ class GenerateTask(CompileTask):
         adapter = get_adapter(self.config)
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+            catalog = Catalog([])
+            schemas_filter: Optional[Set[Tuple[Optional[str], str]]] = None
+            if getattr(self.args, "incremental_catalog", False):
+                schemas_filter = self._reuse_previous_catalog(catalog)
+            catalog_rows, exceptions = adapter.get_catalog_rows(self.manifest, schemas_filter)
+            # rows are added to the catalog as each catalog query completes
+            for row in catalog_rows:
+                catalog.add_column(
+                    {key: dbt.utils._coerce_decimal(value) for key, value in row.items()}
+                )
 
         errors: Optional[List[str]] = None
         if exceptions:
@@ -260,7 +268,7 @@ class GenerateTask(CompileTask):
         )
 
         path = os.path.join(self.config.target_path, CATALOG_FILENAME)
-        results.write(path)
+        write_artifact(results, path)
         if self.args.compile:
             self.write_manifest()
 
@@ -269,6 +277,82 @@ class GenerateTask(CompileTask):
         fire_event(CatalogWritten(path=os.path.abspath(path)))
         return results
 
+    def _get_previous_catalog(self) -> Optional[CatalogArtifact]:
+        if self.previous_state is None or self.previous_state.manifest is None:
+            fire_event(IncrementalCatalogUnavailable(reason="no --state manifest to compare to"))
+            return None
+        path = self.previous_state.path / CATALOG_FILENAME
+        if not path.is_file():
+            fire_event(IncrementalCatalogUnavailable(reason=f"no previous catalog at {path}"))
+            return None
+        try:
+            return CatalogArtifact.read_and_check_versions(str(path))
+        except dbt.exceptions.RuntimeException as exc:
+            fire_event(IncrementalCatalogUnavailable(reason=str(exc)))
+            return None
+
+    def _get_changed_schemas(
+        self, previous_catalog: CatalogArtifact
+    ) -> Set[Tuple[Optional[str], str]]:
+        """Find the schemas whose catalog entries must be queried again: those
+        with nodes or sources that are modified or new according to the
+        --state manifest, or that are missing from the previous catalog.
+        """
+        manifest = self._get_manifest()
+        previous_keys = {
+            table.key()
+            for table in chain(previous_catalog.nodes.values(), previous_catalog.sources.values())
+        }
+        relations: Dict[str, CompileResultNode] = {
+            unique_id: node
+            for unique_id, node in manifest.nodes.items()
+            if node.is_relational and not node.is_ephemeral_model
+        }
+        relations.update(manifest.sources)
+
+        method = StateSelectorMethod(manifest, self.previous_state, [])
+        changed = set(method.search({UniqueId(uid) for uid in relations}, "modified"))
+
+        schemas: Set[Tuple[Optional[str], str]] = set()
+        for unique_id, node in relations.items():
+            key = mapping_key(node)
+            if unique_id in changed or key not in previous_keys:
+                schemas.add((key.database, key.schema))
+        return schemas
+
+    def _reuse_previous_catalog(
+        self, catalog: Catalog
+    ) -> Optional[Set[Tuple[Optional[str], str]]]:
+        """Add the previous catalog's tables for every unchanged schema to the
+        catalog, and return the schemas that still have to be queried. If the
+        previous catalog can't be used, return None to query everything.
+        """
+        previous_catalog = self._get_previous_catalog()
+        if previous_catalog is None:
+            return None
+
+        manifest = self._get_manifest()
+        changed_schemas = self._get_changed_schemas(previous_catalog)
+        used_schemas = {
+            (dbt.utils.lowercase(database), schema.lower())
+            for database, schema in manifest.get_used_schemas()
+            if schema is not None
+        }
+        reused_schemas = used_schemas - changed_schemas
+
+        table: CatalogTable
+        for table in chain(previous_catalog.nodes.values(), previous_catalog.sources.values()):
+            key = table.key()
+            if (key.database, key.schema) in reused_schemas:
+                catalog[key] = table.replace(unique_id=None)
+
+        fire_event(
+            IncrementalCatalogPlan(
+                num_reused=len(reused_schemas), num_queried=len(used_schemas & changed_schemas)
+            )
+        )
+        return changed_schemas
+
     def get_catalog_results(
         self,
         nodes: Dict[str, CatalogTable],
@@ -6,6 +6,7 @@
 # flag and an output file: dbt -r dbt.cprof parse.
 # Use a visualizer such as snakeviz to look at the output:
 # snakeviz dbt.cprof
+from dbt.task.artifacts import write_artifact
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.factory import get_adapter
 from dbt.parser.manifest import Manifest, ManifestLoader, _check_manifest
@@ -45,7 +46,7 @@ class ParseTask(ConfiguredTask):
 
     def write_manifest(self):
         path = os.path.join(self.config.target_path, MANIFEST_FILE_NAME)
-        self.manifest.write(path)
+        write_artifact(self.manifest.writable_manifest(), path)
 
     def write_perf_info(self):
         path = os.path.join(self.config.target_path, PERF_INFO_FILE_NAME)
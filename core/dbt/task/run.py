@@ -2,7 +2,7 @@ import functools
 import threading
 import time
 from datetime import datetime
-from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from dbt import tracking, utils
 from dbt.adapters.base import BaseRelation
@@ -10,6 +10,7 @@ from dbt.clients.jinja import MacroGenerator
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import WritableManifest
+from dbt.contracts.state import StateManifest
 from dbt.contracts.graph.model_config import Hook
 from dbt.contracts.graph.parsed import ParsedHookNode
 from dbt.contracts.results import (
@@ -405,7 +406,7 @@ class RunTask(CompileTask):
             fire_event(EmptyLine())
         fire_event(HookFinished(stat_line=stat_line, execution=execution))
 
-    def _get_deferred_manifest(self) -> Optional[WritableManifest]:
+    def _get_deferred_manifest(self) -> Optional[Union[WritableManifest, StateManifest]]:
         if not self.args.defer:
             return None
 
@@ -13,6 +13,9 @@ from .printer import (
 )
 
 from dbt.clients.system import write_file
+from dbt.compilation import CompiledSQLCache
+from dbt.helper_types import Lazy
+from dbt.task.artifacts import write_artifact
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.base import BaseRelation
 from dbt.adapters.factory import get_adapter
@@ -25,7 +28,7 @@ from dbt.logger import (
     ModelMetadata,
     NodeCount,
 )
-from dbt.events.functions import fire_event
+from dbt.events.functions import event_enabled, fire_event
 from dbt.events.types import (
     EmptyLine,
     PrintCancelLine,
@@ -71,7 +74,7 @@ class ManifestTask(ConfiguredTask):
     def write_manifest(self):
         if flags.WRITE_JSON:
             path = os.path.join(self.config.target_path, MANIFEST_FILE_NAME)
-            self.manifest.write(path)
+            write_artifact(self.manifest.writable_manifest(), path)
         if os.getenv("DBT_WRITE_FILES"):
             path = os.path.join(self.config.target_path, "files.json")
             write_file(path, json.dumps(self.manifest.files, cls=dbt.utils.JSONEncoder, indent=4))
@@ -113,10 +116,13 @@ class GraphRunnableTask(ManifestTask):
         self._raise_next_tick = None
         self.previous_state: Optional[PreviousState] = None
         self.set_previous_state()
+        self.compiled_sql_cache: Optional[CompiledSQLCache] = None
+        if flags.COMPILED_SQL_CACHE:
+            self.compiled_sql_cache = CompiledSQLCache(self.config)
 
     def set_previous_state(self):
         if self.args.state is not None:
-            self.previous_state = PreviousState(self.args.state)
+            self.previous_state = PreviousState(self.args.state, self.config.target_path)
 
     def index_offset(self, value: int) -> int:
         return value
@@ -196,7 +202,9 @@ class GraphRunnableTask(ManifestTask):
             num_nodes = self.num_nodes
 
         cls = self.get_runner_type(node)
-        return cls(self.config, adapter, node, run_count, num_nodes)
+        runner = cls(self.config, adapter, node, run_count, num_nodes)
+        runner.compiled_sql_cache = self.compiled_sql_cache
+        return runner
 
     def call_runner(self, runner):
         uid_context = UniqueID(runner.node.unique_id)
@@ -221,15 +229,17 @@ class GraphRunnableTask(ManifestTask):
                 runner.node._event_status["node_status"] = result.status
                 runner.node._event_status["finished_at"] = datetime.utcnow().isoformat()
             finally:
-                finishctx = TimestampNamed("finished_at")
-                with finishctx, DbtModelState(status):
-                    fire_event(
-                        NodeFinished(
-                            node_info=runner.node.node_info,
-                            unique_id=runner.node.unique_id,
-                            run_result=result.to_dict(),
+                # only build the node info and the run result if they're logged
+                if event_enabled(NodeFinished):
+                    finishctx = TimestampNamed("finished_at")
+                    with finishctx, DbtModelState(status):
+                        fire_event(
+                            NodeFinished(
+                                node_info=runner.node.node_info,
+                                unique_id=runner.node.unique_id,
+                                run_result=Lazy.defer(result.to_dict),
+                            )
                         )
-                    )
             # `_event_status` dict is only used for logging.  Make sure
             # it gets deleted when we're done with it
             del runner.node._event_status["started_at"]
@@ -436,7 +446,7 @@ class GraphRunnableTask(ManifestTask):
         return result
 
     def write_result(self, result):
-        result.write(self.result_path())
+        write_artifact(result, self.result_path())
 
     def run(self):
         """
@@ -462,6 +472,8 @@ class GraphRunnableTask(ManifestTask):
                 fire_event(EmptyLine())
             selected_uids = frozenset(n.unique_id for n in self._flattened_nodes)
             result = self.execute_with_hooks(selected_uids)
+            if self.compiled_sql_cache is not None:
+                self.compiled_sql_cache.prune(self.manifest)
 
         if flags.WRITE_JSON:
             self.write_manifest()
@@ -5,6 +5,7 @@ from .printer import (
     print_run_end_messages,
 )
 
+from dbt.clients.agate_helper import StreamingSeedTable
 from dbt.contracts.results import RunStatus
 from dbt.exceptions import InternalException
 from dbt.graph import ResourceTypeSelector
@@ -102,6 +103,8 @@ class SeedTask(RunTask):
 
     def show_table(self, result):
         table = result.agate_table
+        if isinstance(table, StreamingSeedTable):
+            table = table.sample
         rand_table = table.order_by(lambda x: random.random())
 
         schema = result.node.schema
@@ -49,6 +49,13 @@ except ImportError:
 else:
     DECIMALS = (decimal.Decimal, cdecimal.Decimal)
 
+# orjson is a much faster json encoder. It's used to read artifacts when it's
+# installed, and to write them when --fast-json-artifacts is also set.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class ExitCodes(int, Enum):
     Success = 0
@@ -337,6 +344,46 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_ORJSON_DEFAULT = JSONEncoder().default
+
+
+def use_orjson() -> bool:
+    """Whether dumps_json_fast writes JSON with orjson."""
+    return orjson is not None and bool(flags.FAST_JSON_ARTIFACTS)
+
+
+def dumps_json_fast(obj: Any) -> str:
+    """Serialize obj to JSON like json.dumps(obj, cls=JSONEncoder) does.
+
+    With --fast-json-artifacts and orjson installed, orjson is used instead.
+    Its output isn't byte for byte the same: it has no whitespace after
+    separators, doesn't escape non-ASCII characters, and writes NaN and
+    infinite floats as null. Values orjson can't handle (like integers wider
+    than 64 bits) fall back to the json module.
+    """
+    if use_orjson():
+        try:
+            return orjson.dumps(
+                obj, default=_ORJSON_DEFAULT, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, cls=JSONEncoder)
+
+
+def loads_json_fast(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document, using orjson if it's installed. Documents
+    orjson rejects (like ones with integers wider than 64 bits) fall back to
+    the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
 class ForgivingJSONEncoder(JSONEncoder):
     def default(self, obj):
         # let dbt's default JSON encoder handle it if possible, fallback to
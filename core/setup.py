@@ -60,6 +60,7 @@ setup(
         "isodate>=0.6,<0.7",
         "logbook>=1.5,<1.6",
         "mashumaro==2.9",
+        "msgpack>=1.0,<2",
         "minimal-snowplow-tracker==0.0.2",
         "networkx>=2.3,<3",
         "packaging>=20.9,<22.0",
@@ -72,6 +73,10 @@ setup(
         "idna>=2.5,<4",
         "cffi>=1.9,<2.0.0",
     ],
+    extras_require={
+        # faster artifact reads, and writes with --fast-json-artifacts
+        "fast-json": ["orjson>=3.6,<4"],
+    },
     zip_safe=False,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""Measure how many events per second go through fire_event.
+
+Simulates the events fired while running a project of --nodes models: for
+each node, a NodeStart, a SQLQuery with the compiled SQL, a SQLQueryStatus
+and a NodeFinished carrying the node's run result. Events are written to a
+log file in a temporary directory; stdout is discarded.
+
+usage:
+    python performance/benchmarks/fire_event.py [--nodes 10000] [--debug]
+        [--log-format json] [--async-logging] [--eager-payloads]
+
+--eager-payloads serializes each run result up front, the way NodeFinished
+was fired before its run result was made lazy.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from argparse import Namespace
+
+import dbt.events.functions as event_funcs
+import dbt.flags as flags
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.model_config import NodeConfig
+from dbt.contracts.graph.parsed import DependsOn, ParsedModelNode
+from dbt.contracts.results import RunResult, RunStatus, TimingInfo
+from dbt.events.types import NodeFinished, NodeStart, SQLQuery, SQLQueryStatus
+from dbt.helper_types import Lazy
+from dbt.node_types import NodeType
+
+SQL = "select {cols}\nfrom {{{{ ref('upstream') }}}}\nwhere id is not null".format(
+    cols=",\n  ".join(f"col_{i}" for i in range(40))
+)
+
+
+def make_result(n: int) -> RunResult:
+    name = f"model_{n}"
+    node = ParsedModelNode(
+        alias=name,
+        name=name,
+        database="dbt",
+        schema="analytics",
+        resource_type=NodeType.Model,
+        unique_id=f"model.root.{name}",
+        fqn=["root", name],
+        package_name="root",
+        original_file_path=f"models/{name}.sql",
+        root_path="/usr/src/app",
+        refs=[["upstream"]],
+        sources=[],
+        depends_on=DependsOn(nodes=["model.root.upstream"]),
+        config=NodeConfig.from_dict({"materialized": "table"}),
+        tags=[],
+        path=f"{name}.sql",
+        raw_sql=SQL,
+        description="",
+        columns={},
+        checksum=FileHash.from_contents(SQL),
+    )
+    return RunResult(
+        status=RunStatus.Success,
+        timing=[TimingInfo(name="compile"), TimingInfo(name="execute")],
+        thread_id="Thread-1",
+        execution_time=0.1,
+        adapter_response={"_message": "SELECT 1", "rows_affected": 1},
+        message="SELECT 1",
+        failures=None,
+        node=node,
+    )
+
+
+def fire_node_events(result: RunResult, eager_payloads: bool) -> None:
+    node = result.node
+    event_funcs.fire_event(NodeStart(node_info=node.node_info, unique_id=node.unique_id))
+    event_funcs.fire_event(SQLQuery(conn_name=node.unique_id, sql=node.raw_sql))
+    event_funcs.fire_event(SQLQueryStatus(status="SELECT 1", elapsed=0.1))
+    if eager_payloads:
+        run_result = result.to_dict()
+        payload = Lazy.defer(lambda: run_result)
+    else:
+        payload = Lazy.defer(result.to_dict)
+    event_funcs.fire_event(
+        NodeFinished(node_info=node.node_info, unique_id=node.unique_id, run_result=payload)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--debug", action="store_true", default=None)
+    parser.add_argument("--log-format", default=None)
+    parser.add_argument("--async-logging", action="store_true", default=None)
+    parser.add_argument("--eager-payloads", action="store_true")
+    args = parser.parse_args()
+
+    flags.set_from_args(
+        Namespace(
+            debug=args.debug,
+            log_format=args.log_format,
+            async_logging=args.async_logging,
+            use_colors=False,
+        ),
+        None,
+    )
+    results = [make_result(n) for n in range(args.nodes)]
+
+    with tempfile.TemporaryDirectory() as log_path, open(os.devnull, "w") as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            event_funcs.setup_event_logger(log_path)
+            start = time.perf_counter()
+            for result in results:
+                fire_node_events(result, args.eager_payloads)
+            event_funcs.cleanup_event_logger()
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = stdout
+
+    num_events = args.nodes * 4
+    print(
+        f"{num_events} events for {args.nodes} nodes in {elapsed:.2f}s: "
+        f"{num_events / elapsed:,.0f} events/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
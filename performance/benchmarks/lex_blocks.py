@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Measure how fast top-level jinja blocks are extracted from macro files.
+
+Reads every .sql file under the macro paths of the global project and the
+adapter plugins (or under --path), then times extract_toplevel_blocks over
+all of them, the way the macro and snapshot parsers call it.
+
+usage:
+    python performance/benchmarks/lex_blocks.py [--path DIR ...] [--repeat 20]
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import List
+
+from dbt.clients.jinja import extract_toplevel_blocks
+
+ALLOWED_BLOCKS = {"macro", "materialization", "test", "snapshot", "docs"}
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_PATHS = [
+    REPO_ROOT / "core" / "dbt" / "include" / "global_project",
+    REPO_ROOT / "plugins",
+]
+
+
+def read_files(paths: List[Path]) -> List[str]:
+    files = []
+    for path in paths:
+        for root, _, names in os.walk(path):
+            for name in sorted(names):
+                if name.endswith(".sql"):
+                    files.append((Path(root) / name).read_text())
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", type=Path, action="append")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    files = read_files(args.path or DEFAULT_PATHS)
+    size = sum(len(data.encode("utf-8")) for data in files)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for data in files:
+            extract_toplevel_blocks(data, allowed_blocks=ALLOWED_BLOCKS, collect_raw_data=False)
+    elapsed = time.perf_counter() - start
+
+    megabytes = size * args.repeat / 1_000_000
+    print(
+        f"{len(files)} files ({size / 1000:,.0f} kB) x {args.repeat} in {elapsed:.2f}s: "
+        f"{megabytes / elapsed:,.2f} MB/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
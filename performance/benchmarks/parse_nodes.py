@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Measure how many nodes per second parsers can build from their dicts.
+
+Builds the dicts ModelParser and SchemaParser build for --nodes models, each
+with a not_null and an accepted_values test, then times building the parsed
+nodes from them, the way the parsers do. Configs are built up front, since
+they're validated whether or not nodes are.
+
+usage:
+    python performance/benchmarks/parse_nodes.py [--nodes 10000] [--validate]
+
+--validate validates each node against its json schema first, the way nodes
+are built with DBT_VALIDATE_PARSED_NODES set.
+"""
+import argparse
+import time
+from typing import Any, Dict, List, Tuple, Type
+
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.model_config import NodeConfig, TestConfig
+from dbt.contracts.graph.parsed import ParsedGenericTestNode, ParsedModelNode, ParsedNode
+from dbt.node_types import NodeType
+
+SQL = "select {cols}\nfrom {{{{ ref('upstream') }}}}\nwhere id is not null".format(
+    cols=",\n  ".join(f"col_{i}" for i in range(40))
+)
+
+
+def model_dict(n: int) -> Dict[str, Any]:
+    name = f"model_{n}"
+    return {
+        "alias": name,
+        "schema": "analytics",
+        "database": "dbt",
+        "fqn": ["root", "staging", name],
+        "name": name,
+        "root_path": "/usr/src/app",
+        "resource_type": NodeType.Model,
+        "path": f"staging/{name}.sql",
+        "original_file_path": f"models/staging/{name}.sql",
+        "package_name": "root",
+        "raw_sql": SQL,
+        "unique_id": f"model.root.{name}",
+        "config": NodeConfig.from_dict({"materialized": "view"}).to_dict(omit_none=True),
+        "checksum": FileHash.from_contents(SQL).to_dict(omit_none=True),
+    }
+
+
+def generic_test_dict(n: int, test_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    name = f"{test_name}_model_{n}_id"
+    raw_sql = "{{ test_%s(**_dbt_generic_test_kwargs) }}" % test_name
+    return {
+        "alias": name,
+        "schema": "analytics",
+        "database": "dbt",
+        "fqn": ["root", "staging", name],
+        "name": name,
+        "root_path": "/usr/src/app",
+        "resource_type": NodeType.Test,
+        "tags": [],
+        "path": f"{name}.sql",
+        "original_file_path": "models/staging/schema.yml",
+        "package_name": "root",
+        "raw_sql": raw_sql,
+        "unique_id": f"test.root.{name}.{n:010x}",
+        "config": TestConfig.from_dict({}).to_dict(omit_none=True),
+        "test_metadata": {
+            "namespace": None,
+            "name": test_name,
+            "kwargs": dict(
+                kwargs,
+                column_name="id",
+                model=f"{{{{ get_where_subquery(ref('model_{n}')) }}}}",
+            ),
+        },
+        "column_name": "id",
+        "checksum": FileHash.empty().to_dict(omit_none=True),
+        "file_key_name": f"models.model_{n}",
+    }
+
+
+def node_dicts(num_models: int) -> List[Tuple[Type[ParsedNode], Dict[str, Any]]]:
+    dicts: List[Tuple[Type[ParsedNode], Dict[str, Any]]] = []
+    for n in range(num_models):
+        dicts.append((ParsedModelNode, model_dict(n)))
+        dicts.append((ParsedGenericTestNode, generic_test_dict(n, "not_null", {})))
+        dicts.append(
+            (
+                ParsedGenericTestNode,
+                generic_test_dict(n, "accepted_values", {"values": ["a", "b", "c"]}),
+            )
+        )
+    return dicts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--validate", action="store_true")
+    args = parser.parse_args()
+
+    dicts = node_dicts(args.nodes)
+    start = time.perf_counter()
+    for cls, dct in dicts:
+        if args.validate:
+            cls.validate(dct)
+        cls.from_dict(dct)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(dicts)} nodes for {args.nodes} models in {elapsed:.2f}s: "
+        f"{len(dicts) / elapsed:,.0f} nodes/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
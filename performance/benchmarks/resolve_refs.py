@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Measure how fast the refs in parsed nodes are resolved.
+
+Builds a manifest of --nodes models in a root project and a package, each
+with --refs refs to other models, a tenth of them naming the package they're
+in, then times resolving them, the way ManifestLoader.process_refs does
+after parsing.
+
+usage:
+    python performance/benchmarks/resolve_refs.py [--nodes 10000] [--refs 3] [--repeat 5]
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.model_config import NodeConfig
+from dbt.contracts.graph.parsed import ParsedModelNode
+from dbt.node_types import NodeType
+from dbt.parser.manifest import ResolvedRefs, _process_refs_for_node
+
+PACKAGES = ["root", "package"]
+CONFIG = NodeConfig.from_dict({"materialized": "view"}).to_dict(omit_none=True)
+CHECKSUM = FileHash.empty().to_dict(omit_none=True)
+
+
+def model_dict(n: int, refs: List[List[str]]) -> Dict[str, Any]:
+    name = f"model_{n}"
+    package = PACKAGES[n % len(PACKAGES)]
+    return {
+        "alias": name,
+        "schema": "analytics",
+        "database": "dbt",
+        "fqn": [package, name],
+        "name": name,
+        "root_path": "/usr/src/app",
+        "resource_type": NodeType.Model,
+        "path": f"{name}.sql",
+        "original_file_path": f"models/{name}.sql",
+        "package_name": package,
+        "raw_sql": "select 1 as id",
+        "unique_id": f"model.{package}.{name}",
+        "config": CONFIG,
+        "checksum": CHECKSUM,
+        "refs": refs,
+    }
+
+
+def build_manifest(num_models: int, num_refs: int) -> Manifest:
+    rng = random.Random(0)
+    manifest = Manifest()
+    for n in range(num_models):
+        refs = []
+        for _ in range(num_refs):
+            target = rng.randrange(num_models)
+            if rng.random() < 0.1:
+                refs.append([PACKAGES[target % len(PACKAGES)], f"model_{target}"])
+            else:
+                refs.append([f"model_{target}"])
+        manifest.add_node_nofile(ParsedModelNode.from_dict(model_dict(n, refs)))
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--refs", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.nodes, args.refs)
+    elapsed = 0.0
+    for _ in range(args.repeat):
+        for node in manifest.nodes.values():
+            node.depends_on.nodes = []
+        manifest.rebuild_ref_lookup()
+        manifest.rebuild_disabled_lookup()
+        start = time.perf_counter()
+        resolved: ResolvedRefs = {}
+        for node in manifest.nodes.values():
+            _process_refs_for_node(manifest, "root", node, resolved)
+        elapsed += time.perf_counter() - start
+
+    num_refs = args.nodes * args.refs
+    print(
+        f"{num_refs} refs in {args.nodes} nodes x {args.repeat} in {elapsed:.2f}s: "
+        f"{num_refs * args.repeat / elapsed:,.0f} refs/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import io
+import time
 from contextlib import contextmanager
+from uuid import uuid4
 
 import psycopg2
 
@@ -7,10 +10,12 @@ from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.contracts.connection import AdapterResponse
 from dbt.events import AdapterLogger
+from dbt.events.functions import fire_event
+from dbt.events.types import ConnectionUsed, SQLQuery, SQLQueryStatus
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 
 logger = AdapterLogger("Postgres")
@@ -55,6 +60,68 @@ class PostgresCredentials(Credentials):
         )
 
 
+class CsvRowReader(io.TextIOBase):
+    """A read-only file-like object that renders rows as CSV on demand, so
+    they can be streamed to `COPY ... FROM STDIN` without building the whole
+    file in memory.
+
+    None is written as an unquoted empty field, which COPY reads as NULL,
+    while strings are always quoted so empty strings stay empty strings.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows: Iterator[Sequence[Any]] = iter(rows)
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if value is None:
+            return ""
+        elif isinstance(value, bool):
+            return "true" if value else "false"
+        elif isinstance(value, str):
+            return '"{}"'.format(value.replace('"', '""'))
+        return str(value)
+
+    def _next_chunk(self) -> str:
+        lines = []
+        length = 0
+        for row in self._rows:
+            line = ",".join([self._format(value) for value in row])
+            lines.append(line)
+            length += len(line) + 1
+            if length >= self.CHUNK_SIZE:
+                break
+        if not lines:
+            return ""
+        lines.append("")
+        return "\n".join(lines)
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            chunks = [self._pending]
+            while True:
+                chunk = self._next_chunk()
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            self._pending = ""
+            return "".join(chunks)
+
+        while len(self._pending) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._pending += chunk
+        result, self._pending = self._pending[:size], self._pending[size:]
+        return result
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
 
@@ -170,6 +237,36 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         logger.debug("Cancel query '{}': {}".format(connection_name, res))
 
+    def open_cursor(self, connection, server_side=False):
+        if not server_side:
+            return super().open_cursor(connection, server_side)
+        # a named cursor is a server-side cursor: psycopg2 declares it in the
+        # current transaction and pulls rows from it `itersize` at a time
+        cursor = connection.handle.cursor(name="dbt_cursor_{}".format(uuid4().hex))
+        cursor.itersize = self.FETCH_BATCH_SIZE
+        return cursor
+
+    def copy_from_rows(self, sql: str, rows: Iterable[Sequence[Any]]) -> AdapterResponse:
+        """Run a `COPY ... FROM STDIN WITH (FORMAT csv)` statement, streaming
+        the given rows to it as CSV.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+
+        sql = self._add_query_comment(sql)
+        with self.exception_handler(sql):
+            fire_event(SQLQuery(conn_name=connection.name, sql=sql))
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, CsvRowReader(rows))
+            response = self.get_response(cursor)
+
+            fire_event(SQLQueryStatus(status=str(response), elapsed=round((time.time() - pre), 2)))
+            return response
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
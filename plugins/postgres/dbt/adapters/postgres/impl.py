@@ -81,6 +81,21 @@ class PostgresAdapter(SQLAdapter):
         # return an empty string on success so macros can call this
         return ""
 
+    def supports_copy_from_stdin(self) -> bool:
+        """Adapters that subclass this one, like Redshift, inherit
+        load_seed_bulk, but their databases may not support COPY FROM STDIN.
+        They insert seeds in batches unless they override this.
+        """
+        return self.type() == "postgres"
+
+    @available
+    def load_seed_bulk(self, relation, agate_table, column_names_csv: str) -> Optional[str]:
+        if not self.supports_copy_from_stdin():
+            return None
+        sql = "copy {} ({}) from stdin with (format csv)".format(relation, column_names_csv)
+        self.connections.copy_from_rows(sql, agate_table.rows)
+        return sql
+
     @available
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
@@ -71,6 +71,62 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def test_streaming_seed_table(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        expected_tbl = agate_helper.from_csv(path, ())
+        tbl = agate_helper.StreamingSeedTable(path, ())
+        self.assertEqual(tbl.column_names, expected_tbl.column_names)
+        self.assertEqual(
+            [type(t) for t in tbl.column_types],
+            [type(t) for t in expected_tbl.column_types],
+        )
+        self.assertEqual(len(tbl.rows), len(EXPECTED))
+        # rows can be read more than once
+        for _ in range(2):
+            self.assertEqual([list(row) for row in tbl.rows], EXPECTED)
+        self.assertEqual([list(row) for row in tbl.sample], EXPECTED)
+        self.assertEqual(agate_helper.as_matrix(tbl), tbl.rows)
+
+    def test_streaming_seed_table_types_beyond_sample(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(b'a,b,c\n1,1,x\n2,2.125,\n3,a string,y\n')
+        tbl = agate_helper.StreamingSeedTable(path, ('c',), sample_size=1)
+        self.assertIsInstance(tbl.column_types[0], agate.Number)
+        self.assertIsInstance(tbl.column_types[1], agate.Text)
+        self.assertIsInstance(tbl.column_types[2], agate.Text)
+        self.assertEqual(
+            list(tbl.rows),
+            [(1, '1', 'x'), (2, '2.125', None), (3, 'a string', 'y')],
+        )
+        self.assertEqual(len(tbl.sample), 1)
+        self.assertEqual(list(tbl.rows.batches(2)), [[(1, '1', 'x'), (2, '2.125', None)], [(3, 'a string', 'y')]])
+
+    def test_streaming_seed_table_profile(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(b'a,b\n1,x\n2,xy\n3.25,xyz\n')
+        tbl = agate_helper.StreamingSeedTable(path, (), sample_size=1)
+        # aggregates see the extreme values beyond the sample
+        self.assertEqual(tbl.aggregate(agate.MaxPrecision('a')), 2)
+        self.assertEqual(tbl.aggregate(agate.MaxLength('b')), 3)
+
+    def test_streaming_seed_table_unsupported(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write('a,b\n1,\u00e9\u00e9\n2,xyz\n'.encode('utf-8'))
+        tbl = agate_helper.StreamingSeedTable(path, (), sample_size=1)
+        # longest by characters, like agate's MaxLength, not by utf-8 bytes
+        self.assertEqual(list(tbl.profile.rows[1]), [1, 'xyz'])
+        with self.assertRaisesRegex(AttributeError, 'column_names, column_types, rows'):
+            tbl.columns
+        with self.assertRaises(AttributeError):
+            tbl.where(lambda row: True)
+        with self.assertRaises(NotImplementedError):
+            tbl.aggregate(agate.Sum('a'))
+
     def test_from_data(self):
         column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
         data = [
@@ -0,0 +1,105 @@
+import copy
+import threading
+import unittest
+from dataclasses import dataclass, field
+from typing import Dict, List
+from unittest import mock
+
+import dbt.main
+from dbt.events.types import ArtifactWriteFailed
+from dbt.task.artifacts import ArtifactWriter, write_artifact
+
+
+class FakeArtifactSnapshot:
+    def __init__(self, artifact, nodes, results):
+        self.artifact = artifact
+        self.nodes = nodes
+        self.results = results
+
+    def write(self, path):
+        self.artifact.gate.wait(5)
+        if path == 'bad':
+            raise ValueError('could not write')
+        # the items are only serialized when the snapshot is written
+        self.artifact.written.append((path, copy.deepcopy(self.nodes), list(self.results)))
+
+
+@dataclass
+class FakeArtifact:
+    nodes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    results: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.written = []
+        self.gate = threading.Event()
+
+    def snapshot(self):
+        return FakeArtifactSnapshot(self, dict(self.nodes), list(self.results))
+
+    def write(self, path):
+        self.snapshot().write(path)
+
+
+class TestArtifactWriter(unittest.TestCase):
+    def test_writes_snapshot_in_order(self):
+        writer = ArtifactWriter()
+        artifact = FakeArtifact(nodes={'a': {'config': 'x'}}, results=['r1'])
+        writer.submit(artifact, 'first')
+        # nodes and results added or replaced after submitting aren't written
+        artifact.nodes['a'] = {'config': 'z'}
+        artifact.nodes['b'] = {'config': 'y'}
+        artifact.results.append('r2')
+        writer.submit(artifact, 'second')
+        artifact.gate.set()
+        writer.wait()
+        self.assertEqual(artifact.written, [
+            ('first', {'a': {'config': 'x'}}, ['r1']),
+            ('second', {'a': {'config': 'z'}, 'b': {'config': 'y'}}, ['r1', 'r2']),
+        ])
+
+    def test_wait_raises_errors(self):
+        writer = ArtifactWriter()
+        artifact = FakeArtifact()
+        artifact.gate.set()
+        writer.submit(artifact, 'bad')
+        writer.submit(artifact, 'good')
+        with self.assertRaises(ValueError):
+            writer.wait()
+        self.assertEqual(artifact.written, [('good', {}, [])])
+        # errors are only raised once
+        writer.wait()
+
+    def test_wait_can_log_errors(self):
+        writer = ArtifactWriter()
+        artifact = FakeArtifact()
+        artifact.gate.set()
+        writer.submit(artifact, 'bad')
+        with mock.patch('dbt.task.artifacts.fire_event') as fire_event:
+            writer.wait(raise_errors=False)
+        fire_event.assert_called_once_with(
+            ArtifactWriteFailed(path='bad', exc='could not write')
+        )
+
+    def test_task_errors_are_not_replaced(self):
+        writer = ArtifactWriter()
+        artifact = FakeArtifact()
+        artifact.gate.set()
+        writer.submit(artifact, 'bad')
+        with mock.patch('dbt.task.artifacts.ARTIFACT_WRITER', writer), \
+                mock.patch('dbt.task.artifacts.fire_event') as fire_event, \
+                mock.patch('dbt.tracking.initialize_from_flags'), \
+                mock.patch('dbt.main.run_from_args', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                dbt.main.handle_and_check(['run'])
+        fire_event.assert_called_once_with(
+            ArtifactWriteFailed(path='bad', exc='could not write')
+        )
+
+    def test_blocking_writes(self):
+        artifact = FakeArtifact()
+        artifact.gate.set()
+        with mock.patch('dbt.flags.BLOCKING_ARTIFACT_WRITES', True), \
+                mock.patch('dbt.task.artifacts.ARTIFACT_WRITER') as writer:
+            write_artifact(artifact, 'path')
+        self.assertEqual(artifact.written, [('path', {}, [])])
+        writer.submit.assert_not_called()
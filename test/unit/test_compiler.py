@@ -1,12 +1,19 @@
+import os
+import random
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+import sqlparse
+
 import dbt.flags
 import dbt.compilation
 from dbt.adapters.postgres import Plugin
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.parsed import NodeConfig, DependsOn, ParsedModelNode
+from dbt.contracts.graph.parsed import (
+    ColumnInfo, NodeConfig, DependsOn, ParsedMacro, ParsedModelNode
+)
 from dbt.contracts.graph.compiled import CompiledModelNode, InjectedCTE
 from dbt.node_types import NodeType
 
@@ -377,7 +384,7 @@ class CompilerTest(unittest.TestCase):
                 {}
             )
             compile_node.assert_called_once_with(
-                parsed_ephemeral, manifest, {})
+                parsed_ephemeral, manifest, {}, None)
 
         self.assertEqual(result,
                          manifest.nodes.get('model.root.view'))
@@ -569,3 +576,326 @@ class CompilerTest(unittest.TestCase):
             'select * from __dbt__cte__inner_ephemeral')
         )
 
+
+    def test__compiled_node_from(self):
+        node = ParsedModelNode(
+            name='view',
+            database='dbt',
+            schema='analytics',
+            alias='view',
+            resource_type=NodeType.Model,
+            unique_id='model.root.view',
+            fqn=['root', 'view'],
+            package_name='root',
+            root_path='/usr/src/app',
+            refs=[['ephemeral']],
+            depends_on=DependsOn(nodes=['model.root.ephemeral']),
+            config=self.model_config,
+            tags=['a_tag'],
+            path='view.sql',
+            original_file_path='view.sql',
+            raw_sql='select * from {{ref("ephemeral")}}',
+            checksum=FileHash.from_contents(''),
+            unrendered_config={'materialized': 'view'},
+            config_call_dict={'materialized': 'view'},
+        )
+        node._event_status['node_status'] = 'compiling'
+
+        compiled = dbt.compilation._compiled_node_from(node)
+
+        data = node.to_dict(omit_none=True)
+        data.update({
+            'compiled': False,
+            'compiled_sql': None,
+            'extra_ctes_injected': False,
+            'extra_ctes': [],
+        })
+        self.assertEqual(compiled, CompiledModelNode.from_dict(data))
+        self.assertEqual(compiled.config_call_dict, {})
+        self.assertEqual(compiled._event_status, {})
+        # the compiled node doesn't share anything mutable with the parsed node
+        compiled.refs.append(['other'])
+        self.assertEqual(node.refs, [['ephemeral']])
+        compiled.config.materialized = 'table'
+        compiled.config.tags.append('b_tag')
+        compiled.depends_on.nodes.append('model.root.other')
+        compiled.docs.show = False
+        self.assertEqual(node.config.materialized, 'view')
+        self.assertEqual(node.config.tags, [])
+        self.assertEqual(node.depends_on.nodes, ['model.root.ephemeral'])
+        self.assertTrue(node.docs.show)
+
+    def _cache_manifest(self, view_sql):
+        ephemeral_config = self.model_config.replace(materialized='ephemeral')
+        return Manifest(
+            macros={},
+            nodes={
+                'model.root.view': ParsedModelNode(
+                    name='view',
+                    database='dbt',
+                    schema='analytics',
+                    alias='view',
+                    resource_type=NodeType.Model,
+                    unique_id='model.root.view',
+                    fqn=['root', 'view'],
+                    package_name='root',
+                    root_path='/usr/src/app',
+                    depends_on=DependsOn(nodes=['model.root.ephemeral']),
+                    config=self.model_config,
+                    path='view.sql',
+                    original_file_path='view.sql',
+                    raw_sql=view_sql,
+                    checksum=FileHash.from_contents(view_sql),
+                ),
+                'model.root.ephemeral': ParsedModelNode(
+                    name='ephemeral',
+                    database='dbt',
+                    schema='analytics',
+                    alias='ephemeral',
+                    resource_type=NodeType.Model,
+                    unique_id='model.root.ephemeral',
+                    fqn=['root', 'ephemeral'],
+                    package_name='root',
+                    root_path='/usr/src/app',
+                    config=ephemeral_config,
+                    path='ephemeral.sql',
+                    original_file_path='ephemeral.sql',
+                    raw_sql='select * from source_table',
+                    checksum=FileHash.from_contents(''),
+                ),
+            },
+            sources={},
+            docs={},
+            disabled=[],
+            files={},
+            exposures={},
+            metrics={},
+            selectors={},
+        )
+
+    def _compile_cached(self, view_sql, cache=None, manifest=None):
+        if manifest is None:
+            manifest = self._cache_manifest(view_sql)
+        if cache is None:
+            cache = dbt.compilation.CompiledSQLCache(self.config)
+        compiler = dbt.compilation.Compiler(self.config)
+        return compiler.compile_node(
+            manifest.nodes['model.root.view'], manifest, write=False, cache=cache
+        )
+
+    def test__compiled_sql_cache(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.config.target_path = target_path
+            view_sql = 'select * from {{ref("ephemeral")}}'
+            first = self._compile_cached(view_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 2)
+            cache_dir = os.path.join(target_path, dbt.compilation.COMPILED_SQL_CACHE_DIR)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # nothing changed: neither node is rendered again
+            second = self._compile_cached(view_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 2)
+            self.assertEqual(second.compiled_sql, first.compiled_sql)
+            self.assertEqual(second.extra_ctes, first.extra_ctes)
+
+            # the view changed: only the view is rendered again
+            self._compile_cached(view_sql + ' where id = 1')
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 3)
+
+            # introspective models are always rendered
+            introspective_sql = view_sql + '{# if is_incremental() #}'
+            self._compile_cached(introspective_sql)
+            self._compile_cached(introspective_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 5)
+
+            # dispatching isn't introspective, other adapter methods are
+            dispatch_sql = view_sql + '{# adapter.dispatch("x") #}'
+            self._compile_cached(dispatch_sql)
+            self._compile_cached(dispatch_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 6)
+            columns_sql = view_sql + '{# adapter.get_columns_in_relation(x) #}'
+            self._compile_cached(columns_sql)
+            self._compile_cached(columns_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 8)
+
+    def test__compiled_sql_cache_key_inputs(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.config.target_path = target_path
+            view_sql = 'select * from {{ref("ephemeral")}}'
+            self._compile_cached(view_sql)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 2)
+
+            # any other change to the node renders it again
+            manifest = self._cache_manifest(view_sql)
+            manifest.nodes['model.root.view'].columns['id'] = ColumnInfo(name='id')
+            self._compile_cached(view_sql, manifest=manifest)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 3)
+
+            # so does a change to the config of a relation it refers to
+            manifest = self._cache_manifest(view_sql)
+            ephemeral = manifest.nodes['model.root.ephemeral']
+            ephemeral.config = ephemeral.config.replace(quoting={'identifier': True})
+            self._compile_cached(view_sql, manifest=manifest)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 5)
+
+            # and a change to a macro overriding ref
+            ref_macro = ParsedMacro(
+                name='ref',
+                resource_type=NodeType.Macro,
+                unique_id='macro.root.ref',
+                package_name='root',
+                root_path='/usr/src/app',
+                path='macros/ref.sql',
+                original_file_path='macros/ref.sql',
+                macro_sql='{% macro ref(name) %}{{ return(builtins.ref(name)) }}{% endmacro %}',
+            )
+            for _ in range(2):
+                manifest = self._cache_manifest(view_sql)
+                manifest.macros[ref_macro.unique_id] = ref_macro
+                self._compile_cached(view_sql, manifest=manifest)
+                self.assertEqual(self.mock_generate_runtime_model_context.call_count, 7)
+
+    def test__compiled_sql_cache_hashes_invocation_once(self):
+        with tempfile.TemporaryDirectory() as target_path, \
+                patch.object(self.config, 'to_target_dict', wraps=self.config.to_target_dict) \
+                as to_target_dict:
+            self.config.target_path = target_path
+            cache = dbt.compilation.CompiledSQLCache(self.config)
+            self._compile_cached('select * from {{ref("ephemeral")}}', cache)
+            self._compile_cached('select * from {{ref("ephemeral")}} where id = 1', cache)
+            self.assertEqual(to_target_dict.call_count, 1)
+            # every invocation hashes its own inputs
+            self._compile_cached('select * from {{ref("ephemeral")}}')
+            self.assertEqual(to_target_dict.call_count, 2)
+
+    def test__compiled_sql_cache_prune(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.config.target_path = target_path
+            cache_dir = os.path.join(target_path, dbt.compilation.COMPILED_SQL_CACHE_DIR)
+            view_dir = os.path.join(cache_dir, 'model.root.view')
+            view_sql = 'select * from {{ref("ephemeral")}}'
+            self._compile_cached(view_sql)
+            cache = dbt.compilation.CompiledSQLCache(self.config)
+            self._compile_cached(view_sql + ' where id = 1', cache)
+            self.assertEqual(len(os.listdir(view_dir)), 2)
+
+            # only the entry used last is kept
+            manifest = self._cache_manifest(view_sql)
+            cache.prune(manifest)
+            self.assertEqual(len(os.listdir(view_dir)), 1)
+            self._compile_cached(view_sql + ' where id = 1', cache)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 3)
+
+            # nothing was compiled since, so nothing is pruned, except the
+            # entries of removed nodes
+            cache.prune(manifest)
+            cache.prune(manifest)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            self.assertEqual(len(os.listdir(view_dir)), 1)
+            del manifest.nodes['model.root.ephemeral']
+            cache.prune(manifest)
+            self.assertEqual(os.listdir(cache_dir), ['model.root.view'])
+
+    def test__compiled_sql_cache_disabled(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.config.target_path = target_path
+            view_sql = 'select * from {{ref("ephemeral")}}'
+            manifest = self._cache_manifest(view_sql)
+            compiler = dbt.compilation.Compiler(self.config)
+            compiler.compile_node(manifest.nodes['model.root.view'], manifest, write=False)
+            manifest = self._cache_manifest(view_sql)
+            compiler.compile_node(manifest.nodes['model.root.view'], manifest, write=False)
+            self.assertEqual(self.mock_generate_runtime_model_context.call_count, 4)
+            self.assertFalse(os.path.exists(
+                os.path.join(target_path, dbt.compilation.COMPILED_SQL_CACHE_DIR)))
+
+
+def sqlparse_inject_ctes(sql, ctes):
+    """How _inject_ctes_into_sql used to inject CTEs, with sqlparse."""
+    parsed = sqlparse.parse(sql)[0]
+    with_stmt = None
+    for token in parsed.tokens:
+        if token.is_keyword and token.normalized == "WITH":
+            with_stmt = token
+            break
+    if with_stmt is None:
+        first_token = parsed.token_first()
+        with_stmt = sqlparse.sql.Token(sqlparse.tokens.Keyword, "with")
+        parsed.insert_before(first_token, with_stmt)
+    else:
+        trailing_comma = sqlparse.sql.Token(sqlparse.tokens.Punctuation, ",")
+        parsed.insert_after(with_stmt, trailing_comma)
+    token = sqlparse.sql.Token(sqlparse.tokens.Keyword, ", ".join(c.sql for c in ctes))
+    parsed.insert_after(with_stmt, token)
+    return str(parsed)
+
+
+LEADING = ['', ' ', '\n\n', '\t  \n', '-- a comment\n', '/* block\n comment */', '/* c */ -- d\n  ']
+WITH_KEYWORDS = ['with', 'WITH', 'With']
+SEPARATORS = [' ', '\n', '\n  ', ' -- with\n', ' /* with */ ']
+BODIES = [
+    "select * from {ref}",
+    "select id, 'with' as word from {ref} where x = 'a -- b'",
+    "select *\nfrom (\n  with nested as (select 1) select * from nested\n) as t",
+    "select a.id -- with a comment\nfrom {ref} as a\njoin other as b on a.id = b.id",
+    "select \"with\" from {ref}\n/* trailing comment */\n",
+    "(select 1) union all (select 2)",
+    "select withdrawal_id from {ref}",
+]
+
+
+def make_model_sql(rng):
+    body = rng.choice(BODIES).format(ref='"dbt"."analytics"."upstream"')
+    if rng.random() < 0.5:
+        ctes = [f'cte_{i} as (\n  {rng.choice(BODIES).format(ref="raw")}\n)'
+                for i in range(rng.randint(1, 3))]
+        body = '{}{}{}\n{}'.format(
+            rng.choice(WITH_KEYWORDS), rng.choice(SEPARATORS), ',\n'.join(ctes), body)
+    return rng.choice(LEADING) + body
+
+
+class InjectCTEsTest(unittest.TestCase):
+    def setUp(self):
+        self.compiler = dbt.compilation.Compiler(None)
+        self.ctes = [
+            InjectedCTE(id='model.root.a', sql=' __dbt__cte__a as (\nselect 1\n)'),
+            InjectedCTE(id='model.root.b', sql=' __dbt__cte__b as (\nselect 2\n)'),
+        ]
+
+    def inject(self, sql):
+        return self.compiler._inject_ctes_into_sql(sql, self.ctes)
+
+    def test_no_ctes(self):
+        self.assertEqual(self.compiler._inject_ctes_into_sql('select 1', []), 'select 1')
+
+    def test_matches_sqlparse(self):
+        rng = random.Random(42)
+        for _ in range(500):
+            sql = make_model_sql(rng)
+            self.assertEqual(self.inject(sql), sqlparse_inject_ctes(sql, self.ctes), sql)
+
+    def test_with_recursive(self):
+        self.assertEqual(
+            self.inject('WITH RECURSIVE r as (select 1) select * from r'),
+            'WITH RECURSIVE  __dbt__cte__a as (\nselect 1\n),  __dbt__cte__b as (\nselect 2\n),'
+            'r as (select 1) select * from r'
+        )
+
+    def test_leading_comment(self):
+        self.assertEqual(
+            self.inject('  -- with\nselect 1'),
+            '  with __dbt__cte__a as (\nselect 1\n),  __dbt__cte__b as (\nselect 2\n)'
+            '-- with\nselect 1'
+        )
+        self.assertEqual(
+            self.inject('/* with */ with x as (select 1) select * from x'),
+            '/* with */ with  __dbt__cte__a as (\nselect 1\n),  __dbt__cte__b as (\nselect 2\n),'
+            'x as (select 1) select * from x'
+        )
+
+    def test_keeps_later_statements(self):
+        self.assertEqual(
+            self.inject('select 1; select 2'),
+            'with __dbt__cte__a as (\nselect 1\n),  __dbt__cte__b as (\nselect 2\n)'
+            'select 1; select 2'
+        )
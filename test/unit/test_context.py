@@ -15,6 +15,7 @@ from dbt.contracts.graph.parsed import (
 )
 from dbt.config.project import VarProvider
 from dbt.context import base, target, configured, providers, docs, manifest, macros
+from dbt.context.context_config import ContextConfigGenerator, UnrenderedConfigGenerator
 from dbt.contracts.files import FileHash
 from dbt.node_types import NodeType
 import dbt.exceptions
@@ -419,6 +420,65 @@ def test_docs_runtime_context(config_postgres):
     assert_has_keys(REQUIRED_DOCS_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_docs_runtime_contexts(config_postgres):
+    manifest = mock.MagicMock(files={})
+    manifest.resolve_doc.return_value = mock.MagicMock(block_contents='my doc')
+    contexts = docs.DocsRuntimeContexts(config_postgres, manifest, 'root')
+    model = mock_model()
+    other = mock_model()
+    other.package_name = 'other'
+    ctx = contexts.get(model)
+    assert_has_keys(REQUIRED_DOCS_KEYS, MAYBE_KEYS, ctx)
+    # shared within a package, but doc() uses the node it was last got for
+    assert contexts.get(model) is ctx
+    assert contexts.get(other) is not ctx
+    second = mock_model()
+    second.package_name = model.package_name
+    assert contexts.get(second) is ctx
+    assert ctx['doc']('my_doc') == 'my doc'
+    manifest.resolve_doc.assert_called_once_with(
+        'my_doc', None, 'root', second.package_name
+    )
+
+
+def test_context_config_cache(config_postgres, postgres_adapter):
+    models = {
+        '+tags': ['all'],
+        'root': {'staging': {'+materialized': 'table', 'legacy': {'+enabled': False}}},
+    }
+    config_postgres.models = models
+    config_postgres.unrendered.project_dict['models'] = models
+
+    def node_config(generator, fqn, config_call_dict):
+        return generator.calculate_node_config_dict(
+            config_call_dict, fqn, NodeType.Model, 'root', False
+        )
+
+    # tags are appended to in rendered configs, and replaced in unrendered ones
+    for generator, first_tags in (
+        (ContextConfigGenerator(config_postgres), ['all', 'first']),
+        (UnrenderedConfigGenerator(config_postgres), ['first']),
+    ):
+        first = node_config(generator, ['root', 'staging', 'first'], {'tags': ['first']})
+        second = node_config(generator, ['root', 'staging', 'second'], {})
+        third = node_config(generator, ['root', 'staging', 'legacy', 'third'], {})
+        assert first['materialized'] == second['materialized'] == 'table'
+        assert first['tags'] == first_tags
+        assert second['tags'] == ['all']
+        assert third['enabled'] is False
+        # siblings share what's resolved for their fqn prefix
+        _, cache = config_postgres.config_cache[(type(generator), NodeType.Model)]
+        assert sorted(key for key in cache if key[0] == 'layers') == [
+            ('layers', ('root', 'staging')),
+            ('layers', ('root', 'staging', 'legacy')),
+        ]
+
+    # replacing the project's configs drops what's cached for them
+    config_postgres.models = {'+materialized': 'ephemeral'}
+    generator = ContextConfigGenerator(config_postgres)
+    assert node_config(generator, ['root', 'staging', 'first'], {})['materialized'] == 'ephemeral'
+
+
 def test_macro_namespace_duplicates(config_postgres, manifest_fx):
     mn = macros.MacroNamespaceBuilder(
         'root', 'search', MacroStack(), ['dbt_postgres', 'dbt']
@@ -464,3 +524,68 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result['dbt']['some_macro'].macro is pg_macro
         assert result['root']['some_macro'].macro is package_macro
         assert result['some_macro'].macro is package_macro
+
+
+def test_context_config_cache_copies_nested_values(config_postgres, postgres_adapter):
+    models = {
+        'root': {
+            'staging': {'+meta': {'owner': {'name': 'data'}}, '+tags': ['staging']},
+        },
+    }
+    config_postgres.models = models
+    config_postgres.unrendered.project_dict['models'] = models
+
+    for generator in (
+        ContextConfigGenerator(config_postgres),
+        UnrenderedConfigGenerator(config_postgres),
+    ):
+        first, second = (
+            generator.calculate_node_config_dict(
+                {}, ['root', 'staging', name], NodeType.Model, 'root', False
+            )
+            for name in ('first', 'second')
+        )
+        assert first['meta'] == second['meta'] == {'owner': {'name': 'data'}}
+        # siblings don't share the objects resolved for their fqn prefix
+        assert first['meta']['owner'] is not second['meta']['owner']
+        assert first['tags'] is not second['tags']
+        first['meta']['owner']['name'] = 'changed'
+        first['tags'].append('changed')
+        third = generator.calculate_node_config_dict(
+            {}, ['root', 'staging', 'third'], NodeType.Model, 'root', False
+        )
+        assert third['meta'] == {'owner': {'name': 'data'}}
+        assert third['tags'] == ['staging']
+
+
+def test_context_config_layers_are_shared(config_postgres, postgres_adapter):
+    models = {
+        'root': {
+            'staging': {
+                '+meta': {'owner': {'name': 'data'}},
+                '+tags': ['staging'],
+                '+pre-hook': [{'sql': 'select 1', 'transaction': False}],
+            },
+        },
+    }
+    config_postgres.models = models
+    generator = ContextConfigGenerator(config_postgres)
+    first, second = (
+        generator._project_config_layers(config_postgres, ['root', 'staging', name], NodeType.Model)
+        for name in ('first', 'second')
+    )
+    # the layers aren't copied for each node, so they can't be changed
+    assert first is second
+    with pytest.raises(TypeError):
+        first[-1]['meta']['owner']['name'] = 'changed'
+    with pytest.raises(AttributeError):
+        first[-1]['tags'].append('changed')
+
+    config = generator.calculate_node_config(
+        {'meta': {'team': 'x'}}, ['root', 'staging', 'first'], NodeType.Model, 'root', False
+    )
+    assert config.meta == {'owner': {'name': 'data'}, 'team': 'x'}
+    assert type(config.meta['owner']) is dict
+    assert config.tags == ['staging']
+    assert config.pre_hook[0].sql == 'select 1'
+    assert config.pre_hook[0].transaction is False
@@ -352,3 +352,66 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def _node(self, schema, name):
+        return mock.MagicMock(
+            database='dbt', schema=schema, identifier=name,
+            is_relational=True, is_ephemeral_model=False,
+        )
+
+    def _table(self, schema, name):
+        return generate.CatalogTable(
+            metadata=generate.TableMetadata(type='BASE TABLE', schema=schema, name=name, database='dbt'),
+            columns={},
+            stats={},
+        )
+
+    def setUp(self):
+        self.manifest = mock.MagicMock()
+        self.manifest.nodes = {
+            'model.a': self._node('unchanged', 'a'),
+            'model.b': self._node('changed', 'b'),
+            'model.c': self._node('unchanged_but_new', 'c'),
+        }
+        self.manifest.sources = {}
+        self.manifest.get_used_schemas.return_value = frozenset({
+            ('dbt', 'unchanged'), ('dbt', 'changed'), ('dbt', 'unchanged_but_new'),
+        })
+
+        self.previous_catalog = generate.CatalogArtifact.from_results(
+            generated_at=datetime.utcnow(),
+            nodes={
+                'model.a': self._table('unchanged', 'a'),
+                'model.b': self._table('changed', 'b'),
+            },
+            sources={},
+            compile_results=None,
+            errors=None,
+        )
+
+        self.task = generate.GenerateTask.__new__(generate.GenerateTask)
+        self.task.manifest = self.manifest
+        self.task.previous_state = mock.MagicMock()
+        self.patcher = mock.patch('dbt.task.generate.StateSelectorMethod')
+        self.mock_method = self.patcher.start()
+        self.mock_method.return_value.search.return_value = iter(['model.b'])
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_reuse_previous_catalog(self):
+        catalog = generate.Catalog([])
+        with mock.patch.object(self.task, '_get_previous_catalog', return_value=self.previous_catalog):
+            schemas = self.task._reuse_previous_catalog(catalog)
+
+        # model.b is modified, model.c is missing from the previous catalog
+        self.assertEqual(schemas, {('dbt', 'changed'), ('dbt', 'unchanged_but_new')})
+        self.assertEqual(list(catalog), [generate.CatalogKey('dbt', 'unchanged', 'a')])
+
+    def test_no_previous_catalog(self):
+        catalog = generate.Catalog([])
+        with mock.patch.object(self.task, '_get_previous_catalog', return_value=None):
+            self.assertIsNone(self.task._reuse_previous_catalog(catalog))
+        self.assertEqual(catalog, {})
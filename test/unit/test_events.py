@@ -3,6 +3,7 @@ from dbt.events.test_types import UnitTestInfo
 from dbt.events import AdapterLogger
 from dbt.events.functions import event_to_serializable_dict
 from dbt.events.base_types import NodeInfo
+from dbt.events.history import EventHistory, RECENT_EVENTS
 from dbt.events.types import *
 from dbt.events.test_types import *
 # from dbt.events.stubs import _CachedRelation, BaseRelation, _ReferenceKey, ParsedModelNode
@@ -11,9 +12,13 @@ from importlib import reload
 import dbt.events.functions as event_funcs
 import dbt.flags as flags
 from dbt.helper_types import Lazy
+from dbt.logger import SecretScrubber, get_secret_scrubber
 import inspect
+import io
 import json
-from unittest import TestCase
+import logging
+import os
+from unittest import TestCase, mock
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn
 )
@@ -123,6 +128,150 @@ class TestEventBuffer(TestCase):
              event_funcs.EVENT_HISTORY.count(UnitTestInfo(msg='Test Event 1', code='T006')) == 0
          )
 
+class TestEventWriter(TestCase):
+
+    def setUp(self) -> None:
+        reload(event_funcs)
+        self.lines = []
+        lines = self.lines
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                if "Tracking:" in record.getMessage():
+                    lines.append(record.getMessage())
+
+        self.handler = ListHandler()
+        self.level = event_funcs.FILE_LOG.level
+        event_funcs.FILE_LOG.setLevel(logging.DEBUG)
+        event_funcs.FILE_LOG.addHandler(self.handler)
+        event_funcs.EVENT_WRITER = event_funcs.EventWriter(batch_size=3)
+
+    def tearDown(self) -> None:
+        event_funcs.cleanup_event_logger()
+        event_funcs.FILE_LOG.removeHandler(self.handler)
+        event_funcs.FILE_LOG.setLevel(self.level)
+
+    def test_events_written_in_order(self):
+        for n in range(10):
+            event_funcs.fire_event(MainTrackingUserState(user_state=f"state {n}"))
+        event_funcs.flush_event_logger()
+        self.assertEqual(len(self.lines), 10)
+        for n, line in enumerate(self.lines):
+            self.assertTrue(line.endswith(f"state {n}"))
+            # the thread that fired the event is logged, not the writer thread
+            self.assertIn("[MainThread]", line)
+        # events are still recorded in the history when they're fired
+        self.assertIn(MainTrackingUserState(user_state="state 9"), event_funcs.EVENT_HISTORY)
+
+    def test_events_formatted_when_fired(self):
+        event = MainTrackingUserState(user_state="when fired")
+        with mock.patch.dict(os.environ, {"DBT_ENV_SECRET_PW": "hunter2"}):
+            event_funcs.fire_event(event)
+            event_funcs.fire_event(MainTrackingUserState(user_state="pw hunter2"))
+            # the payload changes after the event is fired
+            event.user_state = "changed later"
+            event_funcs.flush_event_logger()
+        self.assertTrue(self.lines[0].endswith("when fired"))
+        # secrets are still scrubbed, on the writer thread
+        self.assertTrue(self.lines[1].endswith("pw *****"))
+
+    def test_cleanup_writes_queued_events(self):
+        for n in range(5):
+            event_funcs.fire_event(MainTrackingUserState(user_state=f"state {n}"))
+        event_funcs.cleanup_event_logger()
+        self.assertIsNone(event_funcs.EVENT_WRITER)
+        self.assertEqual(len(self.lines), 5)
+        # with no writer, events are written synchronously again
+        event_funcs.fire_event(MainTrackingUserState(user_state="state 5"))
+        self.assertEqual(len(self.lines), 6)
+
+
+class TestSecretScrubber(TestCase):
+
+    def test_scrub(self):
+        scrubber = SecretScrubber(("abc", "abcdef", "", "a.c"))
+        self.assertEqual(scrubber.secrets, ("abcdef", "a.c", "abc"))
+        self.assertEqual(
+            scrubber.scrub("abcdef abc abx a.c"), "***** ***** abx *****"
+        )
+        self.assertEqual(SecretScrubber(()).scrub("abc"), "abc")
+        self.assertEqual(event_funcs.scrub_secrets("one two", ["two"]), "one *****")
+
+    def test_rebuilt_when_env_changes(self):
+        with mock.patch.dict(os.environ, {"DBT_ENV_SECRET_ONE": "hunter2"}):
+            scrubber = get_secret_scrubber()
+            self.assertIs(get_secret_scrubber(), scrubber)
+            self.assertEqual(scrubber.scrub("pw: hunter2"), "pw: *****")
+            os.environ["DBT_ENV_SECRET_TWO"] = "swordfish"
+            scrubber = get_secret_scrubber()
+            self.assertEqual(scrubber.scrub("hunter2 swordfish"), "***** *****")
+
+    def test_rebuilt_when_secret_replaces_other_env(self):
+        # the same number of variables, and the known secrets unchanged
+        env = {"DBT_ENV_SECRET_A": "alpha-secret", "SOME_OTHER_VAR": "x"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(get_secret_scrubber().scrub("alpha-secret"), "*****")
+            del os.environ["SOME_OTHER_VAR"]
+            os.environ["DBT_ENV_SECRET_B"] = "beta-secret"
+            self.assertEqual(get_secret_scrubber().scrub("alpha-secret beta-secret"), "***** *****")
+            os.environ["DBT_ENV_SECRET_B"] = "gamma-secret"
+            self.assertEqual(get_secret_scrubber().scrub("beta-secret gamma-secret"), "beta-secret *****")
+
+
+class TestEventEnabled(TestCase):
+
+    def setUp(self) -> None:
+        self.flags = (flags.DEBUG, flags.QUIET, flags.LOG_CACHE_EVENTS)
+        flags.DEBUG, flags.QUIET, flags.LOG_CACHE_EVENTS = False, False, False
+        self.file_log = logging.getLogger('test_event_enabled')
+        self.file_log.setLevel(logging.DEBUG)
+        self.file_log.addHandler(logging.StreamHandler(io.StringIO()))
+        self.patcher = mock.patch.object(event_funcs, 'FILE_LOG', self.file_log)
+        self.patcher.start()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+        self.file_log.handlers.clear()
+        flags.DEBUG, flags.QUIET, flags.LOG_CACHE_EVENTS = self.flags
+
+    def test_event_enabled(self):
+        # written to the file log at the debug level
+        self.assertTrue(event_funcs.event_enabled(MainTrackingUserState))
+        self.assertTrue(event_funcs.event_enabled(NodeFinished))
+        # only written to stdout
+        self.assertTrue(event_funcs.event_enabled(UnitTestInfo))
+        flags.QUIET = True
+        self.assertFalse(event_funcs.event_enabled(UnitTestInfo))
+        # cache events are only written with --log-cache-events
+        self.assertFalse(event_funcs.event_enabled(DumpBeforeAddGraph))
+        flags.LOG_CACHE_EVENTS = True
+        self.assertTrue(event_funcs.event_enabled(DumpBeforeAddGraph))
+
+    def test_file_log_level(self):
+        self.file_log.setLevel(logging.INFO)
+        self.assertFalse(event_funcs.event_enabled(NodeFinished))
+        self.assertEqual(event_funcs.format_event(NodeFinished(
+            node_info={}, unique_id='model.root.a', run_result=Lazy.defer(dict)
+        )), [])
+        # the file log has nowhere to write to until it's set up
+        self.file_log.setLevel(logging.DEBUG)
+        self.file_log.handlers = [logging.NullHandler()]
+        self.assertFalse(event_funcs.event_enabled(NodeFinished))
+
+    def test_lazy_payload_forced_on_serialization(self):
+        calls = []
+
+        def run_result():
+            calls.append(1)
+            return {'status': 'success'}
+
+        e = NodeFinished(node_info={}, unique_id='model.root.a', run_result=Lazy.defer(run_result))
+        event_funcs.create_debug_text_log_line(e)
+        self.assertEqual(calls, [])
+        self.assertEqual(event_to_serializable_dict(e)['data']['run_result'], {'status': 'success'})
+        self.assertEqual(calls, [1])
+
+
 def MockNode():
     return ParsedModelNode(
         alias='model_one',
@@ -158,6 +307,82 @@ def MockNode():
     )
 
 
+class TestEventHistory(TestCase):
+
+    def test_ring_buffer(self):
+        history = EventHistory(maxlen=3)
+        self.assertEqual(len(history), 0)
+        self.assertEqual(list(history), [])
+        for n in range(5):
+            history.append(UnitTestInfo(msg=f"Test Event {n}"))
+        self.assertEqual(len(history), 3)
+        self.assertEqual(
+            [e.msg for e in history], ["Test Event 2", "Test Event 3", "Test Event 4"]
+        )
+        self.assertEqual(history[0].msg, "Test Event 2")
+        self.assertEqual(history[-1].msg, "Test Event 4")
+        with self.assertRaises(IndexError):
+            history[3]
+        self.assertEqual(history.codes(), ["T006", "T006", "T006"])
+        self.assertEqual(history.count(UnitTestInfo(msg="Test Event 3")), 1)
+        self.assertEqual(history.count(UnitTestInfo(msg="Test Event 0")), 0)
+        history.clear()
+        self.assertEqual(len(history), 0)
+
+    def test_records_are_compact(self):
+        history = EventHistory(maxlen=RECENT_EVENTS + 10)
+        node = MockNode()
+        forced = Lazy.defer(lambda: {"node": node.to_dict()})
+        forced.force()
+        history.append(NodeFinished(
+            node_info=node.node_info,
+            unique_id=node.unique_id,
+            run_result=forced,
+        ))
+        history.append(NodeFinished(
+            node_info=node.node_info,
+            unique_id=node.unique_id,
+            run_result=Lazy.defer(lambda: {"node": node.to_dict()}),
+        ))
+        try:
+            raise KeyError("boom")
+        except KeyError as exc:
+            history.append(MainEncounteredError(e=exc))
+        fired = UnitTestInfo(msg="recent")
+        history.append(fired)
+        # recent events are stored as they were fired
+        self.assertIs(history[-1], fired)
+        self.assertIs(history[0].run_result, forced)
+
+        size = history.memory_usage()
+        for n in range(RECENT_EVENTS):
+            history.append(UnitTestInfo(msg=f"Test Event {n}"))
+        self.assertEqual(history.codes()[:4], ["Q024", "Q024", "Z002", "T006"])
+        # older events are encoded, and decoded into copies
+        self.assertIsNot(history[0], history[0])
+        self.assertEqual(history[0].unique_id, node.unique_id)
+        self.assertEqual(history[0].node_info, node.node_info)
+        # lazy values are computed when they're encoded
+        self.assertEqual(history[0].run_result.force(), {"node": node.to_dict()})
+        self.assertEqual(history[1].run_result.memo, {"node": node.to_dict()})
+        # exceptions are kept as copies without their traceback
+        self.assertIsInstance(history[2].e, KeyError)
+        self.assertEqual(str(history[2].e), str(KeyError("boom")))
+        self.assertIsNone(history[2].e.__traceback__)
+        self.assertEqual(history[3], fired)
+        self.assertEqual(history.count(fired), 1)
+        self.assertGreater(history.memory_usage(), size)
+
+    def test_encodes_reference_keys(self):
+        history = EventHistory(maxlen=RECENT_EVENTS + 1)
+        key = _ReferenceKey(database="db", schema="schema", identifier="table")
+        history.append(AddLink(dep_key=key, ref_key=key))
+        for n in range(RECENT_EVENTS):
+            history.append(UnitTestInfo(msg=f"Test Event {n}"))
+        self.assertEqual(history[0], AddLink(dep_key=key, ref_key=key))
+        self.assertIsInstance(history[0].dep_key, _ReferenceKey)
+
+
 sample_values = [
     MainReportVersion(v=''),
     MainKeyboardInterrupt(),
@@ -250,7 +475,7 @@ sample_values = [
     GenericTestFileParse(path=''),
     MacroFileParse(path=''),
     PartialParsingFullReparseBecauseOfError(),
-    PartialParsingFile(file_dict={}),
+    PartialParsingFile(file_dict=Lazy.defer(lambda: {})),
     PartialParsingExceptionFile(file=''),
     PartialParsingException(exc_info={}),
     PartialParsingSkipParsing(),
@@ -279,12 +504,13 @@ sample_values = [
     PartialParsingUpdatedFile(file_id=''),
     PartialParsingNodeMissingInSourceFile(source_file=''),
     PartialParsingMissingNodes(file_id=''),
-    PartialParsingChildMapMissingUniqueID(unique_id=''),
     PartialParsingUpdateSchemaFile(file_id=''),
     PartialParsingDeletedSource(unique_id=''),
     PartialParsingDeletedExposure(unique_id=''),
     InvalidDisabledSourceInTestNode(msg=''),
     InvalidRefInTestNode(msg=''),
+    SchemaFilesLoaded(path_count=0, loader='', processes=0, elapsed=0.0),
+    SlowYamlLoader(path_count=0, elapsed=0.0),
     RunningOperationCaughtError(exc=''),
     RunningOperationUncaughtError(exc=Exception('')),
     DbtProjectError(),
@@ -318,6 +544,8 @@ sample_values = [
     CatalogWritten(path=''),
     CannotGenerateDocs(),
     BuildingCatalog(),
+    IncrementalCatalogUnavailable(reason=''),
+    IncrementalCatalogPlan(num_reused=0, num_queried=0),
     CompileComplete(),
     FreshnessCheckComplete(),
     ServingDocsPort(address='', port=0),
@@ -365,7 +593,7 @@ sample_values = [
     NodeStart(unique_id='', node_info={}),
     NodeCompiling(unique_id='', node_info={}),
     NodeExecuting(unique_id='', node_info={}),
-    NodeFinished(unique_id='', node_info={}, run_result={}),
+    NodeFinished(unique_id='', node_info={}, run_result=Lazy.defer(lambda: {})),
     QueryCancelationUnsupported(type=''),
     ConcurrencyLine(num_threads=0, target_name=''),
     StarterProjectPath(dir=''),
@@ -385,6 +613,7 @@ sample_values = [
     FoundStats(stat_line=''),
     CompilingNode(unique_id=''),
     WritingInjectedSQLForNode(unique_id=''),
+    ReusingCompiledSQL(unique_id=''),
     DisableTracking(),
     SendingEvent(kwargs=''),
     SendEventFailure(),
@@ -414,6 +643,8 @@ sample_values = [
     IntegrationTestError(msg=''),
     IntegrationTestException(msg=''),
     EventBufferFull(),
+    EventHistorySize(num_events=0, num_bytes=0),
+    ArtifactWriteFailed(path="", exc=""),
     RecordRetryException(exc=Exception('')),
     UnitTestInfo(msg=''),
 ]
@@ -572,11 +803,22 @@ class SkipsRenderingCacheEventsJSON(TestCase):
         skip_cache_event_message_rendering(self)
     
 
+def debug_file_log(test):
+    # events are only formatted when a logger writes them
+    file_log = logging.getLogger('test_debug_file_log')
+    file_log.setLevel(logging.DEBUG)
+    file_log.handlers = [logging.StreamHandler(io.StringIO())]
+    patcher = mock.patch.object(event_funcs, 'FILE_LOG', file_log)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
 class TestLazyMemoizationInCacheEventsTEXT(TestCase):
 
     def setUp(self):
         flags.LOG_FORMAT = 'text'
         flags.LOG_CACHE_EVENTS = True
+        debug_file_log(self)
 
     def tearDown(self):
         flags.LOG_CACHE_EVENTS = False
@@ -590,6 +832,7 @@ class TestLazyMemoizationInCacheEventsJSON(TestCase):
     def setUp(self):
         flags.LOG_FORMAT = 'json'
         flags.LOG_CACHE_EVENTS = True
+        debug_file_log(self)
 
     def tearDown(self):
         flags.LOG_FORMAT = 'text'
@@ -224,3 +224,54 @@ class TestFlags(TestCase):
         self.assertEqual(flags.QUIET, True)
         # cleanup
         self.user_config.quiet = None
+
+        # async_logging
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        os.environ['DBT_ASYNC_LOGGING'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        setattr(self.args, 'async_logging', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        # cleanup
+        os.environ.pop('DBT_ASYNC_LOGGING')
+        delattr(self.args, 'async_logging')
+
+        # blocking_artifact_writes
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BLOCKING_ARTIFACT_WRITES, False)
+        os.environ['DBT_BLOCKING_ARTIFACT_WRITES'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BLOCKING_ARTIFACT_WRITES, True)
+        # cleanup
+        os.environ.pop('DBT_BLOCKING_ARTIFACT_WRITES')
+
+        # compiled_sql_cache
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILED_SQL_CACHE, False)
+        self.user_config.compiled_sql_cache = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILED_SQL_CACHE, True)
+        os.environ['DBT_COMPILED_SQL_CACHE'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILED_SQL_CACHE, False)
+        setattr(self.args, 'compiled_sql_cache', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILED_SQL_CACHE, True)
+        setattr(self.args, 'compiled_sql_cache', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPILED_SQL_CACHE, False)
+        # cleanup
+        os.environ.pop('DBT_COMPILED_SQL_CACHE')
+        delattr(self.args, 'compiled_sql_cache')
+        self.user_config.compiled_sql_cache = None
+
+        # fast_json_artifacts
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.FAST_JSON_ARTIFACTS, False)
+        os.environ['DBT_FAST_JSON_ARTIFACTS'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.FAST_JSON_ARTIFACTS, True)
+        # cleanup
+        os.environ.pop('DBT_FAST_JSON_ARTIFACTS')
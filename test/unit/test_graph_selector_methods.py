@@ -5,6 +5,7 @@ from unittest import mock
 from pathlib import Path
 
 from dbt.contracts.files import FileHash
+from dbt.contracts.graph.compiled import CompiledModelNode
 from dbt.contracts.graph.parsed import (
     DependsOn,
     MacroDependsOn,
@@ -21,9 +22,9 @@ from dbt.contracts.graph.parsed import (
     TestMetadata,
     ColumnInfo,
 )
-from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.manifest import Manifest, WritableManifest
 from dbt.contracts.graph.unparsed import ExposureType, ExposureOwner, MetricFilter
-from dbt.contracts.state import PreviousState
+from dbt.contracts.state import PreviousState, StateManifest, STATE_CACHE_DIR, state_cache_file_name
 from dbt.node_types import NodeType
 from dbt.graph.selector_methods import (
     MethodManager,
@@ -1071,3 +1072,90 @@ def test_select_state_changed_test_macros(manifest, previous_state):
     assert search_manifest_using_method(
         manifest, method, 'modified.macros') == {'model1', 'model2'}
     assert not search_manifest_using_method(manifest, method, 'new')
+
+
+def write_state(manifest, path):
+    # the manifest fixture's disabled is a list, which can't be serialized
+    manifest.disabled = {}
+    manifest.writable_manifest().write(str(path / 'manifest.json'))
+    return PreviousState(path, str(path / 'target'))
+
+
+def test_previous_state_reads_state_manifest(manifest, view_model, tmp_path):
+    compiled = CompiledModelNode.from_dict(
+        {**view_model.to_dict(), 'compiled': True, 'compiled_sql': 'select 1 as id'})
+    change_node(manifest, compiled)
+    state = write_state(manifest, tmp_path)
+    assert isinstance(state.manifest, StateManifest)
+    # the cache is written under the target path, not in the --state directory
+    cache_name = state_cache_file_name(tmp_path / 'manifest.json')
+    assert (tmp_path / 'target' / STATE_CACHE_DIR / cache_name).is_file()
+    assert not [p for p in tmp_path.iterdir() if p.name not in ('manifest.json', 'target')]
+
+    expected = WritableManifest.read_and_check_versions(str(tmp_path / 'manifest.json'))
+    assert state.manifest.metadata == expected.metadata
+    assert set(state.manifest.nodes) == set(expected.nodes)
+    for unique_id, node in expected.nodes.items():
+        assert type(state.manifest.nodes[unique_id]) is type(node)
+        assert state.manifest.nodes[unique_id] == node
+    assert dict(state.manifest.sources) == expected.sources
+
+
+def test_previous_state_uses_state_cache(manifest, view_model, tmp_path):
+    first = write_state(manifest, tmp_path)
+    with mock.patch('dbt.contracts.state.loads_json_fast') as loads:
+        second = PreviousState(tmp_path, str(tmp_path / 'target'))
+    assert not loads.called
+    assert set(second.manifest.nodes) == set(first.manifest.nodes)
+    assert second.manifest.macro_sql_checksums == first.manifest.macro_sql_checksums
+
+    # a different manifest.json invalidates the cache
+    change_node(manifest, view_model.replace(raw_sql='select 2 as id, 3 as other_id'))
+    third = write_state(manifest, tmp_path)
+    assert third.manifest.nodes[view_model.unique_id].raw_sql == 'select 2 as id, 3 as other_id'
+
+
+def test_previous_state_without_target_path(manifest, tmp_path):
+    write_state(manifest, tmp_path)
+    state = PreviousState(tmp_path)
+    assert set(state.manifest.nodes) == set(manifest.nodes)
+    # nothing is written when there's nowhere to cache to
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['manifest.json', 'target']
+
+
+def test_select_state_from_disk(manifest, view_model, tmp_path):
+    changed_macro = make_macro('dbt', 'changed_macro', 'blablabla')
+    add_macro(manifest, changed_macro)
+    model = make_model('dbt', 'model1', 'blablabla', depends_on_macros=[changed_macro.unique_id])
+    add_node(manifest, model)
+    previous_state = write_state(copy.deepcopy(manifest), tmp_path)
+
+    method = statemethod(manifest, previous_state)
+    assert not search_manifest_using_method(manifest, method, 'modified')
+
+    add_macro(manifest, changed_macro.replace(macro_sql='something different'))
+    change_node(manifest, view_model.replace(raw_sql='select 1 as id'))
+    method = statemethod(manifest, previous_state)
+    assert search_manifest_using_method(
+        manifest, method, 'modified') == {'model1', 'view_model'}
+    assert search_manifest_using_method(manifest, method, 'modified.macros') == {'model1'}
+
+
+def test_select_state_new_from_disk_builds_nothing(manifest, tmp_path):
+    previous_state = write_state(copy.deepcopy(manifest), tmp_path)
+    model = make_model('dbt', 'model1', 'blablabla')
+    add_node(manifest, model)
+    method = statemethod(manifest, previous_state)
+    assert search_manifest_using_method(manifest, method, 'new') == {'model1'}
+    assert not previous_state.manifest.nodes._built
+
+
+def test_merge_from_state_only_builds_merged_nodes(manifest, view_model, tmp_path):
+    previous_state = write_state(copy.deepcopy(manifest), tmp_path)
+    adapter = mock.MagicMock()
+    adapter.get_relation.return_value = None
+    manifest.merge_from_artifact(adapter, previous_state.manifest, {view_model.unique_id})
+    deferred = {uid for uid, node in manifest.nodes.items() if node.deferred}
+    assert deferred
+    assert view_model.unique_id not in deferred
+    assert set(previous_state.manifest.nodes._built) == deferred
@@ -1,12 +1,23 @@
 from contextlib import contextmanager
+import os
 import pytest
+import random
 import unittest
 import yaml
 
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
+from dbt.clients._jinja_blocks import (
+    BLOCK_START_PATTERN,
+    COMMENT_START_PATTERN,
+    EXPR_START_PATTERN,
+    STRING_PATTERN,
+    TagIterator,
+    regex,
+)
 from dbt.exceptions import CompilationException, JinjaRenderingException
+from dbt.include import global_project
 
 
 @contextmanager
@@ -425,6 +436,81 @@ class TestJinja(unittest.TestCase):
         assert value == '1991'
 
 
+class FirstMatchTagIterator(TagIterator):
+    """How TagIterator used to find tags: it searched for every kind of token
+    that could come next and kept the match that ended first.
+    """
+    def _first_match(self, *patterns):
+        matches = [m for m in (self._search(p) for p in patterns) if m]
+        if not matches:
+            return None
+        return min(matches, key=lambda m: m.end())
+
+    def _expect_match(self, expected_name, *patterns):
+        match = self._first_match(*patterns)
+        if match is None:
+            self._raise_eof(expected_name)
+        return match
+
+    def handle_expr(self, match):
+        self.advance(match.end())
+        while True:
+            match = self._expect_match('}}', OLD_EXPR_END_PATTERN, OLD_QUOTE_START_PATTERN)
+            if match.groupdict().get('expr_end') is not None:
+                break
+            match = self._expect_match('string', STRING_PATTERN)
+            self.advance(match.end())
+        self.advance(match.end())
+
+    def handle_comment(self, match):
+        self.advance(match.end())
+        match = self._expect_match('#}', OLD_COMMENT_END_PATTERN)
+        self.advance(match.end())
+
+    def _expect_block_close(self):
+        while True:
+            end_match = self._expect_match(
+                'tag close ("%}")', OLD_QUOTE_START_PATTERN, OLD_TAG_CLOSE_PATTERN
+            )
+            self.advance(end_match.end())
+            if end_match.groupdict().get('tag_close') is not None:
+                return
+            self.rewind()
+            string_match = self._expect_match('string', STRING_PATTERN)
+            self.advance(string_match.end())
+
+    def _next_tag_start(self):
+        return self._first_match(BLOCK_START_PATTERN, COMMENT_START_PATTERN, EXPR_START_PATTERN)
+
+
+OLD_COMMENT_END_PATTERN = regex(r"(.*?)(\s*\#\})")
+OLD_EXPR_END_PATTERN = regex(r"(?P<expr_end>(\s*\}\}))")
+OLD_TAG_CLOSE_PATTERN = regex(r"(?:(?P<tag_close>(\-\%\}\s*|\%\})))")
+OLD_QUOTE_START_PATTERN = regex(r"""(?P<quote>(['"]))""")
+
+TEMPLATE_FRAGMENTS = [
+    'select 1', ' ', '\n', '  \n\t', "'", '"', '}}', '%}', '#}', '{', '}', '-',
+    '{% macro a() %}', '{%- macro b(x="%}") -%}', '{% endmacro %}', '{%- endmacro -%}',
+    '{% materialization m, default %}', '{% endmaterialization %}',
+    '{% if x %}', '{% endif %}', '{% for i in y %}', '{%- endfor %}',
+    '{% set z = "{{" %}', "{% call c('a\\'b') %}", '{% endcall %}', '{% "x" %}', '{%',
+    '{{ 1 }}', '{{ "}}" }}', "{{ '%}' ~ x }}", '{{', '{{- y -}}',
+    '{# c #}', '{# {% macro d() %} #}', '{#', ' {#- e -#} ',
+    '{% raw %}{{ r }}{% endraw %}', '{%- raw -%}{% x %}{%- endraw %}',
+]
+
+
+def make_template(rng):
+    return ''.join(rng.choice(TEMPLATE_FRAGMENTS) for _ in range(rng.randint(1, 12)))
+
+
+def find_tags(iterator_cls, data):
+    try:
+        return list(iterator_cls(data).find_tags())
+    except CompilationException as exc:
+        return str(exc)
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
@@ -738,6 +824,37 @@ class TestBlockLexer(unittest.TestCase):
             extract_toplevel_blocks(body)
         self.assertIn('Got an unexpected control flow end tag, got endfor but expected endif next (@ 3:4)', str(err.exception))
 
+    def test_whitespace_control_takes_leading_whitespace(self):
+        body = 'select 1  \n  {%- macro a() -%} x {%- endmacro %} \n {# {% macro b() %} #}{% "x" %}{{ "}}" }}'
+        blocks = extract_toplevel_blocks(body, allowed_blocks={'macro'})
+        self.assertEqual([b.full_block for b in blocks], [
+            'select 1',
+            '  \n  {%- macro a() -%} x {%- endmacro %}',
+            ' \n {# {% macro b() %} #}{% "x" %}{{ "}}" }}',
+        ])
+        self.assertEqual(blocks[1].block_name, 'a')
+
+    def test_global_project_macros(self):
+        for root, _, names in os.walk(global_project.PACKAGE_PATH):
+            for name in names:
+                if not name.endswith('.sql'):
+                    continue
+                with open(os.path.join(root, name)) as fp:
+                    data = fp.read()
+                blocks = extract_toplevel_blocks(data, allowed_blocks={'macro', 'materialization'})
+                self.assertEqual(''.join(b.full_block for b in blocks), data)
+                for block in blocks:
+                    if block.block_type_name != '__dbt__data':
+                        self.assertRegex(block.full_block, r'end{}\s*-?%}}$'.format(block.block_type_name))
+
+    def test_matches_first_match_tokenizer(self):
+        rng = random.Random(42)
+        for _ in range(2000):
+            data = make_template(rng)
+            self.assertEqual(
+                find_tags(TagIterator, data), find_tags(FirstMatchTagIterator, data), data
+            )
+
 
 bar_block = '''{% mytype bar %}
 {# a comment
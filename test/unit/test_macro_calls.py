@@ -1,3 +1,4 @@
+import msgpack
 import os
 import unittest
 from unittest.mock import MagicMock, patch
@@ -5,7 +6,11 @@ from unittest.mock import MagicMock, patch
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
-from dbt.clients.jinja_static import statically_extract_macro_calls
+from dbt.clients.jinja_static import (
+    resolve_static_macro_calls,
+    statically_extract_macro_calls,
+    statically_find_macro_calls,
+)
 from dbt.context.base import generate_base_context
 
 
@@ -49,4 +54,9 @@ class MacroCalls(unittest.TestCase):
             self.assertEqual(self.possible_macro_calls[index], possible_macro_calls)
             index += 1
 
-
+    def test_saved_macro_calls(self):
+        # the calls are saved with the manifest, which turns tuples into lists
+        ctx = generate_base_context({})
+        for macro_string, expected in zip(self.macro_strings, self.possible_macro_calls):
+            calls = msgpack.unpackb(msgpack.packb(statically_find_macro_calls(macro_string)))
+            self.assertEqual(resolve_static_macro_calls(calls, ctx), expected)
@@ -3,6 +3,8 @@ import unittest
 from unittest import mock
 
 import copy
+import json
+import tempfile
 from collections import namedtuple
 from itertools import product
 from datetime import datetime
@@ -10,10 +12,11 @@ from datetime import datetime
 import pytest
 
 import dbt.flags
+import dbt.utils
 import dbt.version
 from dbt import tracking
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import Disabled, Manifest, ManifestMetadata
 from dbt.contracts.graph.parsed import (
     ParsedModelNode,
     DependsOn,
@@ -32,6 +35,7 @@ from dbt.contracts.graph.unparsed import (
 )
 
 from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.contracts.util import iter_json_chunks
 from dbt.events.functions import get_invocation_id
 from dbt.node_types import NodeType
 import freezegun
@@ -321,6 +325,37 @@ class ManifestTest(unittest.TestCase):
             }
         )
 
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test_write_streams_same_json(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(
+            nodes=nodes, sources={}, macros={}, docs={}, disabled={}, files={},
+            exposures={}, metrics={}, selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        writable = manifest.writable_manifest()
+        expected = writable.to_dict(omit_none=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'manifest.json')
+            # orjson is only used with --fast-json-artifacts
+            fake_orjson = mock.Mock()
+            with mock.patch('dbt.utils.orjson', fake_orjson), \
+                    mock.patch('dbt.flags.FAST_JSON_ARTIFACTS', False):
+                manifest.write(path)
+            fake_orjson.dumps.assert_not_called()
+            with open(path) as fp:
+                contents = fp.read()
+            # artifacts written in the background are written from a snapshot
+            snapshot = manifest.snapshot()
+            snapshot_path = os.path.join(tmpdir, 'snapshot.json')
+            snapshot.write(snapshot_path)
+            with open(snapshot_path) as fp:
+                self.assertEqual(fp.read(), contents)
+        # byte for byte what json.dumps would write
+        self.assertEqual(contents, json.dumps(expected, cls=dbt.utils.JSONEncoder))
+        self.assertEqual(list(iter_json_chunks(writable))[0], '{')
+        self.assertEqual(json.loads(''.join(iter_json_chunks(writable))), expected)
+
     @freezegun.freeze_time('2018-02-14T09:15:13Z')
     def test__nested_nodes(self):
         nodes = copy.copy(self.nested_nodes)
@@ -1205,6 +1240,29 @@ def test_resolve_ref(nodes, sources, package, expected):
         assert result.package_name == expected_package
 
 
+def test_resolve_ref_lookups_kept_current():
+    dep_model = MockNode('dep', 'my_model')
+    root_model = MockNode('root', 'my_model')
+    manifest = make_manifest(nodes=[dep_model])
+
+    def resolve(name):
+        return manifest.resolve_ref(name, None, current_project='root', node_package='root')
+
+    assert resolve('my_model') is dep_model
+    # nodes added after the lookups are built are found
+    manifest.add_node_nofile(root_model)
+    assert resolve('my_model') is root_model
+    disabled_model = MockNode('root', 'my_disabled_model')
+    manifest.add_disabled_nofile(disabled_model)
+    result = resolve('my_disabled_model')
+    assert isinstance(result, Disabled)
+    assert result.target is disabled_model
+    # nodes removed aren't, once the lookups are cleared
+    del manifest.nodes[root_model.unique_id]
+    manifest.clear_lookups()
+    assert resolve('my_model') is dep_model
+
+
 def _source_parameter_sets():
     sets = [
         # empties
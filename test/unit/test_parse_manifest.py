@@ -2,12 +2,15 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
-from .utils import config_from_parts_or_dicts, normalize
+from .utils import config_from_parts_or_dicts, normalize, MockNode
 
-from dbt.contracts.files import SourceFile, FileHash, FilePath
+from dbt.contracts.files import SourceFile, SchemaSourceFile, FileHash, FilePath, ParseFileType
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.contracts.graph.parsed import DependsOn
 from dbt.parser.search import FileBlock
+from dbt.exceptions import ParsingException
 from dbt.parser import manifest
+from dbt.parser.read_files import load_schema_files
 
 
 class MatchingHash(FileHash):
@@ -101,3 +104,158 @@ class TestLoader(unittest.TestCase):
             project_root=normalize(self.root_project_config.project_root),
         )
         return SourceFile(path=path, checksum=checksum)
+
+    def test_changed_vars(self):
+        def state_check(cli_vars_hashes):
+            return ManifestStateCheck(
+                vars_hash=FileHash.from_contents('vars'),
+                project_env_vars_hash=FileHash.from_contents(''),
+                profile_env_vars_hash=FileHash.from_contents(''),
+                profile_hash=FileHash.from_contents('profile'),
+                cli_vars_hashes=cli_vars_hashes,
+            )
+
+        saved_manifest = Manifest()
+        saved_manifest.state_check = state_check({'kept': 'a', 'changed': 'b', 'removed': 'c'})
+        self.loader.manifest.state_check = state_check({'kept': 'a', 'changed': 'x', 'added': 'd'})
+        self.assertEqual(
+            self.loader.get_changed_vars(saved_manifest), {'changed', 'removed', 'added'}
+        )
+
+        # only the files that read the changed vars are reparsed
+        with patch.object(self.loader, 'config_files_read_vars', return_value=False):
+            self.assertEqual(self.loader.is_partial_parsable(saved_manifest), (True, None))
+        self.assertEqual(self.loader.changed_vars, {'changed', 'removed', 'added'})
+
+        # unless the project configs, profile or selectors read vars
+        self.loader.changed_vars = set()
+        with patch.object(self.loader, 'config_files_read_vars', return_value=True):
+            self.assertEqual(
+                self.loader.is_partial_parsable(saved_manifest),
+                (False, manifest.ReparseReason.vars_changed),
+            )
+        self.assertEqual(self.loader.changed_vars, set())
+
+        # or a generate_*_name macro read one
+        saved_manifest.generate_name_vars = {'changed'}
+        with patch.object(self.loader, 'config_files_read_vars', return_value=False):
+            self.assertEqual(
+                self.loader.is_partial_parsable(saved_manifest),
+                (False, manifest.ReparseReason.vars_changed),
+            )
+        self.assertEqual(self.loader.changed_vars, set())
+        saved_manifest.generate_name_vars = {'kept'}
+        with patch.object(self.loader, 'config_files_read_vars', return_value=False):
+            self.assertEqual(self.loader.is_partial_parsable(saved_manifest), (True, None))
+
+    def test_generate_name_vars_are_saved(self):
+        saved = Manifest(generate_name_vars={'suffix'})
+        self.assertEqual(
+            Manifest.from_msgpack(saved.to_msgpack()).generate_name_vars, {'suffix'}
+        )
+
+
+class TestProcessRefs(unittest.TestCase):
+    def _node(self, package, name, refs):
+        return MockNode(package, name, refs=refs, depends_on=DependsOn())
+
+    def test_resolved_refs(self):
+        root_shared = MockNode('root', 'shared')
+        dep_shared = MockNode('dep', 'shared')
+        root_node = self._node('root', 'root_node', [['shared']])
+        dep_node = self._node('dep', 'dep_node', [['shared'], ['dep', 'shared']])
+        late_node = self._node('dep', 'late_node', [['shared']])
+        nodes = [root_shared, dep_shared, root_node, dep_node, late_node]
+        parsed = Manifest(nodes={node.unique_id: node for node in nodes})
+
+        resolved = {}
+        manifest._process_refs_for_node(parsed, 'root', root_node, resolved)
+        manifest._process_refs_for_node(parsed, 'root', dep_node, resolved)
+        self.assertEqual(root_node.depends_on.nodes, ['model.root.shared'])
+        self.assertEqual(dep_node.depends_on.nodes, ['model.root.shared', 'model.dep.shared'])
+        self.assertEqual(
+            set(resolved),
+            {(None, 'shared', 'root'), (None, 'shared', 'dep'), ('dep', 'shared', 'dep')},
+        )
+
+        # what was resolved to a node disabled since is resolved again
+        root_shared.config.enabled = False
+        manifest._process_refs_for_node(parsed, 'root', late_node, resolved)
+        self.assertEqual(late_node.depends_on.nodes, ['model.dep.shared'])
+
+
+class TestLoadSchemaFiles(unittest.TestCase):
+    def _schema_file(self, name, contents):
+        path = FilePath(
+            searched_path='models',
+            relative_path=name,
+            project_root=normalize('/usr/src/app'),
+            modification_time=1.0,
+        )
+        source_file = SchemaSourceFile(
+            path=path,
+            checksum=FileHash.from_contents(contents),
+            parse_file_type=ParseFileType.Schema,
+            project_name='root',
+        )
+        source_file.contents = contents
+        return source_file
+
+    def _load(self, *source_files):
+        files = {sf.file_id: sf for sf in source_files}
+        parser_files = {'root': {'SchemaParser': list(files)}}
+        load_schema_files(files, parser_files)
+        return files, parser_files['root']['SchemaParser']
+
+    def test_load(self):
+        models = self._schema_file('models.yml', 'version: 2\nmodels:\n  - name: my_model')
+        empty = self._schema_file('empty.yml', '# nothing here yet')
+        files, file_ids = self._load(models, empty)
+        self.assertEqual(models.dfy, {'version': 2, 'models': [{'name': 'my_model'}]})
+        # files without any yaml in them aren't parsed
+        self.assertEqual(list(files), [models.file_id])
+        self.assertEqual(file_ids, [models.file_id])
+
+    def test_already_loaded(self):
+        models = self._schema_file('models.yml', 'not: [loaded')
+        models.dfy = {'version': 2, 'models': [{'name': 'my_model'}]}
+        self._load(models)
+        self.assertEqual(models.dfy, {'version': 2, 'models': [{'name': 'my_model'}]})
+
+    def test_parallel(self):
+        source_files = [
+            self._schema_file(f'models_{i}.yml', f'version: 2\nmodels:\n  - name: model_{i}')
+            for i in range(4)
+        ]
+        with patch('dbt.parser.read_files.PARALLEL_YAML_MIN_BYTES', 1), patch(
+            'os.cpu_count', return_value=2
+        ):
+            self._load(*source_files)
+        for i, source_file in enumerate(source_files):
+            self.assertEqual(source_file.dfy['models'], [{'name': f'model_{i}'}])
+
+    def test_parallel_uses_mp_context(self):
+        def schema_files():
+            return [
+                self._schema_file(f'models_{i}.yml', f'version: 2\nmodels:\n  - name: model_{i}')
+                for i in range(4)
+            ]
+        size = sum(len(sf.contents) for sf in schema_files())
+        context = mock.MagicMock()
+        context.get_start_method.return_value = 'spawn'
+        pool = context.Pool.return_value.__enter__.return_value
+        pool.map.side_effect = lambda func, contents: [func(c) for c in contents]
+        with patch('dbt.flags.MP_CONTEXT', context), patch('os.cpu_count', return_value=2):
+            # processes that aren't forked need four times as much yaml
+            with patch('dbt.parser.read_files.PARALLEL_YAML_MIN_BYTES', size // 2):
+                self._load(*schema_files())
+            context.Pool.assert_not_called()
+            with patch('dbt.parser.read_files.PARALLEL_YAML_MIN_BYTES', size // 8):
+                self._load(*schema_files())
+            context.Pool.assert_called_once_with(2)
+
+    def test_invalid(self):
+        with self.assertRaises(ParsingException):
+            self._load(self._schema_file('models.yml', 'models: [unclosed'))
+        with self.assertRaises(ParsingException):
+            self._load(self._schema_file('models.yml', 'version: 2\nmodels: my_model'))
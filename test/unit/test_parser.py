@@ -19,7 +19,9 @@ from dbt.parser.schemas import (
     TestablePatchParser, SourceParser, AnalysisPatchParser, MacroPatchParser
 )
 from dbt.parser.search import FileBlock
-from dbt.parser.generic_test_builders import YamlBlock
+from dbt.parser.generic_test_builders import (
+    YamlBlock, _STATIC_GENERIC_TESTS, register_static_generic_test
+)
 from dbt.parser.sources import SourcePatcher
 
 from dbt.node_types import NodeType
@@ -479,6 +481,216 @@ class SchemaParserModelsTest(SchemaParserTest):
         self.assertEqual(self.parser.manifest.files[file_id].node_patches, ['model.root.my_model'])
 
 
+STATIC_GENERIC_TESTS_YML = '''
+version: 2
+models:
+    - name: my_model
+      columns:
+        - name: color
+          tests:
+            - accepted_values:
+                values: ['red', 'blue', 'green']
+                tags: ['colors']
+            - relationships:
+                to: ref('other_model')
+                field: id
+'''
+
+NOT_NULL_UNIQUE_YML = '''
+version: 2
+models:
+    - name: my_model
+      columns:
+        - name: color
+          tests:
+            - not_null:
+                tags: ['nulls']
+            - unique
+'''
+
+
+DBT_UTILS_TESTS_YML = '''
+version: 2
+models:
+    - name: my_model
+      tests:
+        - dbt_utils.expression_is_true:
+            expression: "color is not null"
+        - dbt_utils.unique_combination_of_columns:
+            combination_of_columns: ['color', 'size']
+'''
+
+
+def make_test_macro(package, name):
+    return ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id=f'macro.{package}.{name}',
+        package_name=package,
+        original_file_path=normalize('macros/macro.sql'),
+        root_path=get_abs_os_path('./dbt_packages/root'),
+        path=normalize('macros/macro.sql'),
+        macro_sql=f'{{% macro {name}() %}}select 1{{% endmacro %}}',
+    )
+
+
+class SchemaParserStaticGenericTestsTest(SchemaParserTest):
+    def setUp(self):
+        super().setUp()
+        self.macros = list(generate_name_macros('root')) + [
+            make_test_macro('dbt', 'test_accepted_values'),
+            make_test_macro('dbt', 'test_relationships'),
+        ]
+
+    def parse_tests(self, test_yml):
+        my_model_node = MockNode(
+            package='root',
+            name='my_model',
+            config=mock.MagicMock(enabled=True),
+            refs=[],
+            sources=[],
+            patch_path=None,
+        )
+        manifest = Manifest(
+            nodes={my_model_node.unique_id: my_model_node},
+            macros={m.unique_id: m for m in self.macros},
+        )
+        manifest.ref_lookup
+        self.parser = SchemaParser(
+            project=self.snowplow_project_config,
+            manifest=manifest,
+            root_project=self.root_project_config,
+        )
+        block = self.file_block_for(test_yml, 'test_one.yml')
+        manifest.files[block.file.file_id] = block.file
+        with mock.patch.object(SchemaParser, '_render_test_update') as render:
+            self.parser.parse_file(block)
+        tests = sorted(
+            (n for n in manifest.nodes.values() if n.resource_type == NodeType.Test),
+            key=lambda n: n.unique_id,
+        )
+        return tests, render
+
+    def test_static_tests(self):
+        tests, render = self.parse_tests(STATIC_GENERIC_TESTS_YML)
+        render.assert_not_called()
+        self.assertEqual(len(tests), 2)
+        self.assertEqual(tests[0].test_metadata.name, 'accepted_values')
+        self.assertEqual(tests[0].refs, [['my_model']])
+        self.assertEqual(tests[0].config.tags, ['colors'])
+        self.assertEqual(tests[0].tags, ['colors'])
+        self.assertEqual(tests[1].test_metadata.name, 'relationships')
+        self.assertEqual(tests[1].refs, [['other_model'], ['my_model']])
+        self.assertEqual(tests[1].sources, [])
+        self.assertEqual(
+            tests[1].depends_on.macros, ['macro.dbt.test_relationships']
+        )
+
+    def test_relationships_to_source(self):
+        tests, render = self.parse_tests(
+            STATIC_GENERIC_TESTS_YML.replace(
+                "ref('other_model')", "source(\"my_source\", 'my_table')"
+            )
+        )
+        render.assert_not_called()
+        self.assertEqual(tests[1].refs, [['my_model']])
+        self.assertEqual(tests[1].sources, [['my_source', 'my_table']])
+
+    def test_dynamic_kwargs_are_rendered(self):
+        tests, render = self.parse_tests(
+            STATIC_GENERIC_TESTS_YML.replace(
+                "ref('other_model')", "ref(var('parent'))"
+            ).replace("'green'", "'{{ var(\"color\") }}'")
+        )
+        self.assertEqual(render.call_count, 2)
+
+    def test_overridden_tests_are_rendered(self):
+        self.macros.append(make_test_macro('root', 'test_accepted_values'))
+        self.macros.append(make_test_macro('root', 'default__test_relationships'))
+        tests, render = self.parse_tests(STATIC_GENERIC_TESTS_YML)
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(
+            tests[0].depends_on.macros, ['macro.root.test_accepted_values']
+        )
+
+    def test_not_null_and_unique_config_tags(self):
+        # like the config() call the jinja path renders, the static config
+        # call of not_null and unique tests now includes their tags
+        self.macros.append(make_test_macro('dbt', 'test_not_null'))
+        self.macros.append(make_test_macro('dbt', 'test_unique'))
+        tests, render = self.parse_tests(NOT_NULL_UNIQUE_YML)
+        render.assert_not_called()
+        self.assertEqual([t.test_metadata.name for t in tests], ['not_null', 'unique'])
+        self.assertEqual(tests[0].config.tags, ['nulls'])
+        self.assertEqual(tests[0].tags, ['nulls'])
+        self.assertEqual(tests[1].config.tags, [])
+        self.assertEqual(tests[1].tags, [])
+
+    def test_package_tests(self):
+        self.macros.append(make_test_macro('dbt_utils', 'test_expression_is_true'))
+        self.macros.append(make_test_macro('dbt_utils', 'test_unique_combination_of_columns'))
+        # package tests are rendered unless they're registered
+        tests, render = self.parse_tests(DBT_UTILS_TESTS_YML)
+        self.assertEqual(render.call_count, 2)
+
+        for name in ('test_expression_is_true', 'test_unique_combination_of_columns'):
+            register_static_generic_test(f'macro.dbt_utils.{name}')
+            self.addCleanup(_STATIC_GENERIC_TESTS.pop, f'macro.dbt_utils.{name}')
+        tests, render = self.parse_tests(DBT_UTILS_TESTS_YML)
+        render.assert_not_called()
+        self.assertEqual(
+            [t.depends_on.macros for t in tests],
+            [['macro.dbt_utils.test_expression_is_true'],
+             ['macro.dbt_utils.test_unique_combination_of_columns']],
+        )
+        self.assertEqual([t.refs for t in tests], [[['my_model']], [['my_model']]])
+
+    def test_registered_tests_calling_ref_are_rendered(self):
+        test_macro = make_test_macro('root', 'test_compare')
+        helper = make_test_macro('root', 'compare_helper')
+        helper.macro_sql = "{% macro compare_helper() %}{{ ref('other_model') }}{% endmacro %}"
+        test_macro.depends_on.macros.append(helper.unique_id)
+        self.macros.extend([test_macro, helper])
+        register_static_generic_test('macro.root.test_compare')
+        self.addCleanup(_STATIC_GENERIC_TESTS.pop, 'macro.root.test_compare')
+        test_yml = """
+version: 2
+models:
+    - name: my_model
+      tests:
+        - compare
+"""
+        tests, render = self.parse_tests(test_yml)
+        self.assertEqual(render.call_count, 1)
+
+    def test_registered_tests(self):
+        self.macros.append(make_test_macro('root', 'test_compare'))
+        test_yml = """
+version: 2
+models:
+    - name: my_model
+      tests:
+        - compare:
+            other: ref('other_model')
+"""
+        tests, render = self.parse_tests(test_yml)
+        self.assertEqual(render.call_count, 1)
+
+        register_static_generic_test('macro.root.test_compare', ('other',))
+        self.addCleanup(_STATIC_GENERIC_TESTS.pop, 'macro.root.test_compare')
+        tests, render = self.parse_tests(test_yml)
+        render.assert_not_called()
+        self.assertEqual(tests[0].refs, [['other_model'], ['my_model']])
+
+    def test_sample(self):
+        with mock.patch('random.randint', return_value=5000):
+            tests, render = self.parse_tests(STATIC_GENERIC_TESTS_YML)
+        # the jinja sample renders copies of the nodes
+        self.assertEqual(render.call_count, 2)
+        self.assertIsNot(render.call_args_list[1][0][0], tests[1])
+        self.assertEqual(tests[1].refs, [['other_model'], ['my_model']])
+
+
 class ModelParserTest(BaseParserTest):
     def setUp(self):
         super().setUp()
@@ -525,6 +737,36 @@ class ModelParserTest(BaseParserTest):
         with self.assertRaises(CompilationException):
             self.parser.parse_file(block)
 
+    def test_generate_name_vars(self):
+        macro = self.manifest.macros['macro.root.generate_schema_name']
+        macro.macro_sql = (
+            "{% macro generate_schema_name(value, node) %}"
+            "{{ var('suffix', 'e') }}_schema"
+            "{% endmacro %}"
+        )
+        parser = ModelParser(
+            project=self.snowplow_project_config,
+            manifest=self.manifest,
+            root_project=self.root_project_config,
+        )
+        block = self.file_block_for('select 1 as id', 'model_1.sql')
+        self.manifest.files[block.file.file_id] = block.file
+        parser.parse_file(block)
+        node = list(self.manifest.nodes.values())[0]
+        self.assertEqual(node.schema, 'e_schema')
+        # partial parsing can't be used when the var changes
+        self.assertEqual(self.manifest.generate_name_vars, {'suffix'})
+
+    def test_validate_parsed_nodes(self):
+        raw_sql = 'select 1 as id'
+        for strict in (False, True):
+            block = self.file_block_for(raw_sql, f'nested/model_{int(strict)}.sql')
+            self.parser.manifest.files[block.file.file_id] = block.file
+            with mock.patch.object(dbt.flags, 'VALIDATE_PARSED_NODES', strict), \
+                    mock.patch.object(ParsedModelNode, 'validate') as validate:
+                self.parser.parse_file(block)
+            self.assertEqual(validate.called, strict)
+
 
 class StaticModelParserTest(BaseParserTest):
     def setUp(self):
@@ -970,6 +1212,31 @@ class MacroParserTest(BaseParserTest):
             ['macro.snowplow.bar', 'macro.snowplow.foo'],
         )
 
+    def test_cached_blocks(self):
+        raw_sql = '{# {% macro foo(a, b) %}a ~ b{% endmacro %} #}\n{% macro foo(a, b) %}a ~ b{% endmacro %}\n{% macro bar(c, d) %}c + d{% endmacro %}'
+        block = self.file_block_for(raw_sql, 'macro.sql')
+        self.parser.manifest.files[block.file.file_id] = block.file
+        self.parser.parse_file(block)
+        cache = self.parser.manifest.macro_parse_cache
+        self.assertEqual(cache.macro_blocks, {
+            block.file.checksum.checksum: [('foo', 47, 87), ('bar', 88, 128)],
+        })
+
+        # a new parse of the same file uses what was saved
+        manifest = Manifest(macro_parse_cache=cache)
+        parser = MacroParser(project=self.snowplow_project_config, manifest=manifest)
+        block = self.file_block_for(raw_sql, 'macro.sql')
+        manifest.files[block.file.file_id] = block.file
+        with mock.patch.object(MacroParser, 'find_macros', side_effect=AssertionError):
+            parser.parse_file(block)
+        self.assertEqual(
+            {m.name: m.macro_sql for m in manifest.macros.values()},
+            {
+                'foo': '{% macro foo(a, b) %}a ~ b{% endmacro %}',
+                'bar': '{% macro bar(c, d) %}c + d{% endmacro %}',
+            },
+        )
+
 
 class SingularTestParserTest(BaseParserTest):
     def setUp(self):
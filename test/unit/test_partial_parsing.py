@@ -82,3 +82,75 @@ class TestPartialParsing(unittest.TestCase):
         expected_pp_dict = {'version': 2, 'models': [{'name': 'my_model', 'description': 'Test model'}]}
         schema_file = self.saved_files[schema_file_id]
         self.assertEqual(schema_file.pp_dict, expected_pp_dict)
+
+    def test_partial_parsing_indexes(self):
+        model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        indexes = self.saved_manifest.partial_parsing_indexes
+        # PartialParsing builds the indexes if the manifest doesn't have them yet
+        self.assertTrue(indexes.built)
+        self.assertEqual(indexes.macro_children.get('macro.my_test.my_macro'), [])
+
+        started_at = time.time()
+        model_node = self.get_model('my_model')
+        model_node.depends_on.macros = ['macro.my_test.my_macro']
+        other_node = self.get_model('other_model')
+        other_node.depends_on.nodes = ['model.my_test.my_model']
+        self.saved_manifest.nodes[model_node.unique_id] = model_node
+        self.saved_manifest.nodes[other_node.unique_id] = other_node
+        self.saved_files[model_file_id].env_vars = ['MY_VAR']
+        indexes.update(self.saved_manifest, started_at, [model_file_id])
+        self.assertEqual(
+            indexes.macro_children.get('macro.my_test.my_macro'), ['model.my_test.my_model']
+        )
+        self.assertEqual(
+            indexes.node_children.get('model.my_test.my_model'), ['model.my_test.other_model']
+        )
+        self.assertEqual(indexes.env_var_files.get('MY_VAR'), [model_file_id])
+
+        # the indexes are saved with the manifest
+        saved = Manifest.from_msgpack(self.saved_manifest.to_msgpack())
+        self.assertEqual(saved.partial_parsing_indexes, indexes)
+
+        # reparsed nodes replace their entries, and removed nodes lose theirs
+        started_at = time.time()
+        model_node = self.get_model('my_model')
+        self.saved_manifest.nodes[model_node.unique_id] = model_node
+        del self.saved_manifest.nodes[other_node.unique_id]
+        indexes.update(self.saved_manifest, started_at, [])
+        self.assertEqual(indexes.macro_children.get('macro.my_test.my_macro'), [])
+        self.assertEqual(indexes.node_children.get('model.my_test.my_model'), [])
+        self.assertEqual(indexes.macro_children.referrers, {})
+        self.assertEqual(indexes.node_children.referrers, {})
+
+    def test_env_var_change(self):
+        model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        self.saved_files[model_file_id].env_vars = ['MY_VAR']
+        self.saved_manifest.env_vars['MY_VAR'] = 'old'
+        self.saved_manifest.partial_parsing_indexes.update(self.saved_manifest)
+        with mock.patch.dict('os.environ', {'MY_VAR': 'new'}):
+            partial_parsing = PartialParsing(self.saved_manifest, self.new_files)
+        self.assertEqual(partial_parsing.env_vars_changed_source_files, [model_file_id])
+
+    def test_var_change(self):
+        model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        schema_file_id = 'my_test://' + normalize('models/schema.yml')
+        self.saved_files[model_file_id].vars = ['model_var']
+        self.saved_files[schema_file_id].add_var('schema_var', 'models', 'my_model')
+        self.saved_manifest.partial_parsing_indexes.update(self.saved_manifest)
+
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, ['other_var'])
+        self.assertTrue(partial_parsing.skip_parsing())
+
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, ['model_var'])
+        self.assertEqual(partial_parsing.env_vars_changed_source_files, [model_file_id])
+        self.assertEqual(partial_parsing.env_vars_changed_schema_files, {})
+
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, ['schema_var'])
+        self.assertEqual(partial_parsing.env_vars_changed_source_files, [])
+        self.assertEqual(
+            partial_parsing.env_vars_changed_schema_files, {schema_file_id: {'models': ['my_model']}}
+        )
+        pp_files = partial_parsing.get_parsing_files()
+        self.assertEqual(pp_files['my_test']['SchemaParser'], [schema_file_id])
+        # the entry's vars are recorded again when it's reparsed
+        self.assertEqual(self.saved_files[schema_file_id].vars, {})
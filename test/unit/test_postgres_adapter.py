@@ -4,6 +4,7 @@ import unittest
 from unittest import mock
 
 import dbt.flags as flags
+import dbt.main
 from dbt.task.debug import DebugTask
 
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
@@ -12,7 +13,7 @@ from dbt.adapters.postgres import Plugin as PostgresPlugin
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
-from dbt.exceptions import ValidationException, DbtConfigError
+from dbt.exceptions import ValidationException, DbtConfigError, RuntimeException, DatabaseException
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
 
@@ -327,6 +328,51 @@ class TestPostgresAdapter(unittest.TestCase):
         self.assertEqual(exceptions, [])
 
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_get_catalog_rows_chunked(self, mock_get_schemas, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name']
+        rows = [
+            ('dbt', 'foo', 'bar'),
+            ('dbt', 'FOO', 'baz'),
+            ('dbt', None, 'bar'),
+            ('dbt', 'quux', 'bar'),
+            ('dbt', 'skip', 'bar'),
+        ]
+        mock_execute.return_value = agate.Table(rows=rows,
+                                                column_names=column_names)
+
+        mock_get_schemas.return_value.items.return_value = [(mock.MagicMock(database='dbt'), {'foo', 'FOO', 'quux'})]
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('dbt', 'foo'),
+                                                       ('dbt', 'quux')}
+
+        self.config.args.single_threaded = True
+        self.config.args.catalog_chunk_size = 2
+        catalog_rows, exceptions = self.adapter.get_catalog_rows(mock_manifest)
+        catalog = list(catalog_rows)
+
+        # one catalog query per chunk of schemas
+        self.assertEqual(mock_execute.call_count, 2)
+        chunks = [c[1]['kwargs']['schemas'] for c in mock_execute.call_args_list]
+        self.assertEqual(chunks, [{'FOO', 'foo'}, {'quux'}])
+        # each chunk returned the same rows in this mock
+        self.assertEqual(
+            set(tuple(row.values()) for row in catalog),
+            {('dbt', 'foo', 'bar'), ('dbt', 'FOO', 'baz'), ('dbt', 'quux', 'bar')}
+        )
+        self.assertEqual(len(catalog), 6)
+        self.assertEqual(exceptions, [])
+
+    def test_catalog_chunk_size_must_be_positive(self):
+        self.config.args.catalog_chunk_size = -1
+        with self.assertRaises(RuntimeException):
+            list(self.adapter._get_catalog_chunks(mock.MagicMock()))
+        with self.assertRaises(SystemExit):
+            dbt.main.parse_args(['docs', 'generate', '--catalog-chunk-size', '-1'])
+
+
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
         self.target_dict = {
@@ -459,6 +505,80 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
             mock.call('/* dbt */\nalter table "postgres"."test_schema".table_a rename to table_b', None)
         ])
 
+    def test_execute_iter_uses_server_side_cursor(self):
+        self.cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+        self.cursor.description = (('id',),)
+        self.cursor.statusmessage = 'FETCH 0'
+        stream = self.adapter.execute_iter('select id from t', batch_size=2)
+        self.assertIsNone(stream.response)
+
+        _, kwargs = self.handle.cursor.call_args
+        self.assertTrue(kwargs['name'].startswith('dbt_cursor_'))
+        self.assertEqual(self.cursor.itersize, self.adapter.connections.FETCH_BATCH_SIZE)
+        self.mock_execute.assert_has_calls([
+            mock.call('/* dbt */\nselect id from t', None)
+        ])
+
+        result = stream.fetch()
+        self.assertEqual(result.column_names, ('id',))
+        self.assertEqual(result.rows, [(1,), (2,)])
+        self.cursor.fetchmany.assert_called_with(2)
+        self.cursor.close.assert_called_once_with()
+        self.assertEqual(stream.response.rows_affected, 2)
+
+    def test_execute_iter_handles_fetch_errors(self):
+        self.psycopg2.DatabaseError = DatabaseError
+        self.psycopg2.Error = DatabaseError
+        self.cursor.fetchmany.side_effect = DatabaseError('canceled')
+        stream = self.adapter.execute_iter('select id from t')
+        with self.assertRaises(DatabaseException):
+            stream.fetch()
+        self.cursor.close.assert_called_once_with()
+
+    def test_execute_iter_without_add_query(self):
+        # adapters override add_query without server_side
+        self.cursor.fetchmany.side_effect = [[(1,)], []]
+        self.cursor.description = (('id',),)
+        with mock.patch.object(self.adapter.connections, 'add_query') as add_query:
+            stream = self.adapter.execute_iter('select id from t')
+        add_query.assert_not_called()
+        self.mock_execute.assert_has_calls([
+            mock.call('/* dbt */\nselect id from t', None)
+        ])
+        self.assertEqual(stream.fetch().rows, [(1,)])
+
+    def test_load_seed_bulk(self):
+        relation = self.adapter.Relation.create(
+            database='postgres',
+            schema='test_schema',
+            identifier='seed',
+            type='table',
+            quote_policy=self.adapter.config.quoting,
+        )
+        agate_table = agate_helper.table_from_rows(
+            [(1, 'a', True, None), (2, 'b,"c"', False, decimal.Decimal('1.5'))],
+            ['id', 'name', 'flag', 'amount'],
+        )
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, fp: copied.append(fp.read(7) + fp.read())
+
+        sql = self.adapter.load_seed_bulk(relation, agate_table, '"id", "name", "flag", "amount"')
+
+        expected_sql = 'copy "postgres"."test_schema".seed ("id", "name", "flag", "amount") from stdin with (format csv)'
+        self.assertEqual(sql, expected_sql)
+        self.cursor.copy_expert.assert_called_once_with('/* dbt */\n' + expected_sql, mock.ANY)
+        self.assertEqual(copied, ['1,"a",true,\n2,"b,""c""",false,1.5\n'])
+
+    def test_load_seed_bulk_subclass(self):
+        # e.g. Redshift, which rejects COPY FROM STDIN
+        relation = self.adapter.Relation.create(
+            database='postgres', schema='test_schema', identifier='seed', type='table'
+        )
+        agate_table = agate_helper.table_from_rows([(1,)], ['id'])
+        with mock.patch.object(self.adapter, 'type', return_value='redshift'):
+            self.assertIsNone(self.adapter.load_seed_bulk(relation, agate_table, '"id"'))
+        self.cursor.copy_expert.assert_not_called()
+
     def test_debug_connection_ok(self):
         DebugTask.validate_connection(self.target_dict)
         self.mock_execute.assert_has_calls([
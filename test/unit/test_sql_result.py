@@ -1,5 +1,10 @@
+from contextlib import contextmanager
 import unittest
+from unittest import mock
+
 from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.adapters.sql.results import ColumnarResult, ResultStream
+from dbt.contracts.connection import AdapterResponse
 
 class TestProcessSQLResult(unittest.TestCase):
 	def test_duplicated_columns(self):
@@ -16,3 +21,76 @@ class TestProcessSQLResult(unittest.TestCase):
 			SQLConnectionManager.process_results(cols_with_more_dupes, rows),
 			[{"a": 1, "a_2": 2, "a_3": 3, "b": 4}]
 		)
+		# the caller's column names are left as they were
+		self.assertEqual(cols_with_more_dupes, ['a', 'a', 'a', 'b'])
+
+
+class TestResultStream(unittest.TestCase):
+	def _cursor(self, rows, description=(('a',), ('b',), ('a',))):
+		cursor = mock.MagicMock()
+		cursor.description = description
+		remaining = list(rows)
+
+		def fetchmany(size):
+			batch = remaining[:size]
+			del remaining[:size]
+			return batch
+
+		cursor.fetchmany.side_effect = fetchmany
+		return cursor
+
+	def test_iterates_in_batches(self):
+		rows = [(i, str(i), None) for i in range(5)]
+		cursor = self._cursor(rows)
+		stream = ResultStream(cursor, batch_size=2)
+		self.assertEqual([len(b) for b in stream.batches()], [2, 2, 1])
+		self.assertEqual(stream.column_names, ['a', 'b', 'a_2'])
+		cursor.close.assert_called_once_with()
+		# an exhausted stream yields nothing more
+		self.assertEqual(list(stream), [])
+
+	def test_response_after_exhausted(self):
+		cursor = self._cursor([(1, 'a', None)] * 3)
+		get_response = mock.MagicMock(return_value=AdapterResponse(_message='FETCH 0'))
+		stream = ResultStream(cursor, batch_size=2, get_response=get_response)
+		self.assertIsNone(stream.response)
+		stream.fetch()
+		get_response.assert_called_once_with(cursor)
+		self.assertEqual(stream.response.rows_affected, 3)
+
+	def test_fetch_in_exception_handler(self):
+		cursor = self._cursor([])
+		cursor.fetchmany.side_effect = ValueError('connection lost')
+
+		@contextmanager
+		def exception_handler():
+			try:
+				yield
+			except ValueError as exc:
+				raise RuntimeError(str(exc))
+
+		stream = ResultStream(cursor, exception_handler=exception_handler)
+		with self.assertRaisesRegex(RuntimeError, 'connection lost'):
+			list(stream)
+		cursor.close.assert_called_once_with()
+
+	def test_fetch_columnar(self):
+		rows = [(1, '005', None), (2, 'null', True)]
+		result = ResultStream(self._cursor(rows), batch_size=1).fetch()
+		self.assertIsInstance(result, ColumnarResult)
+		self.assertEqual(len(result), 2)
+		self.assertEqual(result.column_names, ('a', 'b', 'a_2'))
+		# values are not type-tested or coerced
+		self.assertEqual(result.column('b'), ('005', 'null'))
+		self.assertEqual(result.to_dicts()[1], {'a': 2, 'b': 'null', 'a_2': True})
+
+	def test_columnar_to_agate(self):
+		result = ColumnarResult(['a', 'b'], [(1, '005'), (2, '')])
+		table = result.to_agate()
+		self.assertEqual(table.column_names, ('a', 'b'))
+		self.assertEqual([r['b'] for r in table.rows], ['005', ''])
+
+	def test_empty_columnar(self):
+		result = ColumnarResult(['a', 'b'], [])
+		self.assertEqual(result.columns, {'a': (), 'b': ()})
+		self.assertEqual(len(result.to_agate().rows), 0)
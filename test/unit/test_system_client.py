@@ -51,6 +51,27 @@ class SystemClient(unittest.TestCase):
         self.assertTrue(written)
         self.assertEqual(self.get_profile_text(), 'NEW_TEXT')
 
+    def test__write_file_atomic(self):
+        self.set_up_profile()
+        written = dbt.clients.system.write_file_atomic(self.profiles_path, iter(['NEW', '_TEXT']))
+
+        self.assertTrue(written)
+        self.assertEqual(self.get_profile_text(), 'NEW_TEXT')
+        self.assertEqual(os.listdir(self.tmp_dir), ['profiles.yml'])
+
+    def test__write_file_atomic_failure(self):
+        self.set_up_profile()
+
+        def chunks():
+            yield 'NEW'
+            raise ValueError('failed')
+
+        with self.assertRaises(ValueError):
+            dbt.clients.system.write_file_atomic(self.profiles_path, chunks())
+        # the original file is untouched, and the temp file is cleaned up
+        self.assertEqual(self.get_profile_text(), 'ORIGINAL_TEXT')
+        self.assertEqual(os.listdir(self.tmp_dir), ['profiles.yml'])
+
 
 class TestRunCmd(unittest.TestCase):
     """Test `run_cmd`.
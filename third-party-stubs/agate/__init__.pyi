@@ -3,6 +3,7 @@ from collections import Sequence
 from typing import Any, Optional, Callable, Iterable, Dict, Union
 
 from . import data_types as data_types
+from . import utils as utils
 from .data_types import (
     Text as Text,
     Number as Number,